@@ -7,7 +7,25 @@
  * structural issues before they hit production.
  */
 
-import { getSiteConfig, getModels, getCategories, getArticles, getArticleBySlug } from '../data';
+import { createHash } from 'crypto';
+import {
+  getSiteConfig,
+  getModels,
+  getCategories,
+  getArticles,
+  getArticleBySlug,
+  getArticleBody,
+  getRecommendIndex,
+  getSearchIndex,
+  getArchiveIndex,
+  getArchiveShard,
+  findArticle,
+  listArticles,
+} from '../data';
+import { scoreAndRank, lookupRanked } from '../data/recommend';
+import { searchArticles } from '../data/search';
+import type { Model, Category } from '../data/types';
+import recommendFixture from './fixtures/recommend_cases.json';
 
 describe('Site Config', () => {
   const config = getSiteConfig();
@@ -88,10 +106,25 @@ describe('Articles', () => {
       expect(a.date).toMatch(/^\d{4}-\d{2}-\d{2}$/);
       expect(a.category).toBeTruthy();
       expect(a.readTime).toBeTruthy();
-      expect(a.content.length).toBeGreaterThan(0);
+      expect(a.body).toMatch(/^[0-9a-f]{16}$/);
+      expect(a).not.toHaveProperty('content');
     }
   });
 
+  test('bodies exist and match their content hash (scripts/article_bodies.py)', async () => {
+    for (const a of articles) {
+      const content = await getArticleBody(a.body);
+      expect(content?.length).toBeGreaterThan(0);
+      const digest = createHash('sha256').update(JSON.stringify(content)).digest('hex');
+      expect(digest.slice(0, 16)).toBe(a.body);
+    }
+  });
+
+  test('getArticleBody rejects anything but a body hash', async () => {
+    expect(await getArticleBody('../site')).toBeUndefined();
+    expect(await getArticleBody('0000000000000000')).toBeUndefined();
+  });
+
   test('slugs are unique', () => {
     const slugs = articles.map((a) => a.slug);
     expect(new Set(slugs).size).toBe(slugs.length);
@@ -115,14 +148,95 @@ describe('Articles', () => {
   });
 });
 
+describe('Article archive', () => {
+  const index = getArchiveIndex();
+  const months = Object.keys(index.shards);
+
+  test('shard counts match the slug index', () => {
+    const counts: Record<string, number> = {};
+    for (const month of Object.values(index.slugs)) counts[month] = (counts[month] ?? 0) + 1;
+    expect(counts).toEqual(index.shards);
+    expect(months).toEqual([...months].sort().reverse());
+  });
+
+  test('every indexed slug is in its shard, newest first', async () => {
+    for (const month of months) {
+      const shard = await getArchiveShard(month);
+      expect(shard.length).toBe(index.shards[month]);
+      for (let i = 0; i < shard.length; i++) {
+        expect(shard[i].date.slice(0, 7)).toBe(month);
+        expect(index.slugs[shard[i].slug]).toBe(month);
+        if (i > 0) expect(shard[i - 1].date >= shard[i].date).toBe(true);
+      }
+    }
+  });
+
+  test('no slug is both live and archived', () => {
+    for (const a of getArticles()) {
+      expect(index.slugs[a.slug]).toBeUndefined();
+    }
+  });
+
+  test('findArticle resolves live and archived slugs', async () => {
+    const live = getArticles()[0];
+    expect((await findArticle(live.slug))?.title).toBe(live.title);
+    for (const slug of Object.keys(index.slugs).slice(0, 5)) {
+      expect((await findArticle(slug))?.slug).toBe(slug);
+    }
+    expect(await findArticle('nonexistent-slug')).toBeUndefined();
+  });
+
+  test('listArticles pages through live then archived articles', async () => {
+    const perPage = 7;
+    const first = await listArticles(1, perPage);
+    const seen: string[] = [];
+    for (let page = 1; page <= first.totalPages; page++) {
+      seen.push(...(await listArticles(page, perPage)).articles.map((a) => a.slug));
+    }
+    expect(seen.length).toBe(first.total);
+    expect(new Set(seen).size).toBe(seen.length);
+    expect(seen.slice(0, getArticles().length)).toEqual(getArticles().map((a) => a.slug));
+  });
+});
+
+describe('Search index', () => {
+  const index = getSearchIndex();
+  const docs = index.docs.filter((d) => d !== null);
+
+  test('indexes every live and archived article exactly once', () => {
+    const slugs = docs.map((d) => d[0]).sort();
+    const expected = [...getArticles().map((a) => a.slug), ...Object.keys(getArchiveIndex().slugs)].sort();
+    expect(slugs).toEqual(expected);
+  });
+
+  test('postings point at live docs with positive frequencies', () => {
+    for (const postings of Object.values(index.terms)) {
+      expect(postings.length % 2).toBe(0);
+      for (let i = 0; i < postings.length; i += 2) {
+        expect(index.docs[postings[i]]).toBeTruthy();
+        expect(postings[i + 1]).toBeGreaterThan(0);
+      }
+    }
+  });
+
+  test('every live article is found by its title', () => {
+    for (const a of getArticles()) {
+      const hits = searchArticles(index, a.title, { limit: 50 });
+      expect(hits.map((h) => h.slug)).toContain(a.slug);
+    }
+  });
+});
+
 describe('Article ↔ Model drift', () => {
   const models = getModels();
   const articles = getArticles();
+  let articleCorpus = '';
 
-  // Concatenate every article's title, excerpt, and content into one searchable blob per model lookup.
-  const articleCorpus = articles
-    .map((a) => [a.title, a.excerpt, ...a.content].join('\n'))
-    .join('\n');
+  // Concatenate every article's title, excerpt, and body into one searchable blob per model lookup.
+  beforeAll(async () => {
+    const bodies = await Promise.all(articles.map((a) => getArticleBody(a.body)));
+    articleCorpus = articles.map((a, i) => [a.title, a.excerpt, ...(bodies[i] ?? [])].join('\n')).join('\n');
+  });
 
   test('every current model name appears in at least one article', () => {
     const missing = models.filter((m) => !articleCorpus.includes(m.name));
@@ -135,3 +249,55 @@ describe('Article ↔ Model drift', () => {
     expect(missing).toEqual([]);
   });
 });
+
+describe('Recommend index', () => {
+  const models = getModels();
+  const categories = getCategories();
+  const index = getRecommendIndex();
+
+  test('is current — rebuild with `python scripts/recommend_index.py`', () => {
+    expect(lookupRanked(index, models, categories, {})).not.toBeNull();
+  });
+
+  test('every indexed bucket matches scoreAndRank', () => {
+    const tasks = [null, ...categories.map((c) => c.name)];
+    for (const key of Object.keys(index.buckets)) {
+      const [provider, maxCost, minContext] = key.split('|');
+      for (const task of tasks) {
+        const opts = {
+          task,
+          provider: provider || null,
+          maxCost: maxCost ? parseFloat(maxCost) : null,
+          minContext: minContext ? parseInt(minContext) : null,
+        };
+        const live = scoreAndRank(models, categories, opts);
+        expect(lookupRanked(index, models, categories, opts)).toEqual({
+          ...live,
+          recommendations: live.recommendations.slice(0, 10),
+        });
+      }
+    }
+  });
+});
+
+describe('Recommend fixture (shared with scripts/test_recommend.py)', () => {
+  // Rewrite with `python scripts/recommend_batch.py fixture`; both sides must pass
+  for (const suite of recommendFixture.suites) {
+    test(`scoreAndRank reproduces the ${suite.name} suite`, () => {
+      for (const c of suite.cases) {
+        const result = scoreAndRank(suite.models as unknown as Model[], suite.categories as Category[], c.opts);
+        expect({
+          matchedCategory: result.matchedCategory?.name ?? null,
+          excluded: result.excluded,
+          ranking: result.recommendations.map((r) => [r.model.id, r.score, r.reasons]),
+        }).toEqual({ matchedCategory: c.matchedCategory, excluded: c.excluded, ranking: c.ranking });
+      }
+    });
+  }
+
+  test('rounding probes match Math.round', () => {
+    for (const [x, expected] of recommendFixture.rounding) {
+      expect(Math.round(x * 100) / 100).toBe(expected);
+    }
+  });
+});
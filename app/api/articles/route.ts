@@ -0,0 +1,58 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { listArticles, getSiteConfig } from '@/data';
+import { getCorsHeaders } from '@/lib/cors';
+
+const MAX_PER_PAGE = 50;
+
+export async function GET(req: NextRequest) {
+  const origin = req.headers.get('origin');
+  const HEADERS = {
+    'Content-Type': 'application/json',
+    'Cache-Control': 'public, s-maxage=300, stale-while-revalidate=600',
+    ...getCorsHeaders(origin),
+  };
+  const { searchParams } = req.nextUrl;
+  const pageParam = searchParams.get('page');
+  const perPageParam = searchParams.get('per_page');
+
+  const page = pageParam ? parseInt(pageParam) : 1;
+  const perPage = perPageParam ? parseInt(perPageParam) : 20;
+
+  if (isNaN(page) || page < 1) {
+    return NextResponse.json(
+      { error: 'Invalid parameter', details: 'page must be a positive integer' },
+      { status: 400, headers: HEADERS }
+    );
+  }
+  if (isNaN(perPage) || perPage < 1 || perPage > MAX_PER_PAGE) {
+    return NextResponse.json(
+      { error: 'Invalid parameter', details: `per_page must be an integer from 1 to ${MAX_PER_PAGE}` },
+      { status: 400, headers: HEADERS }
+    );
+  }
+
+  const { articles, total, totalPages } = await listArticles(page, perPage);
+  const config = getSiteConfig();
+
+  return NextResponse.json(
+    {
+      // Metadata only; paragraphs are at body_url (immutable, cache forever)
+      articles: articles.map((a) => ({
+        slug: a.slug,
+        title: a.title,
+        excerpt: a.excerpt,
+        date: a.date,
+        category: a.category,
+        readTime: a.readTime,
+        url: `https://helloai.com/articles/${a.slug}`,
+        body_url: `https://helloai.com/api/content/${a.body}`,
+      })),
+      page,
+      per_page: perPage,
+      total,
+      total_pages: totalPages,
+      last_updated: config.lastUpdated,
+    },
+    { headers: HEADERS }
+  );
+}
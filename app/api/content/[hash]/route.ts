@@ -0,0 +1,30 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getArticleBody, isBodyHash } from '@/data';
+import { getCorsHeaders } from '@/lib/cors';
+
+// Bodies are content-addressed: a hash never points at different paragraphs
+const IMMUTABLE = 'public, max-age=31536000, immutable';
+
+export async function GET(req: NextRequest, { params }: { params: Promise<{ hash: string }> }) {
+  const origin = req.headers.get('origin');
+  const { hash } = await params;
+
+  if (!isBodyHash(hash)) {
+    return NextResponse.json(
+      { error: 'Invalid parameter', details: 'hash must be 16 lowercase hex characters' },
+      { status: 400, headers: getCorsHeaders(origin) }
+    );
+  }
+  const content = await getArticleBody(hash);
+  if (!content) {
+    return NextResponse.json(
+      { error: 'Body not found', details: 'Use the body hash from /api/articles.' },
+      { status: 404, headers: getCorsHeaders(origin) }
+    );
+  }
+
+  return NextResponse.json(
+    { hash, content },
+    { headers: { 'Cache-Control': IMMUTABLE, ...getCorsHeaders(origin) } }
+  );
+}
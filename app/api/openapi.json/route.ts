@@ -132,6 +132,175 @@ export async function GET(req: NextRequest) {
           },
         },
       },
+      '/api/articles': {
+        get: {
+          operationId: 'listArticles',
+          summary: 'List articles, newest first',
+          description:
+            'Pages through every published article, archived ones included. Returns summaries; full text is at the article URL.',
+          parameters: [
+            {
+              name: 'page',
+              in: 'query',
+              required: false,
+              description: 'Page number, starting at 1',
+              schema: { type: 'integer', minimum: 1, default: 1 },
+            },
+            {
+              name: 'per_page',
+              in: 'query',
+              required: false,
+              description: 'Articles per page (max 50)',
+              schema: { type: 'integer', minimum: 1, maximum: 50, default: 20 },
+            },
+          ],
+          responses: {
+            '200': {
+              description: 'One page of articles',
+              content: {
+                'application/json': {
+                  schema: {
+                    type: 'object',
+                    properties: {
+                      articles: { type: 'array', items: { $ref: '#/components/schemas/ArticleSummary' } },
+                      page: { type: 'integer', example: 1 },
+                      per_page: { type: 'integer', example: 20 },
+                      total: { type: 'integer' },
+                      total_pages: { type: 'integer' },
+                      last_updated: { type: 'string', format: 'date', example: config.lastUpdated },
+                    },
+                  },
+                },
+              },
+            },
+            '400': {
+              description: 'Invalid page or per_page',
+              content: {
+                'application/json': {
+                  schema: { $ref: '#/components/schemas/Error' },
+                },
+              },
+            },
+          },
+        },
+      },
+      '/api/search': {
+        get: {
+          operationId: 'searchArticles',
+          summary: 'Search articles',
+          description:
+            'Full-text search over every published article, archived ones included. All query words must match; the last one also matches as a prefix.',
+          parameters: [
+            {
+              name: 'q',
+              in: 'query',
+              required: true,
+              description: 'Search query (max 200 characters)',
+              schema: { type: 'string', maxLength: 200 },
+              example: 'open weight',
+            },
+            {
+              name: 'limit',
+              in: 'query',
+              required: false,
+              description: 'Max results (max 50)',
+              schema: { type: 'integer', minimum: 1, maximum: 50, default: 10 },
+            },
+            {
+              name: 'prefix',
+              in: 'query',
+              required: false,
+              description: 'Set to false to match the last word exactly',
+              schema: { type: 'boolean', default: true },
+            },
+          ],
+          responses: {
+            '200': {
+              description: 'Matching articles, best first',
+              content: {
+                'application/json': {
+                  schema: {
+                    type: 'object',
+                    properties: {
+                      query: { type: 'string' },
+                      results: {
+                        type: 'array',
+                        items: {
+                          type: 'object',
+                          properties: {
+                            slug: { type: 'string' },
+                            title: { type: 'string' },
+                            date: { type: 'string', format: 'date' },
+                            score: { type: 'number', description: 'BM25 relevance' },
+                            url: { type: 'string', format: 'uri' },
+                          },
+                        },
+                      },
+                    },
+                  },
+                },
+              },
+            },
+            '400': {
+              description: 'Missing or invalid q or limit',
+              content: {
+                'application/json': {
+                  schema: { $ref: '#/components/schemas/Error' },
+                },
+              },
+            },
+          },
+        },
+      },
+      '/api/content/{hash}': {
+        get: {
+          operationId: 'getArticleBody',
+          summary: 'Article paragraphs by content hash',
+          description:
+            'Bodies are content-addressed and never change, so responses are cacheable forever. Hashes come from body_url in /api/articles.',
+          parameters: [
+            {
+              name: 'hash',
+              in: 'path',
+              required: true,
+              description: '16 lowercase hex characters',
+              schema: { type: 'string', pattern: '^[0-9a-f]{16}$' },
+            },
+          ],
+          responses: {
+            '200': {
+              description: 'The article body',
+              content: {
+                'application/json': {
+                  schema: {
+                    type: 'object',
+                    properties: {
+                      hash: { type: 'string' },
+                      content: { type: 'array', items: { type: 'string' } },
+                    },
+                  },
+                },
+              },
+            },
+            '400': {
+              description: 'Malformed hash',
+              content: {
+                'application/json': {
+                  schema: { $ref: '#/components/schemas/Error' },
+                },
+              },
+            },
+            '404': {
+              description: 'No body with this hash',
+              content: {
+                'application/json': {
+                  schema: { $ref: '#/components/schemas/Error' },
+                },
+              },
+            },
+          },
+        },
+      },
       '/api/status': {
         get: {
           operationId: 'getStatus',
@@ -206,6 +375,19 @@ export async function GET(req: NextRequest) {
             last_updated: { type: 'string', format: 'date' },
           },
         },
+        ArticleSummary: {
+          type: 'object',
+          properties: {
+            slug: { type: 'string' },
+            title: { type: 'string' },
+            excerpt: { type: 'string' },
+            date: { type: 'string', format: 'date' },
+            category: { type: 'string', example: 'Analysis' },
+            readTime: { type: 'string', example: '6 min' },
+            url: { type: 'string', format: 'uri' },
+            body_url: { type: 'string', format: 'uri', description: 'Article paragraphs, see /api/content/{hash}' },
+          },
+        },
         StatusResponse: {
           type: 'object',
           properties: {
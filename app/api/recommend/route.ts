@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { getModels, getCategories, getSiteConfig } from '@/data';
-import { scoreAndRank } from '@/data/recommend';
+import { getModels, getCategories, getSiteConfig, getRecommendIndex } from '@/data';
+import { scoreAndRank, lookupRanked } from '@/data/recommend';
 import { getCorsHeaders } from '@/lib/cors';
 
 export async function GET(req: NextRequest) {
@@ -51,12 +51,9 @@ export async function GET(req: NextRequest) {
   const categories = getCategories();
   const config = getSiteConfig();
 
-  const { recommendations, excluded, matchedCategory } = scoreAndRank(models, categories, {
-    task,
-    maxCost,
-    minContext,
-    provider: providerParam,
-  });
+  const opts = { task, maxCost, minContext, provider: providerParam };
+  const { recommendations, excluded, matchedCategory } =
+    lookupRanked(getRecommendIndex(), models, categories, opts) ?? scoreAndRank(models, categories, opts);
 
   if (recommendations.length === 0) {
     return NextResponse.json(
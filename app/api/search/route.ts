@@ -0,0 +1,50 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getSearchIndex } from '@/data';
+import { searchArticles } from '@/data/search';
+import { getCorsHeaders } from '@/lib/cors';
+
+const MAX_LIMIT = 50;
+const MAX_QUERY_LENGTH = 200;
+
+export async function GET(req: NextRequest) {
+  const origin = req.headers.get('origin');
+  const HEADERS = {
+    'Content-Type': 'application/json',
+    'Cache-Control': 'public, s-maxage=300, stale-while-revalidate=600',
+    ...getCorsHeaders(origin),
+  };
+  const { searchParams } = req.nextUrl;
+  const q = searchParams.get('q')?.trim() ?? '';
+  const limitParam = searchParams.get('limit');
+  const prefix = searchParams.get('prefix') !== 'false';
+
+  if (!q || q.length > MAX_QUERY_LENGTH) {
+    return NextResponse.json(
+      { error: 'Invalid parameter', details: `q is required (1-${MAX_QUERY_LENGTH} characters)` },
+      { status: 400, headers: HEADERS }
+    );
+  }
+  const limit = limitParam ? parseInt(limitParam) : 10;
+  if (isNaN(limit) || limit < 1 || limit > MAX_LIMIT) {
+    return NextResponse.json(
+      { error: 'Invalid parameter', details: `limit must be an integer from 1 to ${MAX_LIMIT}` },
+      { status: 400, headers: HEADERS }
+    );
+  }
+
+  const hits = searchArticles(getSearchIndex(), q, { limit, prefix });
+
+  return NextResponse.json(
+    {
+      query: q,
+      results: hits.map((h) => ({
+        slug: h.slug,
+        title: h.title,
+        date: h.date,
+        score: Math.round(h.score * 1000) / 1000,
+        url: `https://helloai.com/articles/${h.slug}`,
+      })),
+    },
+    { headers: HEADERS }
+  );
+}
@@ -34,6 +34,9 @@ export async function GET(req: NextRequest) {
       endpoints: [
         { path: '/api/models', method: 'GET', params: ['provider'] },
         { path: '/api/recommend', method: 'GET', params: ['task', 'max_cost', 'min_context', 'provider', 'limit'] },
+        { path: '/api/articles', method: 'GET', params: ['page', 'per_page'] },
+        { path: '/api/search', method: 'GET', params: ['q', 'limit', 'prefix'] },
+        { path: '/api/content/{hash}', method: 'GET', params: [] },
         { path: '/api/status', method: 'GET', params: [] },
       ],
     },
@@ -1,5 +1,5 @@
 import { ImageResponse } from 'next/og';
-import { getArticleBySlug } from '@/data';
+import { findArticle } from '@/data';
 
 export const runtime = 'edge';
 export const size = { width: 1200, height: 630 };
@@ -14,7 +14,7 @@ const CATEGORY_COLORS: Record<string, string> = {
 
 export default async function Image({ params }: { params: Promise<{ slug: string }> }) {
   const { slug } = await params;
-  const article = getArticleBySlug(slug);
+  const article = await findArticle(slug);
 
   const title = article?.title ?? 'Hello, AI';
   const excerpt = article?.excerpt ?? 'Your unbiased guide to the world\'s smartest AIs';
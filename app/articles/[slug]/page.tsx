@@ -1,13 +1,14 @@
 import Link from 'next/link';
 import { notFound } from 'next/navigation';
-import { getArticleBySlug, getArticles, formatDate } from '@/data';
+import { findArticle, getArticleBody, getArticles, getArchiveIndex, formatDate } from '@/data';
 import type { Metadata } from 'next';
 
-// Generate static paths for all articles
+// Generate static paths for all articles, archived ones included
 export function generateStaticParams() {
-  return getArticles().map((article) => ({
-    slug: article.slug,
-  }));
+  return [
+    ...getArticles().map((article) => article.slug),
+    ...Object.keys(getArchiveIndex().slugs),
+  ].map((slug) => ({ slug }));
 }
 
 // Dynamic SEO metadata per article
@@ -17,7 +18,7 @@ export async function generateMetadata({
   params: Promise<{ slug: string }>;
 }): Promise<Metadata> {
   const { slug } = await params;
-  const article = getArticleBySlug(slug);
+  const article = await findArticle(slug);
   if (!article) return {};
 
   const url = `https://helloai.com/articles/${slug}`;
@@ -50,9 +51,10 @@ export default async function ArticlePage({
   params: Promise<{ slug: string }>;
 }) {
   const { slug } = await params;
-  const article = getArticleBySlug(slug);
+  const article = await findArticle(slug);
+  const content = article && (await getArticleBody(article.body));
 
-  if (!article) {
+  if (!article || !content) {
     notFound();
   }
 
@@ -96,7 +98,7 @@ export default async function ArticlePage({
       <p className="article-page-excerpt">{article.excerpt}</p>
 
       <div className="article-page-body">
-        {article.content.map((paragraph, i) => (
+        {content.map((paragraph, i) => (
           <p key={i}>{paragraph}</p>
         ))}
       </div>
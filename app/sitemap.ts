@@ -1,8 +1,11 @@
-import { getArticles } from '@/data';
+import { getArticles, getArchiveIndex, getArchiveShard } from '@/data';
 import type { MetadataRoute } from 'next';
 
-export default function sitemap(): MetadataRoute.Sitemap {
-  const articles = getArticles();
+export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
+  const articles = [...getArticles()];
+  for (const month of Object.keys(getArchiveIndex().shards)) {
+    articles.push(...(await getArchiveShard(month)));
+  }
   const baseUrl = 'https://helloai.com';
 
   const articleEntries: MetadataRoute.Sitemap = articles.map((article) => ({
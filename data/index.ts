@@ -1,4 +1,4 @@
-import type { SiteConfig, Model, Category, Article, LocalModel, OpenWeightModel } from './types';
+import type { SiteConfig, Model, Category, Article, LocalModel, OpenWeightModel, ArchiveIndex } from './types';
 
 import siteData from './site.json';
 import modelsData from './models.json';
@@ -6,6 +6,11 @@ import categoriesData from './categories.json';
 import articlesData from './articles.json';
 import localLeaderboardData from './local_leaderboard.json';
 import openWeightModelsData from './open_weight_models.json';
+import recommendIndexData from './recommend_index.json';
+import searchIndexData from './search_index.json';
+import archiveIndexData from './archive/index.json';
+import type { RecommendIndex } from './recommend';
+import type { SearchIndex } from './search';
 
 export const getSiteConfig = (): SiteConfig => siteData;
 export const getModels = (): Model[] => modelsData;
@@ -13,10 +18,69 @@ export const getCategories = (): Category[] => categoriesData;
 export const getArticles = (): Article[] => articlesData;
 export const getLocalModels = (): LocalModel[] => localLeaderboardData;
 export const getOpenWeightModels = (): OpenWeightModel[] => openWeightModelsData;
+export const getRecommendIndex = (): RecommendIndex => recommendIndexData as unknown as RecommendIndex;
+export const getSearchIndex = (): SearchIndex => searchIndexData as unknown as SearchIndex;
 
 export const getArticleBySlug = (slug: string): Article | undefined =>
   articlesData.find((a: Article) => a.slug === slug);
 
+// ─── Article bodies ─────────────────────────────────────────────────────────
+// articles.json and the archive hold metadata only. Paragraphs live in
+// data/content/{hash}.json, written once and never changed, one chunk each.
+
+export const isBodyHash = (hash: string): boolean => /^[0-9a-f]{16}$/.test(hash);
+
+export const getArticleBody = async (hash: string): Promise<string[] | undefined> => {
+  if (!isBodyHash(hash)) return undefined;
+  try {
+    return (await import(`./content/${hash}.json`)).default as string[];
+  } catch {
+    return undefined;
+  }
+};
+
+// ─── Article archive ────────────────────────────────────────────────────────
+// Articles trimmed from articles.json live in month shards under data/archive/
+// (scripts/article_archive.py). Shards are separate chunks, loaded on demand.
+
+export const getArchiveIndex = (): ArchiveIndex => archiveIndexData as ArchiveIndex;
+
+export const getArchiveShard = async (month: string): Promise<Article[]> =>
+  (await import(`./archive/${month}.json`)).default as Article[];
+
+/** An article from articles.json, else from its archive shard. */
+export const findArticle = async (slug: string): Promise<Article | undefined> => {
+  const hot = getArticleBySlug(slug);
+  if (hot) return hot;
+  const month = getArchiveIndex().slugs[slug];
+  if (typeof month !== 'string') return undefined; // also rejects inherited keys
+  return (await getArchiveShard(month)).find((a) => a.slug === slug);
+};
+
+/** Every article, newest first: articles.json then the archive, one page at a time. */
+export const listArticles = async (
+  page = 1,
+  perPage = 20
+): Promise<{ articles: Article[]; total: number; totalPages: number }> => {
+  const hot = getArticles();
+  const { shards, slugs } = getArchiveIndex();
+  const total = hot.length + Object.keys(slugs).length;
+  let offset = (page - 1) * perPage;
+  const articles = hot.slice(offset, offset + perPage);
+  offset = Math.max(0, offset - hot.length);
+  for (const [month, count] of Object.entries(shards)) {
+    if (articles.length >= perPage) break;
+    if (offset >= count) {
+      offset -= count;
+      continue;
+    }
+    const shard = await getArchiveShard(month);
+    articles.push(...shard.slice(offset, offset + perPage - articles.length));
+    offset = 0;
+  }
+  return { articles, total, totalPages: Math.max(1, Math.ceil(total / perPage)) };
+};
+
 export const formatDate = (dateStr: string): string => {
   const date = new Date(dateStr + 'T00:00:00');
   return date.toLocaleDateString('en-US', {
@@ -89,3 +89,79 @@ export function scoreAndRank(
   recommendations.sort((a, b) => b.score - a.score);
   return { recommendations, excluded, matchedCategory };
 }
+
+// ─── Precomputed index (scripts/recommend_index.py) ─────────────────────────
+
+type IndexedRecommendation = [id: string, score: number, reasons: string[]];
+
+export interface RecommendIndex {
+  version: number;
+  generated: string;
+  signature: {
+    models: [string, string, string, number, number, number, string[]][];
+    leaders: [string, string][];
+  };
+  buckets: Record<string, number>;
+  sets: { excluded: number; ranked: Record<string, IndexedRecommendation[]> }[];
+}
+
+let lastChecked: { index: RecommendIndex; models: Model[]; categories: Category[]; ok: boolean } | null = null;
+
+function indexMatches(index: RecommendIndex, models: Model[], categories: Category[]): boolean {
+  if (lastChecked && lastChecked.index === index && lastChecked.models === models && lastChecked.categories === categories) {
+    return lastChecked.ok;
+  }
+  const sig = index.signature;
+  const ok =
+    index.version === 1 &&
+    sig.models.length === models.length &&
+    sig.leaders.length === categories.length &&
+    models.every((m, i) => {
+      const [id, name, provider, elo, cost, ctx, strengths] = sig.models[i];
+      return (
+        id === m.id && name === m.name && provider === m.provider && elo === m.elo &&
+        cost === m.cost_per_million_tokens && ctx === m.context_window &&
+        strengths.length === m.strengths.length && strengths.every((s, j) => s === m.strengths[j])
+      );
+    }) &&
+    categories.every((c, i) => sig.leaders[i][0] === c.name && sig.leaders[i][1] === c.leader);
+  lastChecked = { index, models, categories, ok };
+  return ok;
+}
+
+/**
+ * Answer from the precomputed index when the query falls in a common bucket
+ * and the index was built from these exact models/categories. Returns null
+ * otherwise — call scoreAndRank() then. At most 10 recommendations.
+ */
+export function lookupRanked(
+  index: RecommendIndex,
+  models: Model[],
+  categories: Category[],
+  opts: {
+    task?: string | null;
+    maxCost?: number | null;
+    minContext?: number | null;
+    provider?: string | null;
+  }
+): ReturnType<typeof scoreAndRank> | null {
+  if (!indexMatches(index, models, categories)) return null;
+  const { task, maxCost, minContext, provider } = opts;
+
+  const key = `${provider ? provider.toLowerCase() : ''}|${maxCost ?? ''}|${minContext ?? ''}`;
+  const setId = index.buckets[key];
+  if (setId === undefined) return null;
+
+  const matchedCategory = task ? findMatchingCategory(task, categories) : null;
+  const set = index.sets[setId];
+  const ranked = set.ranked[matchedCategory?.name ?? ''];
+  if (!ranked) return null;
+
+  const byId = new Map(models.map((m) => [m.id, m]));
+  const recommendations: Recommendation[] = ranked.map(([id, score, reasons]) => ({
+    model: byId.get(id)!,
+    score,
+    reasons,
+  }));
+  return { recommendations, excluded: set.excluded, matchedCategory };
+}
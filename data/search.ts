@@ -0,0 +1,112 @@
+// Article search over data/search_index.json, built by scripts/search_index.py.
+// Tokenizer and scoring mirror the Python side; change both together.
+
+export interface SearchIndex {
+  version: number;
+  docs: ([slug: string, title: string, date: string, length: number] | null)[];
+  terms: Record<string, number[]>; // token → [doc, tf, doc, tf, ...], sorted keys
+}
+
+export interface SearchHit {
+  slug: string;
+  title: string;
+  date: string;
+  score: number;
+}
+
+const MAX_EXPANSIONS = 50;
+const BM25_K1 = 1.2;
+const BM25_B = 0.75;
+
+const STOPWORDS = new Set(
+  'an and are as at be by for from has in is it its of on or that the this to was were with'.split(' ')
+);
+
+export function tokenize(text: string): string[] {
+  const words = text.toLowerCase().normalize('NFKD').replace(/\p{M}/gu, '').match(/[a-z0-9]+/g) ?? [];
+  return words.filter((t) => (t.length > 1 || /^\d$/.test(t)) && !STOPWORDS.has(t));
+}
+
+const sortedTerms = new WeakMap<SearchIndex, string[]>();
+
+/** Indexed terms starting with prefix, in sorted order. */
+export function termsWithPrefix(index: SearchIndex, prefix: string): string[] {
+  let terms = sortedTerms.get(index);
+  if (!terms) {
+    terms = Object.keys(index.terms).sort();
+    sortedTerms.set(index, terms);
+  }
+  let lo = 0;
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (terms[mid] < prefix) lo = mid + 1;
+    else hi = mid;
+  }
+  const out: string[] = [];
+  for (let i = lo; i < terms.length && terms[i].startsWith(prefix); i++) out.push(terms[i]);
+  return out;
+}
+
+/** Docs matching every query token (the last one also as a prefix), best BM25 score first. */
+export function searchArticles(
+  index: SearchIndex,
+  query: string,
+  opts: { limit?: number; prefix?: boolean } = {}
+): SearchHit[] {
+  const { limit = 10, prefix = true } = opts;
+  const tokens = [...new Set(tokenize(query))];
+  const { docs, terms } = index;
+  const live = docs.filter((d) => d !== null);
+  if (!tokens.length || !live.length) return [];
+  const n = live.length;
+  let total = 0;
+  for (const d of live) total += d[3];
+  const avgLen = total / n;
+
+  let scores: Map<number, number> | null = null;
+  for (let i = 0; i < tokens.length; i++) {
+    const token = tokens[i];
+    const expansions =
+      prefix && i === tokens.length - 1
+        ? termsWithPrefix(index, token).slice(0, MAX_EXPANSIONS)
+        : Object.prototype.hasOwnProperty.call(terms, token)
+          ? [token]
+          : [];
+    const tokenScores = new Map<number, number>();
+    for (const term of expansions) {
+      const p = terms[term];
+      const df = p.length / 2;
+      const idf = Math.log(1 + (n - df + 0.5) / (df + 0.5));
+      for (let j = 0; j < p.length; j += 2) {
+        const doc = p[j];
+        const tf = p[j + 1];
+        const norm = 1 - BM25_B + (BM25_B * docs[doc]![3]) / avgLen;
+        const score = (idf * tf * (BM25_K1 + 1)) / (tf + BM25_K1 * norm);
+        tokenScores.set(doc, (tokenScores.get(doc) ?? 0) + score);
+      }
+    }
+    if (scores === null) {
+      scores = tokenScores;
+    } else {
+      const next = new Map<number, number>();
+      for (const [doc, s] of scores) {
+        const t = tokenScores.get(doc);
+        if (t !== undefined) next.set(doc, s + t);
+      }
+      scores = next;
+    }
+    if (!scores.size) return [];
+  }
+
+  return [...scores!]
+    .map(([doc, score]) => {
+      const [slug, title, date] = docs[doc]!;
+      return { slug, title, date, score };
+    })
+    .sort(
+      (a, b) =>
+        b.score - a.score || b.date.localeCompare(a.date) || (a.slug < b.slug ? -1 : a.slug > b.slug ? 1 : 0)
+    )
+    .slice(0, limit);
+}
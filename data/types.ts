@@ -38,7 +38,7 @@ export interface Article {
   date: string;
   category: string;
   readTime: string;
-  content: string[];
+  body: string; // hash of the paragraphs in data/content/{body}.json (scripts/article_bodies.py)
 }
 
 export interface LocalModel {
@@ -48,6 +48,7 @@ export interface LocalModel {
   passed: number;
   total: number;
   response_time: number;
+  latency?: { p50: number; p90: number; p99: number };
 }
 
 export interface OpenWeightModel {
@@ -68,3 +69,10 @@ export interface OpenWeightModel {
   reference_hardware: string; // hardware used for tokens_per_sec benchmark
   license: string;          // e.g. "Apache 2.0", "Meta Llama 3 License"
 }
+
+// data/archive/index.json (scripts/article_archive.py)
+export interface ArchiveIndex {
+  version: number;
+  shards: Record<string, number>;   // "YYYY-MM" → article count, newest first
+  slugs: Record<string, string>;    // slug → shard
+}
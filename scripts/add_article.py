@@ -4,13 +4,27 @@ add_article.py — Validate and insert a finished article into HelloAi.
 
 Article PROSE is generated by the Claude Code article-writer agent (see
 .claude/agents/article-writer.md). This script only validates the finished
-JSON and inserts it deterministically into data/articles.json.
+JSON and inserts it deterministically into data/articles.json (metadata)
+and data/content/ (the body, by hash; see article_bodies.py).
 
 Usage:
   python scripts/add_article.py --file article.json
   echo '{...}' | python scripts/add_article.py
   python scripts/add_article.py --file article.json --dry-run
 
+Bulk (one validation pass, one slug set, one write for the whole batch):
+  python scripts/add_article.py --dir drafts/              # Every *.json in a directory
+  python scripts/add_article.py --jsonl backfill.jsonl     # One article per line
+  cat backfill.jsonl | python scripts/add_article.py --jsonl - --strict
+
+Bulk runs add the valid entries and report the rest; they exit 0 even when
+some entries are rejected. With --strict any rejected entry means nothing is
+written and exit status 1.
+
+Near-duplicates (near_duplicates.py) of a published or archived article, or
+of an earlier entry in the batch, are rejected at or above
+config.near_duplicate_threshold; --allow-duplicates adds them with a warning.
+
 Input JSON schema (all fields except title/excerpt/category/content are optional):
   {
     "title":    "Article title (required)",
@@ -27,22 +41,28 @@ import argparse
 import json
 import math
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
 from pathlib import Path
+from typing import NamedTuple
 
 sys.path.insert(0, str(Path(__file__).parent))
 from config import config
 from utils import (
     setup_logger,
-    read_json,
-    write_json,
     today_iso,
     slugify,
 )
+from datastore import open_store, DataStore
+from near_duplicates import Match, signature
+from article_bodies import manifest_entry
+import recommend_index
 
 log = setup_logger("add-article")
 
 VALID_CATEGORIES = {"Analysis", "Opinion", "Discovery", "Review", "Tutorial"}
 MIN_PARAGRAPH_CHARS = 40
+PARALLEL_MIN = 500  # below this many entries a process pool costs more than it saves
 
 
 # ─── Helpers ────────────────────────────────────────────────────────────────
@@ -84,11 +104,25 @@ def validate_input(data: dict) -> list[str]:
             f"got: {data.get('category')!r}"
         )
 
+    # The month shard in data/archive/ is named after the date (article_archive.py)
+    if data.get("date") and not _is_iso_date(data["date"]):
+        errors.append(f"'date' must be YYYY-MM-DD, got: {data['date']!r}")
+
     return errors
 
 
+def _is_iso_date(value: object) -> bool:
+    """True for a real calendar date written exactly as YYYY-MM-DD."""
+    if not isinstance(value, str):
+        return False
+    try:
+        return date.fromisoformat(value).isoformat() == value
+    except ValueError:
+        return False
+
+
 def build_article_entry(data: dict) -> dict:
-    """Build a complete article entry for articles.json from validated input."""
+    """Build a complete article entry, content inline, from validated input."""
     content = data["content"]
     return {
         "slug": data.get("slug") or slugify(data["title"]),
@@ -101,27 +135,92 @@ def build_article_entry(data: dict) -> dict:
     }
 
 
-def add_article(article: dict, dry_run: bool = False) -> None:
-    """Add article to articles.json (prepend, trim to max)."""
-    articles = read_json(config.articles_path)
-
-    # Dup-slug guard with date suffix
-    existing_slugs = {a["slug"] for a in articles}
-    if article["slug"] in existing_slugs:
-        log.warning(f"Slug '{article['slug']}' already exists. Appending date suffix.")
-        article["slug"] += f"-{today_iso()}"
-
-    # Prepend (newest first)
-    articles.insert(0, article)
-
-    # Trim to max
+def unique_slug(slug: str, taken: set[str]) -> str:
+    """slug, or slug-<today> (then -2, -3, ...) if taken. Adds the result to taken."""
+    candidate, n = slug, 2
+    if candidate in taken:
+        candidate = f"{slug}-{today_iso()}"
+    while candidate in taken:
+        candidate = f"{slug}-{today_iso()}-{n}"
+        n += 1
+    taken.add(candidate)
+    return candidate
+
+
+class Duplicate(NamedTuple):
+    article: dict       # the incoming entry
+    match: Match        # most similar published article
+
+
+def add_article(article: dict, dry_run: bool = False, allow_duplicates: bool = False) -> list[Duplicate]:
+    """Add article to articles.json (newest first, overflow archived) and bump site.json, together."""
+    return add_articles([article], dry_run, allow_duplicates)
+
+
+def add_articles(
+    batch: list[dict], dry_run: bool = False, allow_duplicates: bool = False, strict: bool = False
+) -> list[Duplicate]:
+    """
+    Insert a batch of built entries in one read/merge/write: slugs are made
+    unique against one set (existing + earlier in the batch), entries are
+    merged into the list newest first, and the list is trimmed once.
+
+    Near-duplicates are left out and returned (with allow_duplicates they
+    are added and still returned). With strict, any near-duplicate means
+    nothing is written.
+    """
+    with open_store() as store:
+        return _insert_articles(store, batch, dry_run, allow_duplicates, strict)
+
+
+def _insert_articles(
+    store: DataStore, batch: list[dict], dry_run: bool, allow_duplicates: bool = False, strict: bool = False
+) -> list[Duplicate]:
+    articles = store.articles
+
+    # Near-duplicate guard against everything published and earlier entries,
+    # then dup-slug guard with date suffix (archived slugs still have live URLs)
+    taken = {a["slug"] for a in articles} | set(store.archive.slugs)
+    kept, duplicates = [], []
+    for article in batch:
+        sig = signature(article)
+        found = store.near_duplicates.matches(sig)
+        if found:
+            duplicates.append(Duplicate(article, found[0]))
+            if not allow_duplicates:
+                continue
+            log.warning(f"'{article['title']}' is a near-duplicate of '{found[0].slug}' "
+                        f"({found[0].similarity:.0%} similar). Adding anyway.")
+        slug = unique_slug(article["slug"], taken)
+        if slug != article["slug"]:
+            log.warning(f"Slug '{article['slug']}' already exists. Using '{slug}'.")
+            article["slug"] = slug
+        store.near_duplicates.add(slug, sig)
+        kept.append(article)
+
+    batch = kept
+    if not batch or (strict and duplicates and not allow_duplicates):
+        return duplicates
+
+    # Only the new articles are indexed; trimmed ones stay searchable in the archive
+    store.search.add(batch)
+
+    # Bodies go to data/content/ by hash; the list keeps metadata only
+    entries = [manifest_entry(a, store.bodies) for a in batch]
+
+    # Newest first; on equal dates new articles go ahead of existing ones
+    articles.replace(sorted([*entries, *articles], key=lambda a: a["date"], reverse=True))
+
+    # Trim to max; trimmed articles move to the month-sharded archive
     if len(articles) > config.max_articles:
-        removed = articles[config.max_articles:]
-        articles = articles[:config.max_articles]
+        removed = articles.items[config.max_articles:]
+        articles.replace(articles.items[:config.max_articles])
+        store.archive.add(removed)
         for r in removed:
-            log.info(f"  Trimmed old article: '{r['title']}'")
+            log.info(f"  Archived old article: '{r['title']}' → archive/{r['date'][:7]}.json")
 
-    if dry_run:
+    if dry_run and len(batch) == 1:
+        article = batch[0]
         log.info("[DRY RUN] Would write article:")
         log.info(f"  Title:      {article['title']}")
         log.info(f"  Slug:       {article['slug']}")
@@ -134,15 +233,64 @@ def add_article(article: dict, dry_run: bool = False) -> None:
         print(f"*{article['excerpt']}*\n")
         for p in article["content"]:
             print(f"{p}\n")
+    elif dry_run:
+        log.info(f"[DRY RUN] Would add {len(batch)} article(s)")
     else:
-        write_json(config.articles_path, articles)
-        log.info(f"Article added: '{article['title']}'")
-
         # Update site timestamp
-        site = read_json(config.site_path)
-        site["lastUpdated"] = today_iso()
-        write_json(config.site_path, site)
+        store.site["lastUpdated"] = today_iso()
+
+        # Keep the recommend index in step with whatever is on disk
+        index = recommend_index.index_if_changed(store.models.items, store.categories.items)
+        store.commit({config.recommend_index_path: index} if index else None)
+        if len(batch) == 1:
+            log.info(f"Article added: '{batch[0]['title']}'")
+        else:
+            log.info(f"Added {len(batch)} articles")
         log.info("Updated site.json timestamp")
+    return duplicates
+
+
+# ─── Bulk input ─────────────────────────────────────────────────────────────
+
+class Prepared(NamedTuple):
+    source: str             # file name, or file:line for JSONL
+    article: dict | None    # built entry, None when invalid
+    errors: list[str]
+
+
+def prepare(source: str, raw: str) -> Prepared:
+    """Parse, validate and build one article. Never raises."""
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        return Prepared(source, None, [f"Invalid JSON: {e}"])
+    if not isinstance(data, dict):
+        return Prepared(source, None, ["Expected a JSON object"])
+    errors = validate_input(data)
+    return Prepared(source, None if errors else build_article_entry(data), errors)
+
+
+def _prepare(item: tuple[str, str]) -> Prepared:
+    return prepare(*item)
+
+
+def read_batch(path: Path, jsonl: bool) -> list[tuple[str, str]]:
+    """(source, raw JSON) per entry: each *.json in a directory, or each JSONL line."""
+    if not jsonl:
+        return [(f.name, f.read_text(encoding="utf-8")) for f in sorted(path.glob("*.json"))]
+    if str(path) == "-":
+        name, lines = "stdin", sys.stdin.read().splitlines()
+    else:
+        name, lines = path.name, path.read_text(encoding="utf-8").splitlines()
+    return [(f"{name}:{n}", line) for n, line in enumerate(lines, 1) if line.strip()]
+
+
+def prepare_batch(items: list[tuple[str, str]], workers: int | None = None) -> list[Prepared]:
+    """prepare() every entry, across processes for large batches. Input order is kept."""
+    if len(items) < PARALLEL_MIN or workers == 1:
+        return [prepare(*item) for item in items]
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_prepare, items, chunksize=64))
 
 
 # ─── CLI ────────────────────────────────────────────────────────────────────
@@ -154,11 +302,39 @@ def parse_args() -> argparse.Namespace:
             "Article prose must be produced by the article-writer agent beforehand."
         )
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
         "--file",
         type=Path,
         help="Path to article JSON file (default: read from stdin)",
     )
+    source.add_argument(
+        "--dir",
+        type=Path,
+        help="Bulk: add every *.json article in this directory",
+    )
+    source.add_argument(
+        "--jsonl",
+        type=Path,
+        help="Bulk: add one article per line of this file ('-' for stdin)",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Bulk: write nothing and exit 1 if any entry is rejected "
+             "(default: add the valid entries and exit 0, even if some are rejected)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"Bulk: validation processes (used from {PARALLEL_MIN} entries; default: CPU count)",
+    )
+    parser.add_argument(
+        "--allow-duplicates",
+        action="store_true",
+        help=f"Add near-duplicates of published articles with a warning "
+             f"(default: reject at similarity >= {config.near_duplicate_threshold})",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -167,6 +343,51 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def bulk_main(args: argparse.Namespace) -> None:
+    """Validate every entry, report each one, then insert the valid ones in one write."""
+    path = args.dir or args.jsonl
+    try:
+        items = read_batch(path, jsonl=args.jsonl is not None)
+    except OSError as e:
+        log.error(f"Failed to read {path}: {e}")
+        sys.exit(1)
+    if not items:
+        log.error(f"No articles found in {path}")
+        sys.exit(1)
+
+    prepared = prepare_batch(items, args.workers)
+    valid = [p for p in prepared if p.article is not None]
+    rejected = [p for p in prepared if p.article is None]
+    original = [p.article["slug"] for p in valid]
+
+    duplicates: list[Duplicate] = []
+    if valid and not (args.strict and rejected):
+        duplicates = add_articles(
+            [p.article for p in valid], args.dry_run, args.allow_duplicates, args.strict
+        )
+    similar = {id(d.article): d.match for d in duplicates}
+    if not args.allow_duplicates:
+        rejected += [p for p in valid if id(p.article) in similar]
+
+    log.info(f"Report ({len(prepared) - len(rejected)} valid, {len(rejected)} rejected):")
+    for p in prepared:
+        if p.article is None:
+            log.error(f"  ✗ {p.source}: {'; '.join(p.errors)}")
+    for p, slug in zip(valid, original):
+        match = similar.get(id(p.article))
+        near = f"near-duplicate of '{match.slug}' ({match.similarity:.0%} similar)" if match else ""
+        if match and not args.allow_duplicates:
+            log.error(f"  ✗ {p.source}: {near}")
+            continue
+        renamed = f" (renamed from '{slug}')" if p.article["slug"] != slug else ""
+        flagged = f" — {near}" if match else ""
+        log.info(f"  ✓ {p.source} → {p.article['slug']}{renamed}{flagged}")
+
+    if rejected and args.strict:
+        log.error(f"--strict: {len(rejected)} rejected, nothing written")
+        sys.exit(1)
+
+
 def main() -> None:
     args = parse_args()
 
@@ -174,6 +395,12 @@ def main() -> None:
     log.info("HelloAi Article Inserter")
     log.info("=" * 50)
 
+    if args.dir or args.jsonl:
+        bulk_main(args)
+        if not args.dry_run:
+            log.info("Run `npx jest` to validate, then commit and deploy.")
+        return
+
     # Read JSON
     try:
         if args.file:
@@ -196,7 +423,12 @@ def main() -> None:
     article = build_article_entry(data)
 
     # Insert
-    add_article(article, dry_run=args.dry_run)
+    duplicates = add_article(article, dry_run=args.dry_run, allow_duplicates=args.allow_duplicates)
+    if duplicates and not args.allow_duplicates:
+        match = duplicates[0].match
+        log.error(f"Rejected: near-duplicate of '{match.slug}' ({match.similarity:.0%} similar). "
+                  "Pass --allow-duplicates to add it anyway.")
+        sys.exit(1)
 
     if not args.dry_run:
         log.info("Run `npx jest` to validate, then commit and deploy.")
@@ -3,7 +3,7 @@ arena.py — Deep module for LMArena leaderboard data.
 
 This module owns ALL knowledge about LMArena:
   - Where the data lives (URLs)
-  - How to fetch it (nakasyou JSON primary, CSV fallback)
+  - How to fetch it (nakasyou JSON primary, CSV fallback, raced concurrently)
   - How their model names map to our model IDs
   - How to resolve names (exact name-map only — no fuzzy matching)
 
@@ -15,23 +15,40 @@ Primary source: nakasyou's lmarena-history JSON snapshots on GitHub.
 Fallback source: community-maintained CSV releases on GitHub.
   https://github.com/fboulnois/llm-leaderboard-csv/releases/latest/download/lmarena_text.csv
 
+Both sources are fetched with conditional requests (ETag / Last-Modified).
+The validators and the already-parsed entries live in data/cache/arena.json,
+so a 304 response reuses the previous parse instead of re-downloading the
+multi-megabyte history. cache_only=True skips the network entirely.
+
 The public interface is intentionally simple:
 
     scores = fetch_scores(our_model_ids=["claude", "gemini", "grok", "gpt"])
     # → {"claude": 1504, "gemini": 1486, "grok": 1473, "gpt": 1479}
 
+    boards = fetch_boards(our_model_ids=["claude", "gemini"])
+    # → {"text/overall": {...}, "text/coding": {...}, "text/math": {...}, ...}
+
 Everything else is an implementation detail that callers never see.
 """
 
+import codecs
 import csv
-import io
+import hashlib
 import json
 import logging
+import os
+import queue
 import re
-from dataclasses import dataclass
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, NamedTuple
 
 import requests
 
+import http_client
+
 log = logging.getLogger("arena")
 
 
@@ -39,19 +56,34 @@ log = logging.getLogger("arena")
 
 # Primary source: nakasyou's lmarena-history snapshot JSON.
 # Keys are "YYYYMMDD" strings; lexicographic sort gives the latest snapshot.
-_NAKASYOU_JSON_URL = (
+# ARENA_JSON_URL / ARENA_CSV_URL point either source elsewhere, e.g. at the
+# local stand-in from arena_fixtures.py.
+_NAKASYOU_JSON_URL = os.getenv(
+    "ARENA_JSON_URL",
     "https://raw.githubusercontent.com/nakasyou/lmarena-history"
-    "/main/output/scores.json"
+    "/main/output/scores.json",
 )
 
 # Fallback: community-maintained CSV releases on GitHub.
-_FALLBACK_CSV_URL = (
+_FALLBACK_CSV_URL = os.getenv(
+    "ARENA_CSV_URL",
     "https://github.com/fboulnois/llm-leaderboard-csv"
-    "/releases/latest/download/lmarena_text.csv"
+    "/releases/latest/download/lmarena_text.csv",
 )
 
-_USER_AGENT = "HelloAi-Bot/1.0 (+https://helloai.com)"
-_TIMEOUT = 20
+_STREAM_CHUNK_BYTES = 256 * 1024  # scores.json is read in chunks this size
+_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024  # a spooled download beyond this goes to a temp file
+
+# Board every source provides; the one our curated Elos track.
+# nakasyou snapshots also carry per-category boards ("text/coding", ...).
+OVERALL_BOARD = "text/overall"
+
+# Conditional-GET validators + parsed boards, keyed by source name. Each
+# record carries the URL it came from; a record for another URL (e.g. the
+# ARENA_JSON_URL stand-in) is a cache miss, never served as real data.
+# Runtime artifact — git-ignored via data/cache/.gitignore.
+_CACHE_PATH = Path(__file__).parent.parent / "data" / "cache" / "arena.json"
+_CACHE_LOCK = threading.Lock()
 
 # How our model IDs map to LMArena model names.
 # Checked in order — first match wins. Keep these current when
@@ -88,109 +120,707 @@ _NAME_MAP: dict[str, list[str]] = {
     ],
 }
 
-# CSV column names vary across sources. We try each in order.
+# Same, for the open-weight catalog (data/open_weight_models.json).
+_OPEN_WEIGHT_NAME_MAP: dict[str, list[str]] = {
+    "gemma": [
+        "gemma-4-31b-it",
+        "gemma-4-31b",
+        "gemma-3-27b-it",
+    ],
+    "qwen": [
+        "qwen3-32b",
+        "qwen3-32b-instruct",
+    ],
+    "mistral": [
+        "mistral-small-3.2-24b-instruct",
+        "mistral-small-2506",
+    ],
+}
+
+# Catalog name (data file stem) → its name map. Catalogs resolve
+# independently, so the same model ID may appear in more than one.
+CATALOG_NAME_MAPS: dict[str, dict[str, list[str]]] = {
+    "models": _NAME_MAP,
+    "open_weight_models": _OPEN_WEIGHT_NAME_MAP,
+}
+
+# CSV column names vary across sources. Resolved once per file from the
+# header; for name/score, every present column is tried in this order per row.
 _CSV_NAME_COLUMNS = ["Model", "model", "model_name", "name", "key", "Key"]
 _CSV_SCORE_COLUMNS = [
     "arena_score", "Arena Score", "Arena Elo", "rating", "elo", "score", "Rating",
 ]
+_CSV_VOTES_COLUMNS = ["votes", "Votes", "num_votes", "num_battles"]
+_CSV_CI_COLUMNS = ["95_pct_ci", "95% CI", "ci", "CI"]
 
 
-# ─── INTERNAL: Data source implementations ────────────────────────────────
+# ─── INTERNAL: Data model ─────────────────────────────────────────────────
 
-@dataclass
-class _ArenaEntry:
-    """A single model's data from the leaderboard."""
+class _ArenaEntry(NamedTuple):
+    """A single model's data from the leaderboard (a plain tuple — one per row)."""
     name: str
     score: float
     votes: int = 0
+    ci: str = ""  # e.g. "+5/-4"; only the CSV source carries it
+
+
+# {board: {model_name: _ArenaEntry}}, e.g. {"text/overall": {...}, "text/coding": {...}}
+_Boards = dict[str, dict[str, _ArenaEntry]]
+
+
+class _Cancelled(Exception):
+    """Raised inside a source fetch when a higher-priority source already won."""
+
+
+class _Interrupted(Exception):
+    """A streamed download lost its connection mid-body (http_client retries only up to the headers)."""
+
+
+# Failures requests raises while a streamed body is being read
+_BODY_ERRORS = (requests.exceptions.ChunkedEncodingError, requests.ConnectionError, requests.Timeout)
 
 
-def _fetch_from_nakasyou() -> dict[str, "_ArenaEntry"]:
+def _check_cancel(cancel: threading.Event | None) -> None:
+    if cancel is not None and cancel.is_set():
+        raise _Cancelled()
+
+
+def _hashing(chunks: Iterable[bytes], digest: Any) -> Iterator[bytes]:
+    """Pass chunks through, feeding each into digest (payload fingerprint)."""
+    for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
+
+
+def _until_cancelled(
+    chunks: Iterable[bytes], cancel: threading.Event | None
+) -> Iterator[bytes]:
     """
-    Fetch the nakasyou lmarena-history JSON snapshot.
-    Returns {model_name: _ArenaEntry} from the latest snapshot's text/overall board.
+    Pass chunks through, aborting the download as soon as cancel is set.
+    A connection lost mid-body is raised as _Interrupted.
     """
-    resp = requests.get(
-        _NAKASYOU_JSON_URL,
-        timeout=_TIMEOUT,
-        headers={"User-Agent": _USER_AGENT},
-    )
-    resp.raise_for_status()
+    try:
+        for chunk in chunks:
+            _check_cancel(cancel)
+            yield chunk
+    except _BODY_ERRORS as e:
+        raise _Interrupted(f"{type(e).__name__} mid-body: {e}") from e
+
+
+# ─── INTERNAL: Conditional-GET cache ──────────────────────────────────────
 
-    data = resp.json()
-    if not data:
+def _load_cache(path: Path | None = None) -> dict:
+    """Read the response cache (default _CACHE_PATH). A missing or corrupt file is an empty cache."""
+    try:
+        with open(path or _CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
         return {}
+    return cache if isinstance(cache, dict) else {}
 
-    latest = max(data.keys())  # "YYYYMMDD" keys — lexicographic == chronological
-    board = data[latest].get("text", {}).get("overall") or {}
 
-    entries: dict[str, _ArenaEntry] = {
-        name: _ArenaEntry(name=name, score=float(elo))
-        for name, elo in board.items()
+def _save_cache(cache: dict, path: Path | None = None) -> None:
+    """Write the response cache via a unique temp file + rename so readers never see half a file."""
+    path = path or _CACHE_PATH
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        log.warning(f"Could not write arena cache {path}: {e}")
+
+
+def _cached(source: str, url: str, path: Path | None = None) -> dict | None:
+    """The cache record for source, if it was fetched from url (else a miss)."""
+    cached = _load_cache(path).get(source)
+    return cached if cached and cached.get("url") == url else None
+
+
+def _conditional_headers(cached: dict | None) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a cached record."""
+    headers: dict[str, str] = {}
+    if cached and cached.get("boards"):
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _boards_from_cache(cached: dict | None) -> _Boards:
+    """Rebuild _ArenaEntry objects from cached {board: {name: [score, votes, ci]}} maps."""
+    if not cached:
+        return {}
+    return {
+        board: {name: _ArenaEntry(name, *fields) for name, fields in entries.items()}
+        for board, entries in cached.get("boards", {}).items()
     }
-    log.info(f"nakasyou: {len(entries)} models from snapshot {latest} (text/overall)")
-    return entries
 
 
-def _parse_csv() -> dict[str, "_ArenaEntry"]:
+def _store_in_cache(
+    source: str,
+    url: str,
+    resp: requests.Response,
+    boards: _Boards,
+    snapshot: str | None = None,
+    sha256: str | None = None,
+    path: Path | None = None,
+    cancel: threading.Event | None = None,
+) -> None:
     """
-    Parse community CSV fallback.
-    Returns {model_name: _ArenaEntry}.
+    Record a fresh 200 response's validators, payload hash and parsed boards
+    in the cache at path (default _CACHE_PATH). A source that lost its race
+    (cancel set) records nothing: the run it belonged to is already over.
     """
-    resp = requests.get(
-        _FALLBACK_CSV_URL,
-        timeout=_TIMEOUT,
-        allow_redirects=True,
+    if not boards.get(OVERALL_BOARD) or (cancel is not None and cancel.is_set()):
+        return
+    record = {
+        "url": url,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "snapshot": snapshot,
+        "sha256": sha256,
+        "boards": {
+            board: {e.name: list(e[1:]) for e in entries.values()}
+            for board, entries in boards.items()
+        },
+    }
+    # Raced sources finish on their own threads; without the lock one
+    # read-modify-write can drop the other source's record
+    with _CACHE_LOCK:
+        if cancel is not None and cancel.is_set():
+            return
+        cache = _load_cache(path)
+        cache[source] = record
+        _save_cache(cache, path)
+
+
+# ─── INTERNAL: Streaming snapshot parser ──────────────────────────────────
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _SnapshotParser:
+    """
+    Incremental parser for the top-level {"YYYYMMDD": {...}, ...} history object.
+
+    Each snapshot value is decoded on its own (json's C decoder via raw_decode)
+    as soon as it is fully buffered and handed back to the caller, so peak
+    memory is one buffered chunk plus one snapshot, regardless of how many
+    snapshots the file holds.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._state = "start"  # start → key → colon → value → key ... → done
+        self._key: str | None = None
+
+    def feed(self, text: str) -> list[tuple[str, dict]]:
+        """Consume the next piece of the document; returns snapshots completed by it."""
+        self._buf += text
+        completed: list[tuple[str, dict]] = []
+        pos = self._drain(self._buf, completed)
+        self._buf = self._buf[pos:]
+        return completed
+
+    def close(self) -> None:
+        """Signal end of input; raises ValueError if the document was truncated."""
+        if self._state != "done":
+            raise ValueError(f"scores.json ended unexpectedly (parser state: {self._state})")
+
+    def _drain(self, buf: str, completed: list[tuple[str, dict]]) -> int:
+        """Advance through every complete token in buf. Returns the resume offset."""
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos >= len(buf) or self._state == "done":
+                return pos
+            ch = buf[pos]
+
+            if self._state == "start":
+                if ch != "{":
+                    raise ValueError(f"expected '{{' at start of scores.json, got {ch!r}")
+                self._state, pos = "key", pos + 1
+            elif self._state == "key":
+                if ch == "}":
+                    self._state, pos = "done", pos + 1
+                elif ch == ",":
+                    pos += 1
+                else:
+                    try:
+                        self._key, pos = self._decoder.raw_decode(buf, pos)
+                    except json.JSONDecodeError:
+                        return pos  # key split across chunks — wait for more
+                    self._state = "colon"
+            elif self._state == "colon":
+                if ch != ":":
+                    raise ValueError(f"expected ':' after key {self._key!r}, got {ch!r}")
+                self._state, pos = "value", pos + 1
+            else:  # value
+                try:
+                    value, pos = self._decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    return pos  # snapshot not fully buffered yet
+                if isinstance(value, dict):
+                    completed.append((self._key, value))
+                self._state = "key"
+
+
+def _iter_snapshots(chunks: Iterable[bytes]) -> Iterator[tuple[str, dict]]:
+    """Stream the lmarena-history document, yielding (key, snapshot) in file order."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = _SnapshotParser()
+    for chunk in chunks:
+        yield from parser.feed(decoder.decode(chunk))
+    yield from parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+
+
+def _parse_latest_snapshot(chunks: Iterable[bytes]) -> tuple[str | None, dict]:
+    """
+    Stream the lmarena-history document and return (latest_key, latest_snapshot).
+    Only the newest snapshot is ever held in memory.
+    """
+    latest, latest_snapshot = None, {}
+    for key, snapshot in _iter_snapshots(chunks):
+        # "YYYYMMDD" keys — lexicographic == chronological
+        if latest is None or key > latest:
+            latest, latest_snapshot = key, snapshot
+    return latest, latest_snapshot
+
+
+# ─── INTERNAL: Data source implementations ────────────────────────────────
+
+def _boards_from_snapshot(snapshot: dict) -> _Boards:
+    """
+    Slice every board out of one snapshot in a single pass.
+    Snapshot layout: {category: {board: {model_name: elo}}}, e.g. text/overall.
+    """
+    boards: _Boards = {}
+    for category, category_boards in snapshot.items():
+        if not isinstance(category_boards, dict):
+            continue
+        for board, scores in category_boards.items():
+            if isinstance(scores, dict) and scores:
+                boards[f"{category}/{board}"] = {
+                    name: _ArenaEntry(name=name, score=float(elo))
+                    for name, elo in scores.items()
+                    if isinstance(elo, (int, float))
+                }
+    return boards
+
+
+def _spool(chunks: Iterable[bytes]) -> tuple[IO[bytes], str]:
+    """Download chunks into a spooled temp file; returns it rewound, with the payload's SHA-256."""
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MEMORY_BYTES)
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+        spool.write(chunk)
+    spool.seek(0)
+    return spool, digest.hexdigest()
+
+
+def _same_validators(resp: requests.Response, cached: dict | None) -> bool:
+    """A 200 carrying the cached ETag / Last-Modified (a server that ignored our conditional headers)."""
+    if not cached or not cached.get("boards"):
+        return False
+    if resp.headers.get("ETag") and cached.get("etag"):
+        return resp.headers["ETag"] == cached["etag"]
+    return bool(resp.headers.get("Last-Modified")) and resp.headers["Last-Modified"] == cached.get("last_modified")
+
+
+def _fetch_from_nakasyou(
+    cache_only: bool = False,
+    cancel: threading.Event | None = None,
+    url: str | None = None,
+    cache_path: Path | None = None,
+) -> _Boards:
+    """
+    Fetch the nakasyou lmarena-history JSON snapshot, streaming the response.
+    Returns every board of the latest snapshot ({board: {model_name: _ArenaEntry}}).
+    On 304 Not Modified (or with cache_only=True) the cached parse is returned.
+    So is a 200 whose validators or payload hash match the cache: with a
+    cached parse on hand the payload is downloaded and hashed before it is
+    parsed, and an identical one is never parsed.
+    Setting cancel aborts the download between chunks.
+    url and cache_path default to the module settings at call time.
+    """
+    url, cache_path = url or _NAKASYOU_JSON_URL, cache_path or _CACHE_PATH
+    cached = _cached("nakasyou", url, cache_path)
+    if cache_only:
+        return _boards_from_cache(cached)
+
+    with http_client.get(
+        url,
+        headers=_conditional_headers(cached),
+        stream=True,
+    ) as resp:
+        if (resp.status_code == 304 and cached) or (resp.ok and _same_validators(resp, cached)):
+            log.info(f"nakasyou: not modified — reusing cached snapshot {cached.get('snapshot')}")
+            return _boards_from_cache(cached)
+        resp.raise_for_status()
+
+        chunks = _until_cancelled(resp.iter_content(chunk_size=_STREAM_CHUNK_BYTES), cancel)
+        if not (cached and cached.get("sha256")):
+            # Nothing to compare against: parse while downloading
+            digest = hashlib.sha256()
+            latest, snapshot = _parse_latest_snapshot(_hashing(chunks, digest))
+            sha256 = digest.hexdigest()
+        else:
+            spool, sha256 = _spool(chunks)
+            with spool:
+                if sha256 == cached["sha256"]:
+                    log.info(
+                        f"nakasyou: payload unchanged (new validators) — "
+                        f"reusing cached snapshot {cached.get('snapshot')}"
+                    )
+                    boards = _boards_from_cache(cached)
+                    _store_in_cache(
+                        "nakasyou", url, resp, boards,
+                        snapshot=cached.get("snapshot"), sha256=sha256, path=cache_path, cancel=cancel,
+                    )
+                    return boards
+                latest, snapshot = _parse_latest_snapshot(
+                    iter(lambda: spool.read(_STREAM_CHUNK_BYTES), b"")
+                )
+    if latest is None:
+        return {}
+
+    boards = _boards_from_snapshot(snapshot)
+    overall = boards.get(OVERALL_BOARD, {})
+    log.info(
+        f"nakasyou: {len(overall)} models from snapshot {latest} "
+        f"({OVERALL_BOARD}, +{len(boards) - bool(overall)} other boards)"
     )
-    resp.raise_for_status()
+    _store_in_cache(
+        "nakasyou", url, resp, boards, snapshot=latest, sha256=sha256, path=cache_path, cancel=cancel
+    )
+    return boards
 
-    entries: dict[str, _ArenaEntry] = {}
-    reader = csv.DictReader(io.StringIO(resp.text))
 
+class _CsvLayout(NamedTuple):
+    """Column indexes resolved once from a CSV header."""
+    names: list[int]
+    scores: list[int]
+    votes: int | None
+    ci: int | None
+
+
+def _csv_layout(header: list[str]) -> _CsvLayout:
+    position = {col.strip().lstrip("\ufeff"): i for i, col in enumerate(header)}
+    return _CsvLayout(
+        names=[position[c] for c in _CSV_NAME_COLUMNS if c in position],
+        scores=[position[c] for c in _CSV_SCORE_COLUMNS if c in position],
+        votes=next((position[c] for c in _CSV_VOTES_COLUMNS if c in position), None),
+        ci=next((position[c] for c in _CSV_CI_COLUMNS if c in position), None),
+    )
+
+
+def _parse_csv_lines(lines: Iterable[str]) -> dict[str, "_ArenaEntry"]:
+    """
+    Parse leaderboard CSV lines (header first) into {model_name: _ArenaEntry}.
+    The column layout is resolved once from the header; each row is read by index.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header:
+        return {}
+    layout = _csv_layout(header)
+    if not layout.names or not layout.scores:
+        log.warning(f"CSV header has no known model/score column: {header}")
+        return {}
+
+    entries: dict[str, _ArenaEntry] = {}
     for row in reader:
-        name = next(
-            (row[c].strip() for c in _CSV_NAME_COLUMNS if c in row and row[c]),
-            None,
-        )
+        width = len(row)
+        name = next((row[i].strip() for i in layout.names if i < width and row[i].strip()), None)
+        if not name:
+            continue
         score = None
-        for col in _CSV_SCORE_COLUMNS:
-            if col in row and row[col]:
+        for i in layout.scores:
+            if i < width and row[i]:
                 try:
-                    score = float(row[col].strip())
+                    score = float(row[i])
                     break
                 except ValueError:
                     continue
-        if name and score is not None:
-            entries[name] = _ArenaEntry(name=name, score=score)
+        if score is None:
+            continue
+        votes = 0
+        if layout.votes is not None and layout.votes < width:
+            try:
+                votes = int(float(row[layout.votes]))
+            except ValueError:
+                pass
+        ci = row[layout.ci].strip() if layout.ci is not None and layout.ci < width else ""
+        entries[name] = _ArenaEntry(name, score, votes, ci)
 
     return entries
 
 
-def _fetch_all_scores() -> dict[str, "_ArenaEntry"]:
+def _parse_csv(
+    cache_only: bool = False,
+    cancel: threading.Event | None = None,
+    url: str | None = None,
+    cache_path: Path | None = None,
+) -> _Boards:
     """
-    Try all data sources in order. Returns raw arena entries.
+    Parse community CSV fallback, streaming the response line by line.
+    The CSV only carries the overall board.
+    Returns {OVERALL_BOARD: {model_name: _ArenaEntry}}.
+    On 304 Not Modified (or with cache_only=True) the cached parse is returned.
+    Setting cancel aborts the download between lines.
+    url and cache_path default to the module settings at call time.
     """
-    # Source 1: nakasyou JSON snapshots
-    try:
-        entries = _fetch_from_nakasyou()
-        if entries:
-            log.info(f"Fetched {len(entries)} models from nakasyou JSON")
-            return entries
-        log.warning("nakasyou JSON returned no data (structure may have changed)")
-    except requests.RequestException as e:
-        log.warning(f"nakasyou JSON fetch failed: {e}")
-
-    # Source 2: community CSV
-    try:
-        entries = _parse_csv()
-        if entries:
-            log.info(f"Parsed {len(entries)} models from fallback CSV")
-            return entries
-        log.warning("CSV fallback returned no data")
-    except Exception as e:
-        log.warning(f"CSV fallback failed: {e}")
+    url, cache_path = url or _FALLBACK_CSV_URL, cache_path or _CACHE_PATH
+    cached = _cached("csv", url, cache_path)
+    if cache_only:
+        return _boards_from_cache(cached)
 
-    return {}
+    with http_client.get(
+        url,
+        allow_redirects=True,
+        headers=_conditional_headers(cached),
+        stream=True,
+    ) as resp:
+        if (resp.status_code == 304 and cached) or (resp.ok and _same_validators(resp, cached)):
+            log.info("CSV fallback: not modified — reusing cached parse")
+            return _boards_from_cache(cached)
+        resp.raise_for_status()
+
+        digest = hashlib.sha256()
+        lines = resp.iter_lines(chunk_size=_STREAM_CHUNK_BYTES)
+        entries = _parse_csv_lines(
+            line.decode("utf-8")
+            for line in _hashing((raw + b"\n" for raw in _until_cancelled(lines, cancel)), digest)
+        )
+
+    boards = {OVERALL_BOARD: entries}
+    _store_in_cache("csv", url, resp, boards, sha256=digest.hexdigest(), path=cache_path, cancel=cancel)
+    return boards
+
+
+# Sources in priority order: (log label, cache key, fetch function).
+_SOURCES: list[tuple[str, str, Callable[..., _Boards]]] = [
+    ("nakasyou JSON", "nakasyou", _fetch_from_nakasyou),
+    ("CSV fallback", "csv", _parse_csv),
+]
+
+# Cache key of the source that won the most recent _fetch_all_boards()
+_last_source: str | None = None
+
+
+def _source_url(source: str) -> str:
+    """The URL currently configured for a source's cache key."""
+    return {"nakasyou": _NAKASYOU_JSON_URL, "csv": _FALLBACK_CSV_URL}.get(source, "")
+
+# Longest a race waits for a higher-priority source when a lower-priority
+# one has data (seconds): one connect + read timeout, not the retries.
+RACE_DEADLINE = 25.0
+
+# Fresh downloads after a streamed body breaks off mid-way
+BODY_RETRIES = 1
+
+# (boards, error, elapsed seconds) for one source attempt
+_SourceOutcome = tuple[_Boards, Exception | None, float]
+
+
+def _run_source(
+    fetch: Callable[..., _Boards],
+    cache_only: bool,
+    cancel: threading.Event | None,
+    url: str,
+    cache_path: Path,
+) -> _SourceOutcome:
+    """
+    Run one source, capturing its result or error and how long it took.
+    A body that breaks off mid-download is fetched again (BODY_RETRIES times).
+    """
+    start = time.perf_counter()
+    for attempt in range(BODY_RETRIES + 1):
+        try:
+            boards, error = fetch(cache_only=cache_only, cancel=cancel, url=url, cache_path=cache_path), None
+        except _Interrupted as e:
+            boards, error = {}, e
+            if attempt < BODY_RETRIES and not (cancel is not None and cancel.is_set()):
+                log.info(f"{url}: {e}, downloading again")
+                continue
+        except Exception as e:
+            boards, error = {}, e
+        break
+    return boards, error, time.perf_counter() - start
+
+
+def _start_source(
+    index: int,
+    source: str,
+    fetch: Callable[..., _Boards],
+    cancel: threading.Event,
+    done: "queue.Queue[tuple[int, _SourceOutcome]]",
+) -> None:
+    """
+    Run a source on a daemon thread, putting (index, outcome) on done.
+    Daemon threads so a cancelled loser still stuck in connect() never delays exit.
+    The URL and cache path are read here, before the thread starts, so a loser
+    still running after the race never sees settings changed since.
+    """
+    url, cache_path = _source_url(source), _CACHE_PATH
+    threading.Thread(
+        target=lambda: done.put((index, _run_source(fetch, False, cancel, url, cache_path))),
+        name=f"arena-{fetch.__name__}",
+        daemon=True,
+    ).start()
+
+
+def _usable(label: str, outcome: _SourceOutcome) -> bool:
+    """Log a failed or empty source; True if its overall board has entries."""
+    boards, error, elapsed = outcome
+    if error is not None:
+        log.warning(f"{label} failed after {elapsed:.2f}s: {error}")
+        return False
+    if not boards.get(OVERALL_BOARD):
+        log.warning(f"{label} returned no data after {elapsed:.2f}s (structure may have changed)")
+        return False
+    return True
+
+
+def _race_sources(cancel: threading.Event) -> tuple[int, _SourceOutcome] | None:
+    """
+    Start every source at once. Until RACE_DEADLINE the first usable source
+    in priority order wins; after it, the first usable source that has
+    finished wins, even if a higher-priority one is still retrying.
+    """
+    done: queue.Queue[tuple[int, _SourceOutcome]] = queue.Queue()
+    for i, (_, source, fetch) in enumerate(_SOURCES):
+        _start_source(i, source, fetch, cancel, done)
+
+    deadline = time.monotonic() + RACE_DEADLINE
+    finished: dict[int, _SourceOutcome] = {}
+    usable: set[int] = set()
+    while True:
+        past_deadline = time.monotonic() >= deadline
+        for i in range(len(_SOURCES)):
+            if i in usable:
+                for j, (loser, _, _) in enumerate(_SOURCES):
+                    if j not in finished:
+                        log.info(f"  {loser}: cancelled ({_SOURCES[i][0]} won)")
+                return i, finished[i]
+            if i not in finished and not past_deadline:
+                break
+        if len(finished) == len(_SOURCES):
+            return None
+        try:
+            i, outcome = done.get(timeout=None if past_deadline else max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            continue
+        finished[i] = outcome
+        if _usable(_SOURCES[i][0], outcome):
+            usable.add(i)
+
+
+def _fetch_all_boards(
+    cache_only: bool = False,
+    concurrent: bool = True,
+) -> _Boards:
+    """
+    Try all data sources in priority order. Returns every board the winning
+    source provides; a source counts only if its overall board is non-empty.
+
+    concurrent=True starts every source at once. The primary keeps its
+    retries, so a hanging primary could cost several timeouts plus backoff;
+    RACE_DEADLINE caps that wait, after which the fallback's result (usually
+    long finished) is taken. Losing sources are cancelled.
+    With cache_only=True no network request is made; cached parses are used.
+    """
+    global _last_source
+    _last_source = None
+    if concurrent and not cache_only:
+        cancel = threading.Event()
+        won = _race_sources(cancel)
+        cancel.set()
+    else:
+        won = None
+        for i, (label, source, fetch) in enumerate(_SOURCES):
+            outcome = _run_source(fetch, cache_only, None, _source_url(source), _CACHE_PATH)
+            if _usable(label, outcome):
+                won = i, outcome
+                break
+    if won is None:
+        return {}
+
+    i, (boards, _, elapsed) = won
+    label, source, _ = _SOURCES[i]
+    _last_source = source
+    log.info(
+        f"Fetched {len(boards[OVERALL_BOARD])} models ({len(boards)} boards) "
+        f"from {label} in {elapsed:.2f}s"
+    )
+    return boards
+
+
+def _fetch_all_scores(
+    cache_only: bool = False,
+    concurrent: bool = True,
+) -> dict[str, "_ArenaEntry"]:
+    """Overall-board entries from the first working source."""
+    return _fetch_all_boards(cache_only, concurrent).get(OVERALL_BOARD, {})
+
+
+class NameResolver:
+    """
+    Case-insensitive index over one set of arena entries, built once.
+
+    Matching is exact name-map only — no fuzzy fallback (curated Elos are
+    authoritative). Each lookup is O(1) per name-map candidate, so resolving
+    N model IDs costs O(N) instead of O(N × arena_entries).
+    """
+
+    def __init__(
+        self,
+        arena_entries: dict[str, "_ArenaEntry"],
+        name_map: dict[str, list[str]] | None = None,
+    ) -> None:
+        self._by_lower = {k.lower(): v for k, v in arena_entries.items()}
+        self._name_map = _NAME_MAP if name_map is None else name_map
+
+    @classmethod
+    def from_index(
+        cls,
+        by_lower: dict[str, "_ArenaEntry"],
+        name_map: dict[str, list[str]],
+    ) -> "NameResolver":
+        """Share one lowercased entry index between resolvers with different name maps."""
+        resolver = cls.__new__(cls)
+        resolver._by_lower = by_lower
+        resolver._name_map = name_map
+        return resolver
+
+    def resolve(self, model_id: str) -> "tuple[str, _ArenaEntry] | None":
+        """Return (matched candidate, entry) for the first name-map hit, or None."""
+        for candidate in self._name_map.get(model_id, []):
+            entry = self._by_lower.get(candidate.lower())
+            if entry is not None:
+                return candidate, entry
+        return None
+
+    def resolve_many(
+        self, model_ids: Iterable[str]
+    ) -> "dict[str, tuple[str, _ArenaEntry]]":
+        """Resolve a batch of IDs. Unmatched IDs are omitted from the result."""
+        resolved = {}
+        for mid in model_ids:
+            match = self.resolve(mid)
+            if match is not None:
+                resolved[mid] = match
+        return resolved
 
 
 def _resolve_model_id(
@@ -199,68 +829,191 @@ def _resolve_model_id(
 ) -> "_ArenaEntry | None":
     """
     Match one of our model IDs to an arena entry.
-    Uses exact name-map match only — no fuzzy fallback (curated Elos are authoritative).
-    Returns None if no name-map candidate is found in arena_entries.
+    Single-shot convenience over NameResolver — build a NameResolver directly
+    when resolving more than one ID against the same entries.
     """
-    # Normalize arena keys for case-insensitive lookup
-    lower_map = {k.lower(): v for k, v in arena_entries.items()}
+    match = NameResolver(arena_entries).resolve(model_id)
+    return match[1] if match else None
+
+
+# ─── PUBLIC INTERFACE ──────────────────────────────────────────────────────
 
-    # Exact candidates from the name map only
-    for candidate in _NAME_MAP.get(model_id, []):
-        if candidate.lower() in lower_map:
-            return lower_map[candidate.lower()]
+def fetch_catalogs(
+    catalogs: dict[str, list[str]] | None = None,
+    cache_only: bool = False,
+    concurrent: bool = True,
+) -> dict[str, dict[str, dict[str, float]]]:
+    """
+    Fetch per-board Elo scores for several model catalogs from ONE snapshot.
 
-    return None
+    The snapshot is downloaded and parsed once; each catalog's IDs are then
+    resolved against it with that catalog's own name map (CATALOG_NAME_MAPS).
 
+    Args:
+        catalogs:   {catalog name: our model IDs}. If None, every catalog in
+                    CATALOG_NAME_MAPS with all of its mapped IDs.
+        cache_only: Offline mode — use the last cached parse, never the network.
+        concurrent: Race all sources at once (default) instead of one after another.
+
+    Returns:
+        {catalog: {board: {our model ID: Elo}}}, boards where none of a
+        catalog's models matched omitted. Empty if no arena data is available.
+        Example: {"models": {"text/overall": {"claude": 1504, ...}},
+                  "open_weight_models": {"text/overall": {"gemma": 1452, ...}}}
+    """
+    if catalogs is None:
+        catalogs = {name: list(name_map) for name, name_map in CATALOG_NAME_MAPS.items()}
+
+    boards = _fetch_all_boards(cache_only=cache_only, concurrent=concurrent)
+    overall = boards.get(OVERALL_BOARD)
+    if not overall:
+        if cache_only:
+            log.warning("Arena cache is empty — run once without --cache-only to fill it.")
+        log.warning(
+            "No arena data available. Use manual overrides (--set) instead."
+        )
+        return {}
+
+    # Log top 5 for visibility
+    top = sorted(overall.values(), key=lambda e: e.score, reverse=True)[:5]
+    for i, entry in enumerate(top, 1):
+        log.info(f"  #{i} {entry.name}: {int(entry.score)}")
+
+    # Resolve every catalog against one prebuilt index per board
+    indexes = {board: {k.lower(): v for k, v in entries.items()} for board, entries in boards.items()}
+    result: dict[str, dict[str, dict[str, float]]] = {}
+    for catalog, model_ids in catalogs.items():
+        name_map = CATALOG_NAME_MAPS.get(catalog, {})
+        scores_by_board: dict[str, dict[str, float]] = {}
+        for board, by_lower in indexes.items():
+            resolved = NameResolver.from_index(by_lower, name_map).resolve_many(model_ids)
+            if resolved:
+                scores_by_board[board] = {mid: entry.score for mid, (_, entry) in resolved.items()}
+            if board == OVERALL_BOARD:
+                for mid in model_ids:
+                    if mid in resolved:
+                        log.debug(f"  '{mid}' matched arena name '{resolved[mid][0]}'")
+                    else:
+                        log.info(f"  '{mid}' ({catalog}) not on public LMArena — keeping curated Elo")
+        result[catalog] = scores_by_board
+
+    return result
+
+
+def fetch_boards(
+    our_model_ids: list[str] | None = None,
+    cache_only: bool = False,
+    concurrent: bool = True,
+    catalog: str = "models",
+) -> dict[str, dict[str, float]]:
+    """
+    Fetch per-board Elo scores for our models from one LMArena snapshot.
+
+    Every board (overall, coding, math, hard prompts, ...) is sliced out of the
+    same fetched payload, so this costs exactly one download and one parse.
+    The CSV fallback only carries the overall board. Use fetch_catalogs() to
+    resolve several catalogs against that same payload.
+
+    Args:
+        our_model_ids: List of our internal model IDs (e.g. ["claude", "gemini"]).
+                       If None, resolves all IDs defined in the catalog's name map.
+        cache_only:    Offline mode — use the last cached parse, never the network.
+        concurrent:    Race all sources at once (default) instead of one after another.
+        catalog:       Which name map to resolve with (key of CATALOG_NAME_MAPS).
+
+    Returns:
+        Dict mapping board name to {our model ID: Elo}. Boards where none of our
+        models matched are omitted.
+        Example: {"text/overall": {"claude": 1504, ...}, "text/coding": {...}}
+    """
+    if our_model_ids is None:
+        our_model_ids = list(CATALOG_NAME_MAPS[catalog])
+    result = fetch_catalogs({catalog: our_model_ids}, cache_only=cache_only, concurrent=concurrent)
+    return result.get(catalog, {})
+
+
+def fetch_raw_boards(
+    cache_only: bool = False,
+    concurrent: bool = True,
+) -> dict[str, dict[str, float]]:
+    """
+    Every board of the latest snapshot with ALL arena models, not just ours.
+
+    Returns:
+        {board: {arena_model_name: Elo}}, e.g. {"text/overall": {"gpt-5.5": 1479.2, ...}}.
+        Empty if no source is available.
+    """
+    boards = _fetch_all_boards(cache_only=cache_only, concurrent=concurrent)
+    return {
+        board: {name: entry.score for name, entry in entries.items()}
+        for board, entries in boards.items()
+    }
+
+
+def snapshot_fingerprint() -> dict | None:
+    """
+    Identity of the payload behind the most recent successful fetch:
+    {"source", "snapshot", "sha256", "etag", "last_modified"}, or None if
+    nothing has been fetched. Cheap — read from the cache, no parsing.
+    """
+    if _last_source is None:
+        return None
+    cached = _cached(_last_source, _source_url(_last_source)) or {}
+    return {
+        "source": _last_source,
+        **{k: cached.get(k) for k in ("snapshot", "sha256", "etag", "last_modified")},
+    }
 
-# ─── PUBLIC INTERFACE ──────────────────────────────────────────────────────
 
 def fetch_scores(
     our_model_ids: list[str] | None = None,
+    cache_only: bool = False,
+    concurrent: bool = True,
 ) -> dict[str, float]:
     """
-    Fetch current Elo scores for our models from LMArena.
+    Fetch current Elo scores for our models from LMArena (overall board).
 
     Args:
         our_model_ids: List of our internal model IDs (e.g. ["claude", "gemini"]).
                        If None, resolves all IDs defined in the name map.
+        cache_only:    Offline mode — use the last cached parse, never the network.
+        concurrent:    Race all sources at once (default) instead of one after another.
 
     Returns:
         Dict mapping our model IDs to their Elo scores.
         Only includes IDs that were successfully matched.
         Example: {"claude": 1504, "gemini": 1486, "grok": 1473, "gpt": 1479}
     """
-    if our_model_ids is None:
-        our_model_ids = list(_NAME_MAP.keys())
+    boards = fetch_boards(our_model_ids, cache_only=cache_only, concurrent=concurrent)
+    return boards.get(OVERALL_BOARD, {})
 
-    arena_entries = _fetch_all_scores()
-    if not arena_entries:
-        log.warning(
-            "No arena data available. Use manual overrides (--set) instead."
-        )
-        return {}
 
-    # Log top 5 for visibility
-    top = sorted(arena_entries.values(), key=lambda e: e.score, reverse=True)[:5]
-    for i, entry in enumerate(top, 1):
-        log.info(f"  #{i} {entry.name}: {int(entry.score)}")
+def stream_history(
+    board: str = OVERALL_BOARD,
+) -> Iterator[tuple[str, dict[str, float]]]:
+    """
+    Stream every nakasyou snapshot as (YYYYMMDD, {arena_name: elo}) for one board.
 
-    # Resolve each of our model IDs
-    scores: dict[str, float] = {}
-    for mid in our_model_ids:
-        entry = _resolve_model_id(mid, arena_entries)
-        if entry:
-            scores[mid] = entry.score
-        else:
-            log.info(f"  '{mid}' not on public LMArena — keeping curated Elo")
+    Args:
+        board: "<category>/<board>" path inside each snapshot, e.g. "text/coding".
 
-    return scores
+    Yields snapshots in file order with only one held in memory at a time.
+    Snapshots that lack the requested board are skipped.
+    """
+    category, _, name = board.partition("/")
+    with http_client.get(_NAKASYOU_JSON_URL, stream=True) as resp:
+        resp.raise_for_status()
+        for key, snapshot in _iter_snapshots(resp.iter_content(chunk_size=_STREAM_CHUNK_BYTES)):
+            scores = (snapshot.get(category) or {}).get(name)
+            if scores:
+                yield key, {model: float(elo) for model, elo in scores.items()}
 
 
-def add_model_names(model_id: str, arena_names: list[str]) -> None:
+def add_model_names(model_id: str, arena_names: list[str], catalog: str = "models") -> None:
     """
-    Register additional arena name candidates for a model ID.
+    Register additional arena name candidates for a model ID in a catalog.
     Useful when adding new models via --add-model.
     """
-    existing = _NAME_MAP.get(model_id, [])
-    _NAME_MAP[model_id] = arena_names + existing
+    name_map = CATALOG_NAME_MAPS[catalog]
+    existing = name_map.get(model_id, [])
+    name_map[model_id] = arena_names + existing
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+arena_analytics.py — Vectorized analytics over a whole LMArena board.
+
+Computes, in one NumPy pass over every model on the board:
+  - dense rank (ties share a rank, no gaps)
+  - percentile (share of the board scoring strictly lower)
+  - Elo gap to the leader
+  - the full N×N expected win-probability matrix,
+    P[i, j] = 1 / (1 + 10 ** ((elo_j - elo_i) / 400))
+
+Usage:
+  python scripts/arena_analytics.py                   # Fetch, analyze, export
+  python scripts/arena_analytics.py --cache-only      # From the cached arena parse
+  python scripts/arena_analytics.py --board text/coding --top 20 --dry-run
+
+Output: data/arena_analytics.json (also refreshed by update_leaderboard.py).
+Win probabilities are exported as integer permille to keep the file compact.
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, write_json, today_iso
+import arena
+
+log = setup_logger("arena-analytics")
+
+
+@dataclass
+class BoardAnalytics:
+    """Per-model analytics for one board, best model first."""
+    board: str
+    names: list[str]
+    elo: np.ndarray            # (N,) float
+    rank: np.ndarray           # (N,) int, dense, 1 = best
+    percentile: np.ndarray     # (N,) float in [0, 100]
+    gap_to_leader: np.ndarray  # (N,) float, >= 0
+    win_probability: np.ndarray  # (N, N) float, row beats column
+
+    def to_json(self) -> dict:
+        """Site-facing export: rows sorted best-first, probabilities in permille."""
+        return {
+            "board": self.board,
+            "generated": today_iso(),
+            "models": [
+                {
+                    "name": name,
+                    "elo": round(float(elo), 1),
+                    "rank": int(rank),
+                    "percentile": round(float(pct), 1),
+                    "gapToLeader": round(float(gap), 1),
+                }
+                for name, elo, rank, pct, gap in zip(
+                    self.names, self.elo, self.rank, self.percentile, self.gap_to_leader
+                )
+            ],
+            "winProbabilityPermille": np.rint(self.win_probability * 1000).astype(int).tolist(),
+        }
+
+
+def analyze_board(scores: dict[str, float], board: str = arena.OVERALL_BOARD) -> BoardAnalytics:
+    """Compute ranks, percentiles, leader gaps and the win-probability matrix."""
+    order = sorted(scores, key=lambda name: (-scores[name], name))
+    elo = np.fromiter((scores[name] for name in order), dtype=np.float64, count=len(order))
+    n = elo.size
+
+    # Dense rank: position of each score among the distinct scores, best first
+    _, inverse = np.unique(-elo, return_inverse=True)
+    rank = inverse + 1
+
+    # Percentile: share of the rest of the board scoring strictly lower
+    below = np.searchsorted(np.sort(elo), elo, side="left")
+    percentile = below * (100.0 / (n - 1)) if n > 1 else np.full(n, 100.0)
+
+    gap = elo.max(initial=0.0) - elo if n else elo
+
+    # Elo expected score for every ordered pair in one broadcast
+    win_probability = 1.0 / (1.0 + 10.0 ** ((elo[np.newaxis, :] - elo[:, np.newaxis]) / 400.0))
+
+    return BoardAnalytics(
+        board=board,
+        names=order,
+        elo=elo,
+        rank=rank,
+        percentile=percentile,
+        gap_to_leader=gap,
+        win_probability=win_probability,
+    )
+
+
+def payload_if_changed(analytics: BoardAnalytics, path: Path | None = None) -> dict | None:
+    """The export payload, or None if path already holds it (ignoring the generated date)."""
+    path = path or config.arena_analytics_path
+    payload = analytics.to_json()
+    if path.exists():
+        previous = read_json(path)
+        previous["generated"] = payload["generated"]
+        if previous == payload:
+            log.info(f"  {path.name} unchanged")
+            return None
+    return payload
+
+
+def export(analytics: BoardAnalytics, path: Path | None = None, dry_run: bool = False) -> bool:
+    """
+    Write analytics to data/ if they changed (ignoring the generated date).
+    Returns True if the file was (or, in dry-run, would be) written.
+    update_leaderboard.py stages payload_if_changed() in its own transaction instead.
+    """
+    path = path or config.arena_analytics_path
+    payload = payload_if_changed(analytics, path)
+    if payload is None:
+        return False
+    if dry_run:
+        log.info(f"  [DRY RUN] Would write {path} ({len(analytics.names)} models)")
+    else:
+        write_json(path, payload, indent=None)
+        log.info(f"  Wrote {path} ({len(analytics.names)} models)")
+    return True
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="LMArena board analytics")
+    parser.add_argument("--board", default=arena.OVERALL_BOARD,
+                        help=f"Board to analyze (default: {arena.OVERALL_BOARD})")
+    parser.add_argument("--cache-only", action="store_true",
+                        help="Use the cached arena parse, no network")
+    parser.add_argument("--top", type=int, default=10, help="Rows to print")
+    parser.add_argument("--dry-run", action="store_true", help="Print without writing")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    setup_logger("arena")
+
+    scores = arena.fetch_raw_boards(cache_only=args.cache_only).get(args.board)
+    if not scores:
+        log.error(f"No arena data for board '{args.board}'")
+        sys.exit(1)
+
+    analytics = analyze_board(scores, args.board)
+    leader = analytics.names[0]
+    print(f"{args.board}: {len(analytics.names)} models")
+    for i in range(min(args.top, len(analytics.names))):
+        print(
+            f"  #{analytics.rank[i]:<3} {analytics.names[i]:<45} {analytics.elo[i]:7.1f}  "
+            f"p{analytics.percentile[i]:5.1f}  -{analytics.gap_to_leader[i]:5.1f}  "
+            f"P(beats {leader}) {analytics.win_probability[i, 0]:.2f}"
+        )
+    export(analytics, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+arena_fixtures.py — Record/replay fixtures and a local stand-in for the arena sources.
+
+Lets arena.py's fetch → parse → resolve pipeline run with no network:
+
+  python scripts/arena_fixtures.py record                    # Capture real responses
+  python scripts/arena_fixtures.py serve                     # Replay recorded fixtures
+  python scripts/arena_fixtures.py serve --synthetic --snapshots 400 --latency 2
+  python scripts/arena_fixtures.py bench --snapshots 400 --models 300 --runs 5
+
+`serve` prints the ARENA_JSON_URL / ARENA_CSV_URL exports that point arena.py
+(and therefore update_leaderboard.py) at the stand-in.
+
+The stand-in honours If-None-Match (→ 304) and can inject, per source:
+  --latency SECONDS     delay before response headers (exercises timeouts/racing)
+  --fail-first N        answer the first N requests with --error-status (retries/fallback)
+  --snapshots/--models  synthetic payload size (history depth × board width)
+
+Recorded fixtures live in scripts/fixtures/arena/ (git-ignored: multi-MB).
+Tests build synthetic fixtures in memory instead.
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+sys.path.insert(0, str(Path(__file__).parent))
+from utils import setup_logger
+import arena
+import http_client
+
+log = setup_logger("arena-fixtures")
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "arena"
+
+# Stand-in route → (arena URL attribute, recorded fixture file stem)
+_ROUTES = {
+    "/scores.json": ("_NAKASYOU_JSON_URL", "nakasyou"),
+    "/lmarena_text.csv": ("_FALLBACK_CSV_URL", "csv"),
+}
+
+_REPLAYED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+# ─── Fixtures ───────────────────────────────────────────────────────────────
+
+@dataclass
+class Fixture:
+    """One canned response plus the faults to inject when serving it."""
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    latency: float = 0.0     # seconds before sending response headers
+    fail_first: int = 0      # answer this many requests with error_status first
+    error_status: int = 503
+    retry_after: str | None = None  # Retry-After header sent with injected failures
+    cut_first: int = 0       # then send only half the body of this many 200s and hang up
+    requests: int = 0        # served so far (incl. injected failures)
+
+    def __post_init__(self) -> None:
+        if "ETag" not in self.headers:
+            self.headers["ETag"] = '"' + hashlib.sha256(self.body).hexdigest()[:16] + '"'
+
+
+def load_fixture(stem: str, fixtures_dir: Path = FIXTURES_DIR) -> Fixture:
+    """Load a recorded fixture: <stem>.body + <stem>.headers.json."""
+    body = (fixtures_dir / f"{stem}.body").read_bytes()
+    headers = json.loads((fixtures_dir / f"{stem}.headers.json").read_text(encoding="utf-8"))
+    return Fixture(body=body, headers=headers)
+
+
+def record(fixtures_dir: Path = FIXTURES_DIR) -> None:
+    """Fetch both real sources once and save body + replayable headers."""
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    for attr, stem in _ROUTES.values():
+        url = getattr(arena, attr)
+        resp = http_client.get(url, allow_redirects=True)
+        resp.raise_for_status()
+        (fixtures_dir / f"{stem}.body").write_bytes(resp.content)
+        headers = {h: resp.headers[h] for h in _REPLAYED_HEADERS if h in resp.headers}
+        (fixtures_dir / f"{stem}.headers.json").write_text(
+            json.dumps(headers, indent=2) + "\n", encoding="utf-8"
+        )
+        log.info(f"Recorded {url} → {stem}.body ({len(resp.content):,} bytes)")
+
+
+def synthetic_history(
+    snapshots: int = 52,
+    models: int = 100,
+    boards: tuple[str, ...] = ("overall", "coding", "hard_prompts"),
+    extra_names: dict[str, float] | None = None,
+) -> bytes:
+    """
+    A deterministic lmarena-history scores.json: weekly YYYYMMDD snapshots,
+    each with text/<board> maps of model → Elo. extra_names are added to every
+    board of the latest snapshot (e.g. real _NAME_MAP candidates to resolve).
+    """
+    start = date(2025, 1, 6)
+    history = {}
+    for week in range(snapshots):
+        key = (start + timedelta(weeks=week)).strftime("%Y%m%d")
+        history[key] = {
+            "text": {
+                board: {
+                    f"model-{m:04d}": round(1200 + (m * 37 + week * 3 + b * 11) % 350 + 0.25, 2)
+                    for m in range(models)
+                }
+                for b, board in enumerate(boards)
+            }
+        }
+    if extra_names and history:
+        for board in history[key]["text"].values():
+            board.update(extra_names)
+    return json.dumps(history, separators=(",", ":")).encode("utf-8")
+
+
+def synthetic_csv(models: int = 100, extra_names: dict[str, float] | None = None) -> bytes:
+    """A deterministic fallback CSV in the fboulnois column layout."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["rank", "model", "arena_score", "95_pct_ci", "votes", "organization"])
+    rows = [(f"model-{m:04d}", 1200 + (m * 37) % 350) for m in range(models)]
+    rows += list((extra_names or {}).items())
+    for rank, (name, score) in enumerate(sorted(rows, key=lambda r: -r[1]), 1):
+        writer.writerow([rank, name, score, "+5/-5", 1000 + rank, "org"])
+    return out.getvalue().encode("utf-8")
+
+
+# ─── Stand-in server ────────────────────────────────────────────────────────
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    server: "StandInServer"
+
+    def do_GET(self) -> None:
+        fixture = self.server.fixtures.get(self.path)
+        if fixture is None:
+            self.send_error(404)
+            return
+        with self.server.lock:
+            fixture.requests += 1
+            failing = fixture.requests <= fixture.fail_first
+            cut = not failing and fixture.requests <= fixture.fail_first + fixture.cut_first
+        if fixture.latency:
+            time.sleep(fixture.latency)
+
+        try:
+            if failing:
+                self.send_response(fixture.error_status)
+                if fixture.retry_after is not None:
+                    self.send_header("Retry-After", fixture.retry_after)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            elif self.headers.get("If-None-Match") == fixture.headers["ETag"]:
+                self.send_response(304)
+                self.send_header("ETag", fixture.headers["ETag"])
+                self.end_headers()
+            else:
+                self.send_response(200)
+                for name, value in fixture.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(fixture.body)))
+                self.end_headers()
+                self.wfile.write(fixture.body[:len(fixture.body) // 2] if cut else fixture.body)
+                self.close_connection = cut
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client gave up (timeout test or cancelled race loser)
+
+    def log_message(self, format: str, *args) -> None:
+        log.debug(f"{self.address_string()} {format % args}")
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded local HTTP server replaying Fixture objects by path."""
+    daemon_threads = True
+
+    def __init__(self, fixtures: dict[str, Fixture], port: int = 0) -> None:
+        super().__init__(("127.0.0.1", port), _StandInHandler)
+        self.fixtures = fixtures
+        self.lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+@contextmanager
+def serve_arena(
+    nakasyou: Fixture | None,
+    csv_fixture: Fixture | None,
+    cache_dir: Path | None = None,
+) -> Iterator[StandInServer]:
+    """
+    Serve fixtures on a random local port and point arena.py at them for the
+    duration of the block. A missing fixture answers 404 (a failed source).
+    The arena cache goes to cache_dir (a fresh temp dir if None), never data/:
+    each source reads its URL and cache path when it starts (arena._start_source),
+    so one still running after the block never sees the restored settings.
+    """
+    fixtures = {}
+    if nakasyou is not None:
+        fixtures["/scores.json"] = nakasyou
+    if csv_fixture is not None:
+        fixtures["/lmarena_text.csv"] = csv_fixture
+    server = StandInServer(fixtures)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    saved = {attr: getattr(arena, attr) for attr, _ in _ROUTES.values()}
+    saved["_CACHE_PATH"] = arena._CACHE_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            for path, (attr, _) in _ROUTES.items():
+                setattr(arena, attr, server.url(path))
+            arena._CACHE_PATH = Path(cache_dir or tmp) / "arena.json"
+            yield server
+        finally:
+            for attr, value in saved.items():
+                setattr(arena, attr, value)
+            server.shutdown()
+            server.server_close()
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def _fixtures_from_args(args: argparse.Namespace) -> tuple[Fixture, Fixture]:
+    if args.synthetic:
+        nakasyou = Fixture(synthetic_history(args.snapshots, args.models))
+        csv_fixture = Fixture(synthetic_csv(args.models), {"Content-Type": "text/csv"})
+    else:
+        nakasyou, csv_fixture = load_fixture("nakasyou"), load_fixture("csv")
+    for fixture in (nakasyou, csv_fixture):
+        fixture.latency = args.latency
+        fixture.fail_first = args.fail_first
+        fixture.error_status = args.error_status
+    return nakasyou, csv_fixture
+
+
+def _bench(args: argparse.Namespace) -> None:
+    """Time the full fetch → parse → resolve pipeline against the stand-in."""
+    nakasyou, csv_fixture = _fixtures_from_args(args)
+    log.info(f"Payload: scores.json {len(nakasyou.body):,} bytes, CSV {len(csv_fixture.body):,} bytes")
+    with serve_arena(nakasyou, csv_fixture):
+        for label, cache_only in (("cold", False), ("304", False), ("cache-only", True)):
+            timings = []
+            for run in range(args.runs):
+                if label == "cold":
+                    arena._CACHE_PATH.unlink(missing_ok=True)
+                start = time.perf_counter()
+                arena.fetch_scores(cache_only=cache_only)
+                timings.append(time.perf_counter() - start)
+            timings.sort()
+            log.info(
+                f"{label:>10}: median {timings[len(timings) // 2] * 1000:8.1f} ms, "
+                f"best {timings[0] * 1000:8.1f} ms over {args.runs} run(s)"
+            )
+    http_client.log_metrics(log)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Arena source fixtures and local stand-in")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("record", help="Capture real nakasyou + CSV responses")
+    p.add_argument("--dir", type=Path, default=FIXTURES_DIR)
+
+    for name, help_text in (
+        ("serve", "Run the stand-in until interrupted"),
+        ("bench", "Benchmark fetch/parse/resolve against the stand-in"),
+    ):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--synthetic", action="store_true",
+                       help="Serve generated payloads instead of recorded fixtures")
+        p.add_argument("--snapshots", type=int, default=52, help="Synthetic history depth")
+        p.add_argument("--models", type=int, default=100, help="Synthetic models per board")
+        p.add_argument("--latency", type=float, default=0.0, help="Seconds before headers")
+        p.add_argument("--fail-first", type=int, default=0, help="Fail this many requests first")
+        p.add_argument("--error-status", type=int, default=503)
+        if name == "serve":
+            p.add_argument("--port", type=int, default=8765)
+        else:
+            p.add_argument("--runs", type=int, default=5)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    setup_logger("arena")
+    setup_logger("http")
+
+    if args.command == "record":
+        record(args.dir)
+    elif args.command == "bench":
+        if not args.synthetic and not (FIXTURES_DIR / "nakasyou.body").exists():
+            args.synthetic = True
+            log.info("No recorded fixtures — benchmarking synthetic payloads")
+        _bench(args)
+    else:
+        nakasyou, csv_fixture = _fixtures_from_args(args)
+        server = StandInServer(
+            {"/scores.json": nakasyou, "/lmarena_text.csv": csv_fixture}, port=args.port
+        )
+        print(f"export ARENA_JSON_URL={server.url('/scores.json')}")
+        print(f"export ARENA_CSV_URL={server.url('/lmarena_text.csv')}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+arena_history.py — Local Elo time-series store built from the full LMArena history.
+
+Usage:
+  python scripts/arena_history.py ingest                          # Append new snapshots
+  python scripts/arena_history.py trajectory claude-opus-4-6      # One model over time
+  python scripts/arena_history.py top --date 2026-05-01 -n 10     # Board on a date
+  python scripts/arena_history.py delta 2026-01-01 2026-05-01     # Biggest movers
+  python scripts/arena_history.py ingest --board text/coding      # Any other board
+
+On-disk layout (data/arena_history/<category>-<board>/, git-ignored):
+  index.json  — string table of arena model names + one descriptor per segment
+  scores.f32  — float32 column blocks, appended one segment at a time
+
+An ingest appends a segment per SEGMENT_DATES new snapshots, written as the
+stream yields them, so the first ingest of the full history never holds more
+than one segment's snapshots. A segment is a column-major block of
+len(dates) × len(models) float32 values, NaN where a model was absent on a
+date. Nothing already on disk is rewritten. Loading stitches the segments into
+one array('f') column per model over the sorted date axis, so every query is a
+column or row slice rather than a walk over the raw JSON.
+"""
+
+import argparse
+import bisect
+import math
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, write_json
+import arena
+import http_client
+
+log = setup_logger("arena-history")
+
+_NAN = float("nan")
+SEGMENT_DATES = 64  # new snapshots buffered per segment during an ingest
+
+
+class EloHistory:
+    """Dates × models Elo matrix for one arena board, stored as float32 columns."""
+
+    def __init__(self, root: Path, board: str = arena.OVERALL_BOARD) -> None:
+        self.board = board
+        self.root = root / board.replace("/", "-")
+        self.index_path = self.root / "index.json"
+        self.scores_path = self.root / "scores.f32"
+        self._index: dict = {
+            "board": board,
+            "byteorder": sys.byteorder,
+            "models": [],    # string table: column id → arena model name
+            "segments": [],  # {"dates": [...], "models": [column ids], "offset": n}
+        }
+        self.dates: list[str] = []
+        self._columns: list[array] = []
+        self._column_of: dict[str, int] = {}
+        self._load()
+
+    # ── Loading ──────────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        self._index = read_json(self.index_path)
+        if self._index["board"] != self.board:
+            raise ValueError(
+                f"{self.index_path} holds board {self._index['board']!r}, not {self.board!r}"
+            )
+
+        models = self._index["models"]
+        segments = self._index["segments"]
+        self._column_of = {name.lower(): i for i, name in enumerate(models)}
+        self.dates = sorted(d for seg in segments for d in seg["dates"])
+        row_of = {d: i for i, d in enumerate(self.dates)}
+        self._columns = [array("f", [_NAN]) * len(self.dates) for _ in models]
+
+        swap = self._index["byteorder"] != sys.byteorder
+        with open(self.scores_path, "rb") as f:
+            for seg in segments:
+                n_dates = len(seg["dates"])
+                block = array("f")
+                f.seek(seg["offset"] * block.itemsize)
+                block.fromfile(f, n_dates * len(seg["models"]))
+                if swap:
+                    block.byteswap()
+                rows = [row_of[d] for d in seg["dates"]]
+                for k, column_id in enumerate(seg["models"]):
+                    column = self._columns[column_id]
+                    base = k * n_dates
+                    for j, row in enumerate(rows):
+                        column[row] = block[base + j]
+
+    # ── Ingestion ────────────────────────────────────────────────────────
+
+    def append(self, snapshots: Iterable[tuple[str, dict[str, float]]]) -> int:
+        """
+        Append every snapshot whose date is not yet stored, one segment per
+        SEGMENT_DATES of them, consuming snapshots as it goes.
+        Returns the number of dates added.
+        """
+        known = set(self.dates)
+        batch: dict[str, dict[str, float]] = {}
+        added = 0
+        for date, scores in snapshots:
+            if date in known:
+                continue
+            known.add(date)
+            batch[date] = scores
+            if len(batch) >= SEGMENT_DATES:
+                added += self._write_segment(batch)
+                batch = {}
+        added += self._write_segment(batch)
+        if added:
+            self._load()
+        return added
+
+    def _write_segment(self, new: dict[str, dict[str, float]]) -> int:
+        """Append one segment holding new ({date: scores}); the index is rewritten after the data."""
+        if not new:
+            return 0
+        models = self._index["models"]
+        dates = sorted(new)
+        column_ids: dict[str, int] = {}
+        for date in dates:
+            for name in new[date]:
+                if name not in column_ids:
+                    if name.lower() not in self._column_of:
+                        self._column_of[name.lower()] = len(models)
+                        models.append(name)
+                    column_ids[name] = self._column_of[name.lower()]
+
+        block = array("f")
+        for name in column_ids:
+            block.extend(new[date].get(name, _NAN) for date in dates)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.scores_path, "ab") as f:
+            offset = f.tell() // block.itemsize
+            block.tofile(f)
+        self._index["segments"].append({
+            "dates": dates,
+            "models": list(column_ids.values()),
+            "offset": offset,
+        })
+        write_json(self.index_path, self._index)
+        return len(dates)
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    @property
+    def models(self) -> list[str]:
+        """String table of every arena model name ever stored."""
+        return self._index["models"]
+
+    def _row_on_or_before(self, date: str | None) -> int:
+        """Row index of the latest snapshot on or before date (latest if None)."""
+        if not self.dates:
+            raise LookupError("History store is empty — run `ingest` first")
+        if date is None:
+            return len(self.dates) - 1
+        row = bisect.bisect_right(self.dates, date) - 1
+        if row < 0:
+            raise LookupError(f"No snapshot on or before {date} (first is {self.dates[0]})")
+        return row
+
+    def trajectory(self, model: str) -> list[tuple[str, float]]:
+        """[(date, elo)] for every snapshot the model appears in."""
+        column_id = self._column_of.get(model.lower())
+        if column_id is None:
+            return []
+        column = self._columns[column_id]
+        return [
+            (date, column[row])
+            for row, date in enumerate(self.dates)
+            if not math.isnan(column[row])
+        ]
+
+    def top(self, date: str | None = None, n: int = 10) -> tuple[str, list[tuple[str, float]]]:
+        """(snapshot date, [(model, elo)] best-first) for the snapshot on or before date."""
+        row = self._row_on_or_before(date)
+        board = [
+            (name, column[row])
+            for name, column in zip(self.models, self._columns)
+            if not math.isnan(column[row])
+        ]
+        board.sort(key=lambda item: item[1], reverse=True)
+        return self.dates[row], board[:n]
+
+    def deltas(
+        self, date_a: str, date_b: str, n: int | None = None
+    ) -> tuple[str, str, list[tuple[str, float, float, float]]]:
+        """
+        Elo change between two snapshots for models present in both.
+        Returns (resolved date_a, resolved date_b, [(model, elo_a, elo_b, delta)])
+        sorted by delta, biggest gain first.
+        """
+        row_a, row_b = self._row_on_or_before(date_a), self._row_on_or_before(date_b)
+        moves = []
+        for name, column in zip(self.models, self._columns):
+            a, b = column[row_a], column[row_b]
+            if not (math.isnan(a) or math.isnan(b)):
+                moves.append((name, a, b, b - a))
+        moves.sort(key=lambda item: item[3], reverse=True)
+        return self.dates[row_a], self.dates[row_b], moves[:n] if n else moves
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def _snapshot_date(value: str) -> str:
+    """Accept YYYY-MM-DD or YYYYMMDD; store keys are YYYYMMDD."""
+    date = value.replace("-", "")
+    if len(date) != 8 or not date.isdigit():
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD or YYYYMMDD, got {value!r}")
+    return date
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local LMArena Elo history store")
+    parser.add_argument(
+        "--board", default=arena.OVERALL_BOARD,
+        help="Snapshot board path, e.g. text/overall or text/coding (default: text/overall)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("ingest", help="Stream the upstream history and append new snapshots")
+
+    p = sub.add_parser("trajectory", help="Elo over time for one arena model name")
+    p.add_argument("model")
+
+    p = sub.add_parser("top", help="Top-N models on a date (latest snapshot on or before)")
+    p.add_argument("--date", type=_snapshot_date, default=None)
+    p.add_argument("-n", type=int, default=10)
+
+    p = sub.add_parser("delta", help="Elo change between two dates")
+    p.add_argument("date_a", type=_snapshot_date)
+    p.add_argument("date_b", type=_snapshot_date)
+    p.add_argument("-n", type=int, default=20)
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    setup_logger("arena")
+    setup_logger("http")
+    history = EloHistory(config.arena_history_dir, board=args.board)
+
+    try:
+        if args.command == "ingest":
+            added = history.append(arena.stream_history(args.board))
+            http_client.log_metrics(log)
+            log.info(
+                f"Ingested {added} new snapshot(s) — {len(history.dates)} dates × "
+                f"{len(history.models)} models in {history.root}"
+            )
+        elif args.command == "trajectory":
+            points = history.trajectory(args.model)
+            if not points:
+                log.error(f"'{args.model}' not found in {args.board} history")
+                sys.exit(1)
+            for date, elo in points:
+                print(f"{date}  {elo:7.1f}")
+        elif args.command == "top":
+            date, board = history.top(args.date, args.n)
+            print(f"{args.board} on {date}:")
+            for i, (name, elo) in enumerate(board, 1):
+                print(f"  #{i:<3} {name:<45} {elo:7.1f}")
+        elif args.command == "delta":
+            date_a, date_b, moves = history.deltas(args.date_a, args.date_b, args.n)
+            print(f"{args.board}: {date_a} → {date_b}")
+            for name, a, b, delta in moves:
+                print(f"  {name:<45} {a:7.1f} → {b:7.1f}  ({delta:+.1f})")
+    except LookupError as e:
+        log.error(str(e))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
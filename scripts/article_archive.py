@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+article_archive.py — Month-sharded archive of articles trimmed from articles.json.
+
+articles.json keeps only the newest config.max_articles (every page load
+reads it). Older articles move here instead of being dropped, so their
+URLs keep resolving:
+
+  data/archive/index.json    {"version": 1,
+                              "shards": {"2026-04": 12, ...},        newest first
+                              "slugs":  {"some-slug": "2026-04", ...}}
+  data/archive/2026-04.json  every archived article dated 2026-04, newest first
+
+Looking up a slug reads the index and one shard. Listing walks the shards
+newest first using their counts, so a page only reads the shards it spans.
+The site does the same in data/index.ts (findArticle, listArticles).
+
+Usage:
+  python scripts/article_archive.py list                    # First page, newest first
+  python scripts/article_archive.py list --page 3 --per-page 10
+  python scripts/article_archive.py get some-old-slug
+  python scripts/article_archive.py stats
+
+add_article.py archives trimmed articles through DataStore.archive, in the
+same transaction that rewrites articles.json.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, JsonTransaction
+
+log = setup_logger("article-archive")
+
+ARCHIVE_VERSION = 1
+_MONTH = re.compile(r"\d{4}-(0[1-9]|1[0-2])")
+
+
+def shard_of(article: dict) -> str:
+    """The month shard ("YYYY-MM") an article belongs to. Raises ValueError on a malformed date."""
+    date = article.get("date")
+    month = date[:7] if isinstance(date, str) else ""
+    if not _MONTH.fullmatch(month):
+        raise ValueError(f"Article '{article.get('slug')}' has date {date!r}, expected YYYY-MM-DD")
+    return month
+
+
+class ArticleArchive:
+    """Lazily loaded archive index + shards, with dirty tracking for write-back."""
+
+    def __init__(self, directory: Path | None = None, read: Callable[[Path], Any] = read_json) -> None:
+        self.directory = directory or config.archive_dir
+        self._read = read
+        self._index: dict | None = None
+        self._shards: dict[str, list[dict]] = {}
+        self._dirty: set[str] = set()
+
+    # ── Data ─────────────────────────────────────────────────────────────
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / "index.json"
+
+    def shard_path(self, month: str) -> Path:
+        return self.directory / f"{month}.json"
+
+    @property
+    def index(self) -> dict:
+        if self._index is None:
+            if self.index_path.exists():
+                self._index = self._read(self.index_path)
+            else:
+                self._index = {"version": ARCHIVE_VERSION, "shards": {}, "slugs": {}}
+        return self._index
+
+    def shard(self, month: str) -> list[dict]:
+        """One month's articles, newest first (read on first access)."""
+        if month not in self._shards:
+            path = self.shard_path(month)
+            self._shards[month] = self._read(path) if path.exists() else []
+        return self._shards[month]
+
+    @property
+    def slugs(self) -> dict[str, str]:
+        """slug → shard, for every archived article."""
+        return self.index["slugs"]
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self.slugs
+
+    def get(self, slug: str) -> dict | None:
+        month = self.slugs.get(slug)
+        if month is None:
+            return None
+        return next((a for a in self.shard(month) if a["slug"] == slug), None)
+
+    def slice(self, offset: int, limit: int) -> list[dict]:
+        """Archived articles [offset, offset + limit), newest first."""
+        out: list[dict] = []
+        for month, count in self.index["shards"].items():
+            if len(out) >= limit:
+                break
+            if offset >= count:
+                offset -= count
+                continue
+            out += self.shard(month)[offset:offset + limit - len(out)]
+            offset = 0
+        return out
+
+    def page(self, page: int = 1, per_page: int = 20) -> tuple[list[dict], int]:
+        """(articles on a 1-based page, total archived)."""
+        return self.slice((page - 1) * per_page, per_page), len(self)
+
+    # ── Mutation ─────────────────────────────────────────────────────────
+
+    def add(self, articles: list[dict]) -> None:
+        """
+        Archive articles; an already archived slug is replaced (and re-sharded).
+        Every date is checked first, so a malformed one changes nothing.
+        """
+        months = [shard_of(article) for article in articles]
+        index = self.index
+        for article, month in zip(articles, months):
+            previous = index["slugs"].get(article["slug"])
+            if previous is not None:
+                self._remove(previous, article["slug"])
+            self.shard(month).insert(0, article)
+            index["slugs"][article["slug"]] = month
+            self._dirty.add(month)
+        for month in self._dirty:
+            # Newest first; on equal dates the most recently archived goes first
+            self.shard(month).sort(key=lambda a: a["date"], reverse=True)
+        counts = {m: len(self.shard(m)) for m in {*index["shards"], *self._dirty}}
+        index["shards"] = {m: counts[m] for m in sorted(counts, reverse=True) if counts[m]}
+
+    def touch(self, month: str) -> None:
+        """Mark a shard edited in place, so write() stages it."""
+        self._dirty.add(month)
+
+    def _remove(self, month: str, slug: str) -> None:
+        shard = self.shard(month)
+        shard[:] = [a for a in shard if a["slug"] != slug]
+        del self.index["slugs"][slug]
+        self._dirty.add(month)
+
+    @property
+    def dirty_paths(self) -> list[Path]:
+        if not self._dirty:
+            return []
+        return [self.shard_path(m) for m in sorted(self._dirty)] + [self.index_path]
+
+    def write(self, txn: JsonTransaction) -> list[Path]:
+        """Stage every changed shard and the index in txn. Returns their paths."""
+        paths = self.dirty_paths
+        for month in self._dirty:
+            txn.write(self.shard_path(month), self.shard(month))
+        if paths:
+            txn.write(self.index_path, self.index, indent=None)
+        self._dirty.clear()
+        return paths
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Month-sharded article archive")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("list", help="One page of archived articles, newest first")
+    p.add_argument("--page", type=int, default=1)
+    p.add_argument("--per-page", type=int, default=20)
+    p = sub.add_parser("get", help="Print one archived article as JSON")
+    p.add_argument("slug")
+    sub.add_parser("stats", help="Articles per shard")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    archive = ArticleArchive()
+
+    if args.command == "get":
+        article = archive.get(args.slug)
+        if article is None:
+            log.error(f"No archived article '{args.slug}'")
+            sys.exit(1)
+        print(json.dumps(article, indent=2, ensure_ascii=False))
+    elif args.command == "list":
+        articles, total = archive.page(args.page, args.per_page)
+        pages = max(1, -(-total // args.per_page))
+        print(f"Page {args.page}/{pages} ({total} archived)")
+        for a in articles:
+            print(f"  {a['date']}  {a['slug']:<50} {a['title']}")
+    else:
+        for month, count in archive.index["shards"].items():
+            print(f"  {month}  {count:>5}")
+        print(f"  total    {len(archive):>5} in {len(archive.index['shards'])} shard(s)")
+
+
+if __name__ == "__main__":
+    main()
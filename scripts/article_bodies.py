@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+article_bodies.py — Content-addressed article bodies.
+
+articles.json and the archive shards hold only card metadata. Each entry's
+"body" is the hash of its paragraphs, stored once in data/content/:
+
+  data/articles.json          [{"slug": ..., "title": ..., ..., "body": "3f2a9c0d1b7e4a65"}, ...]
+  data/content/3f2a9c0d1b7e4a65.json   ["paragraph 1", "paragraph 2", ...]
+
+The hash is the first 16 hex digits of the SHA-256 of the compact JSON of
+the paragraph list, so a body file never changes once written and can be
+cached forever (/api/content/{hash} serves it that way). Identical bodies
+share one file. Only the article page reads a body (data/index.ts,
+getArticleBody); listings, the sitemap and OG images read metadata only.
+
+Usage:
+  python scripts/article_bodies.py migrate              # Move inline "content" into data/content/
+  python scripts/article_bodies.py migrate --dry-run
+  python scripts/article_bodies.py verify               # Every body present and matching its hash
+  python scripts/article_bodies.py stats
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, JsonTransaction
+
+log = setup_logger("article-bodies")
+
+HASH_CHARS = 16
+
+
+def body_hash(content: list[str]) -> str:
+    """Content address of a paragraph list. Keep in step with the check in __tests__/data.test.ts."""
+    raw = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:HASH_CHARS]
+
+
+class ArticleBodies:
+    """Write-once body files under config.content_dir, staged through a transaction."""
+
+    def __init__(self, directory: Path | None = None, read: Callable[[Path], Any] = read_json) -> None:
+        self.directory = directory or config.content_dir
+        self._read = read
+        self._new: dict[str, list[str]] = {}
+
+    def path(self, digest: str) -> Path:
+        return self.directory / f"{digest}.json"
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._new or self.path(digest).exists()
+
+    def get(self, digest: str) -> list[str]:
+        if digest in self._new:
+            return self._new[digest]
+        return self._read(self.path(digest))
+
+    def put(self, content: list[str]) -> str:
+        """Store a body (once) and return its hash."""
+        digest = body_hash(content)
+        if digest not in self:
+            self._new[digest] = content
+        return digest
+
+    def hydrate(self, article: dict) -> dict:
+        """A manifest entry with its "content" filled in (entries with inline content pass through)."""
+        if "content" in article:
+            return article
+        return {**article, "content": self.get(article["body"])}
+
+    def stored(self) -> list[str]:
+        """Hashes of every body file on disk."""
+        return sorted(p.stem for p in self.directory.glob("*.json")) if self.directory.exists() else []
+
+    @property
+    def dirty_paths(self) -> list[Path]:
+        return [self.path(d) for d in sorted(self._new)]
+
+    def write(self, txn: JsonTransaction) -> list[Path]:
+        """Stage new body files in txn. Returns their paths."""
+        paths = self.dirty_paths
+        if paths:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        for digest, content in self._new.items():
+            txn.write(self.path(digest), content, indent=None)
+        self._new.clear()
+        return paths
+
+
+def manifest_entry(article: dict, bodies: ArticleBodies) -> dict:
+    """article without its inline "content", pointing at the stored body instead."""
+    if "content" not in article:
+        return article
+    entry = {k: v for k, v in article.items() if k != "content"}
+    entry["body"] = bodies.put(article["content"])
+    return entry
+
+
+def all_articles(store) -> list[dict]:
+    """articles.json plus every archive shard, bodies included."""
+    articles = list(store.articles)
+    for month in store.archive.index["shards"]:
+        articles += store.archive.shard(month)
+    return [store.bodies.hydrate(a) for a in articles]
+
+
+def _lists(store) -> Iterable[tuple[str, list[dict]]]:
+    yield "articles.json", store.articles.items
+    for month in store.archive.index["shards"]:
+        yield f"archive/{month}.json", store.archive.shard(month)
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Content-addressed article bodies")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("migrate", help="Move inline content out of articles.json and the archive")
+    p.add_argument("--dry-run", action="store_true")
+    sub.add_parser("verify", help="Check every referenced body exists and matches its hash")
+    sub.add_parser("stats", help="Manifest and body sizes")
+    return parser.parse_args()
+
+
+def _migrate(dry_run: bool) -> None:
+    from datastore import open_store
+    with open_store() as store:
+        moved = 0
+        for name, items in _lists(store):
+            inline = [i for i, a in enumerate(items) if "content" in a]
+            for i in inline:
+                items[i] = manifest_entry(items[i], store.bodies)
+            if inline:
+                if name != "articles.json":
+                    store.archive.touch(name.removeprefix("archive/").removesuffix(".json"))
+                log.info(f"  {name}: {len(inline)} bodies moved")
+            moved += len(inline)
+        if not moved:
+            log.info("Nothing to migrate: no inline content left")
+            return
+        new = len(store.bodies.dirty_paths)
+        if dry_run:
+            log.info(f"[DRY RUN] Would move {moved} bodies into {new} new file(s) under {config.content_dir}")
+            return
+        store.commit()
+        log.info(f"Moved {moved} bodies into {new} new file(s) under {config.content_dir}")
+
+
+def _verify() -> int:
+    from datastore import DataStore
+    store = DataStore()
+    problems = 0
+    referenced = set()
+    for name, items in _lists(store):
+        for a in items:
+            if "content" in a:
+                log.error(f"  {name}: '{a['slug']}' still has inline content (run migrate)")
+                problems += 1
+                continue
+            referenced.add(a["body"])
+            if a["body"] not in store.bodies:
+                log.error(f"  {name}: '{a['slug']}' body {a['body']} is missing")
+                problems += 1
+            elif body_hash(store.bodies.get(a["body"])) != a["body"]:
+                log.error(f"  {name}: '{a['slug']}' body {a['body']} does not match its hash")
+                problems += 1
+    unreferenced = set(store.bodies.stored()) - referenced
+    log.info(f"{len(referenced)} bodies referenced, {len(unreferenced)} unreferenced, {problems} problem(s)")
+    return problems
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.command == "migrate":
+        _migrate(args.dry_run)
+    elif args.command == "verify":
+        sys.exit(1 if _verify() else 0)
+    else:
+        bodies = ArticleBodies()
+        files = [bodies.path(d) for d in bodies.stored()]
+        manifest = config.articles_path.stat().st_size
+        total = sum(p.stat().st_size for p in files)
+        print(f"  articles.json  {manifest / 1024:>8.1f} KB")
+        print(f"  bodies         {total / 1024:>8.1f} KB in {len(files)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
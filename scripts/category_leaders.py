@@ -0,0 +1,114 @@
+"""
+category_leaders.py — Pick the leader of every category in categories.json.
+
+Each category is ranked by a signal and a candidate pool:
+
+  signal  the category's arena board (CATEGORY_RULES) when any of our models
+          has a score there, otherwise our own overall Elo (models.json,
+          so manual --set overrides count)
+  pool    models whose `strengths` include the category name. On a board,
+          or for rules with tagged_only=False, every model is ranked and the
+          tag is only a tie-break. An empty pool falls back to every model.
+
+Ties break deterministically: signal, strength tag, overall Elo, then id.
+Every pick carries a one-line reason for the run log.
+
+    picks = pick_leaders(categories, models, boards)
+    picks["Coding & Engineering"].reason
+    # "1512 on text/coding (tag: yes, next: gemini 1498)"
+"""
+
+from dataclasses import dataclass
+from typing import NamedTuple
+
+
+@dataclass(frozen=True)
+class CategoryRule:
+    """How one category is ranked. Categories without a rule use the default."""
+    board: str | None = None   # arena board ranking every model; None → overall Elo
+    tagged_only: bool = True   # off the board, rank only models tagged with the category
+
+
+CATEGORY_RULES: dict[str, CategoryRule] = {
+    "Overall Preference": CategoryRule(tagged_only=False),
+    "Coding & Engineering": CategoryRule(board="text/coding"),
+    "Hard Reasoning & Science": CategoryRule(board="text/hard_prompts"),
+}
+DEFAULT_RULE = CategoryRule()
+
+
+class LeaderPick(NamedTuple):
+    model_id: str
+    name: str
+    reason: str
+
+
+def strength_index(models: list[dict]) -> dict[str, list[dict]]:
+    """strength tag → models carrying it, in catalog order."""
+    index: dict[str, list[dict]] = {}
+    for model in models:
+        for strength in model.get("strengths", ()):
+            index.setdefault(strength, []).append(model)
+    return index
+
+
+def _pick(
+    category: str,
+    rule: CategoryRule,
+    models: list[dict],
+    tagged: list[dict],
+    board_scores: dict[str, float],
+) -> LeaderPick:
+    tagged_ids = {m["id"] for m in tagged}
+    on_board = any(m["id"] in board_scores for m in models)
+    pool = tagged if rule.tagged_only and tagged and not on_board else models
+
+    def signal(model: dict) -> float:
+        if on_board:
+            return board_scores.get(model["id"], float("-inf"))
+        return model["elo"]
+
+    # Best first: signal, then strength tag, overall Elo, id (ascending)
+    ranked = sorted(
+        pool,
+        key=lambda m: (-signal(m), m["id"] not in tagged_ids, -m["elo"], m["id"]),
+    )
+    best = ranked[0]
+
+    basis = f"{signal(best):.0f} on {rule.board}" if on_board else f"Elo {best['elo']}"
+    scope = (
+        f"among {len(pool)} model(s) tagged '{category}'"
+        if pool is tagged
+        else f"tag: {'yes' if best['id'] in tagged_ids else 'no'}"
+    )
+    reason = f"{basis} ({scope}"
+    if len(ranked) > 1:
+        runner_up = ranked[1]
+        score = signal(runner_up)
+        shown = f"{score:.0f}" if score > float("-inf") else "unrated"
+        reason += f", next: {runner_up['id']} {shown}"
+        if score == signal(best):
+            reason += ", tie broken by tag/Elo/id"
+    if rule.tagged_only and not tagged:
+        reason += ", no model tagged — ranked all"
+    return LeaderPick(best["id"], best["name"], reason + ")")
+
+
+def pick_leaders(
+    categories: list[dict],
+    models: list[dict],
+    boards: dict[str, dict[str, float]] | None = None,
+) -> dict[str, LeaderPick]:
+    """Category name → LeaderPick, for every category, in one pass."""
+    if not models:
+        return {}
+    by_strength = strength_index(models)
+    boards = boards or {}
+    picks = {}
+    for cat in categories:
+        name = cat["name"]
+        rule = CATEGORY_RULES.get(name, DEFAULT_RULE)
+        board_scores = boards.get(rule.board, {}) if rule.board else {}
+        picks[name] = _pick(name, rule, models, by_strength.get(name, []), board_scores)
+    return picks
+
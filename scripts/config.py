@@ -19,12 +19,28 @@ DATA_DIR = PROJECT_ROOT / "data"
 class Config:
     # Paths
     models_path: Path = DATA_DIR / "models.json"
+    open_weight_models_path: Path = DATA_DIR / "open_weight_models.json"
     categories_path: Path = DATA_DIR / "categories.json"
     articles_path: Path = DATA_DIR / "articles.json"
+    content_dir: Path = DATA_DIR / "content"  # article bodies by hash, see article_bodies.py
+    archive_dir: Path = DATA_DIR / "archive"  # month shards of trimmed articles
+    search_index_path: Path = DATA_DIR / "search_index.json"  # see search_index.py
+    minhash_index_path: Path = DATA_DIR / "minhash_index.json"  # see near_duplicates.py
     site_path: Path = DATA_DIR / "site.json"
+    arena_history_dir: Path = DATA_DIR / "arena_history"  # git-ignored, rebuilt by ingest
+    arena_analytics_path: Path = DATA_DIR / "arena_analytics.json"
+    recommend_index_path: Path = DATA_DIR / "recommend_index.json"
+    leaderboard_fingerprint_path: Path = DATA_DIR / "cache" / "leaderboard_fingerprint.json"
+    elo_log_path: Path = DATA_DIR / "elo_log.jsonl"        # append-only, see elo_log.py
+    elo_series_path: Path = DATA_DIR / "elo_series.json"   # compacted elo_log
+    recommend_fixture_path: Path = PROJECT_ROOT / "__tests__" / "fixtures" / "recommend_cases.json"
+    local_leaderboard_path: Path = DATA_DIR / "local_leaderboard.json"
+    local_eval_suite_path: Path = PROJECT_ROOT / "scripts" / "evals" / "local_suite.json"
+    local_eval_results_path: Path = DATA_DIR / "cache" / "local_eval_results.jsonl"  # resume log
 
     # Article insertion
     max_articles: int = 10  # max articles to keep in articles.json
+    near_duplicate_threshold: float = 0.7  # estimated shingle Jaccard; at or above, reject
 
     def validate(self) -> list[str]:
         """Return list of issues, empty if all good."""
@@ -0,0 +1,245 @@
+"""
+datastore.py — Indexed, lazily loaded view of the data/*.json files.
+
+    from datastore import open_store
+
+    with open_store() as store:             # takes the data/ write lock
+        claude = store.models.get("claude")  # O(1) by id
+        claude["elo"] = 1510
+        store.site["lastUpdated"] = today_iso()
+        store.commit()                      # writes models.json + site.json only
+
+Each file is read at most once, on first access. Collections index their
+items by unique keys (id / slug / name) and group them by non-unique ones
+(provider); indexes are built on first lookup and dropped whenever the
+collection is mutated through its methods. Edit an indexed field in place
+and call reindex().
+
+A file is dirty when its content differs from what was loaded, so in-place
+edits are picked up without bookkeeping. Collection.changes() gives the
+JSON Patch since load. commit() writes only dirty files, all in one
+JsonTransaction (see utils.json_transaction), article bodies, archive shards,
+the search and near-duplicate indexes and Elo log lines included.
+"""
+
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import json_transaction, JsonTransaction
+from json_diff import diff, Diff
+from article_archive import ArticleArchive
+from article_bodies import ArticleBodies
+from search_index import SearchIndex
+from near_duplicates import MinHashIndex
+from elo_log import EloChange, append_changes
+
+
+def _snapshot(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+
+class Collection:
+    """A data file holding a list of dicts, with lazy key indexes."""
+
+    def __init__(
+        self,
+        path: Path,
+        load: Callable[[Path], Any],
+        unique: tuple[str, ...],
+        multi: tuple[str, ...] = (),
+    ) -> None:
+        self.path = path
+        self.key = unique[0]
+        self._load = load
+        self._unique = unique
+        self._multi = multi
+        self._items: list[dict] | None = None
+        self._loaded = ""
+        self._indexes: dict[str, dict[Any, Any]] = {}
+
+    # ── Data ─────────────────────────────────────────────────────────────
+
+    @property
+    def loaded(self) -> bool:
+        return self._items is not None
+
+    @property
+    def items(self) -> list[dict]:
+        """The underlying list (loaded on first access). Edit items in place freely."""
+        if self._items is None:
+            self._items = self._load(self.path)
+            self._loaded = _snapshot(self._items)
+        return self._items
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def dirty(self) -> bool:
+        return self._items is not None and _snapshot(self._items) != self._loaded
+
+    def changes(self) -> Diff:
+        """Structural diff (JSON Patch + readable lines) against the loaded content."""
+        if self._items is None:
+            return Diff()
+        return diff(json.loads(self._loaded), self._items)
+
+    def mark_clean(self) -> None:
+        """Treat the current content as what is on disk (after a commit)."""
+        if self._items is not None:
+            self._loaded = _snapshot(self._items)
+
+    # ── Lookups ──────────────────────────────────────────────────────────
+
+    def _index(self, field: str) -> dict[Any, Any]:
+        index = self._indexes.get(field)
+        if index is None:
+            if field in self._unique:
+                index = {item[field]: item for item in self.items if field in item}
+            elif field in self._multi:
+                index = {}
+                for item in self.items:
+                    index.setdefault(item.get(field), []).append(item)
+            else:
+                raise KeyError(f"{self.path.name} is not indexed by '{field}'")
+            self._indexes[field] = index
+        return index
+
+    def get(self, value: Any, field: str | None = None) -> dict | None:
+        """The item whose unique field (default: the primary key) equals value."""
+        return self._index(field or self.key).get(value)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._index(self.key)
+
+    def find(self, field: str, value: Any) -> list[dict]:
+        """Every item whose non-unique field equals value (e.g. all of a provider's models)."""
+        return list(self._index(field).get(value, ()))
+
+    def reindex(self) -> None:
+        """Drop the indexes after editing an indexed field in place."""
+        self._indexes.clear()
+
+    # ── Mutation ─────────────────────────────────────────────────────────
+
+    def insert(self, position: int, item: dict) -> None:
+        """Insert item, refusing a duplicate primary key."""
+        if item[self.key] in self:
+            raise ValueError(f"{self.path.name}: duplicate {self.key} '{item[self.key]}'")
+        self.items.insert(position, item)
+        self.reindex()
+
+    def add(self, item: dict) -> None:
+        self.insert(len(self.items), item)
+
+    def remove(self, value: Any) -> dict:
+        """Remove and return the item with this primary key."""
+        item = self.get(value)
+        if item is None:
+            raise KeyError(f"{self.path.name}: no {self.key} '{value}'")
+        self.items.remove(item)
+        self.reindex()
+        return item
+
+    def replace(self, items: list[dict]) -> None:
+        """Swap in a whole new list (e.g. after trimming)."""
+        self.items[:] = items
+        self.reindex()
+
+    def sort(self, key: Callable[[dict], Any], reverse: bool = False) -> None:
+        self.items.sort(key=key, reverse=reverse)
+
+
+class DataStore:
+    """Lazily loaded, indexed data/ files with dirty-tracking write-back."""
+
+    def __init__(self, txn: JsonTransaction | None = None) -> None:
+        self._txn = txn or JsonTransaction()
+        read = self._txn.read
+        self.models = Collection(config.models_path, read, ("id", "name"), ("provider",))
+        self.open_weight_models = Collection(
+            config.open_weight_models_path, read, ("id", "name"), ("provider",)
+        )
+        self.categories = Collection(config.categories_path, read, ("name",))
+        self.articles = Collection(config.articles_path, read, ("slug",))
+        self.archive = ArticleArchive(config.archive_dir, read)
+        self.bodies = ArticleBodies(config.content_dir, read)
+        self.search = SearchIndex(config.search_index_path, read)
+        self.near_duplicates = MinHashIndex(config.minhash_index_path, read)
+        self._site: dict | None = None
+        self._site_loaded = ""
+
+    @property
+    def site(self) -> dict:
+        if self._site is None:
+            self._site = self._txn.read(config.site_path)
+            self._site_loaded = _snapshot(self._site)
+        return self._site
+
+    @property
+    def catalogs(self) -> dict[str, Collection]:
+        """Model catalogs by data file stem — the keys of arena.CATALOG_NAME_MAPS."""
+        return {"models": self.models, "open_weight_models": self.open_weight_models}
+
+    @property
+    def collections(self) -> tuple[Collection, ...]:
+        return self.models, self.open_weight_models, self.categories, self.articles
+
+    def dirty_paths(self) -> list[Path]:
+        """Files whose content changed since they were loaded."""
+        paths = [c.path for c in self.collections if c.dirty]
+        if self._site is not None and _snapshot(self._site) != self._site_loaded:
+            paths.append(config.site_path)
+        return paths + [
+            *self.bodies.dirty_paths,
+            *self.archive.dirty_paths,
+            *self.search.dirty_paths,
+            *self.near_duplicates.dirty_paths,
+        ]
+
+    def commit(
+        self,
+        derived: dict[Path, Any] | None = None,
+        elo_changes: Iterable[EloChange] = (),
+    ) -> list[Path]:
+        """
+        Write every dirty file in one transaction, plus any derived files
+        (built from this data, e.g. the recommend index; written compact)
+        and elo_changes appended to the Elo log. Returns the paths written.
+        """
+        paths = self.dirty_paths()
+        for path, data in (derived or {}).items():
+            self._txn.write(path, data, indent=None)
+        if append_changes(elo_changes, self._txn):
+            paths.append(config.elo_log_path)
+        for c in self.collections:
+            if c.path in paths:
+                self._txn.write(c.path, c.items)
+                c.mark_clean()
+        if config.site_path in paths:
+            self._txn.write(config.site_path, self._site)
+            self._site_loaded = _snapshot(self._site)
+        self.bodies.write(self._txn)
+        self.archive.write(self._txn)
+        self.search.write(self._txn)
+        self.near_duplicates.write(self._txn)
+        self._txn.commit()
+        return paths + list(derived or {})
+
+
+@contextmanager
+def open_store() -> Iterator[DataStore]:
+    """
+    A DataStore whose reads and commit happen under the data/ write lock.
+    Nothing is written unless the block calls commit().
+    """
+    with json_transaction() as txn:
+        yield DataStore(txn)
@@ -38,7 +38,7 @@ import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from utils import setup_logger, read_json, write_json, today_iso
+from utils import setup_logger, read_json, write_json, today_iso, file_lock
 from config import config
 
 try:
@@ -222,16 +222,18 @@ def update_azure(tag: str, dry_run: bool = False) -> None:
 def verify_health(dry_run: bool = False) -> None:
     """Step 5: Wait for the site to come up and verify it's healthy."""
     if dry_run:
-        log.info("[DRY RUN] Would verify health at {SITE_URL}")
+        log.info(f"[DRY RUN] Would verify health at {SITE_URL}")
         return
 
     import requests
+    import http_client
 
     log.info(f"Waiting for {SITE_URL} to come up...")
     for attempt in range(1, 7):
         time.sleep(10)
         try:
-            resp = requests.get(SITE_URL, timeout=10)
+            # This loop is the retry policy — one attempt per poll
+            resp = http_client.get(SITE_URL, timeout=10, retries=0)
             if resp.status_code == 200 and "Hello" in resp.text:
                 log.info(f"  ✅ Site is healthy (attempt {attempt}, status {resp.status_code})")
                 return
@@ -283,11 +285,14 @@ def main() -> None:
         write_version(new_version)
 
     # ── Build ───────────────────────────────────────────
-    if not args.skip_build:
-        build_app(dry_run=args.dry_run)
+    # The app build and the image both read data/; holding the data/ lock
+    # keeps a concurrent update from publishing half its files meanwhile
+    with file_lock():
+        if not args.skip_build:
+            build_app(dry_run=args.dry_run)
+        build_image(new_version, dry_run=args.dry_run)
 
     # ── Docker ──────────────────────────────────────────
-    build_image(new_version, dry_run=args.dry_run)
     push_image(new_version, dry_run=args.dry_run)
 
     # ── Azure ───────────────────────────────────────────
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+elo_log.py — Append-only history of the Elo values WE publish.
+
+update_leaderboard.py appends one line per changed model per run — arena
+refreshes, --set overrides and --add-model alike — so curated values the
+upstream arena history never saw are kept. Lines are compact JSON arrays:
+
+  ["2026-10-18", "models", "claude", "arena", 1503, 1512]
+   date          catalog   model ID  source   old   new
+
+Usage:
+  python scripts/elo_log.py compact                         # Fold the log into the series file
+  python scripts/elo_log.py series claude                   # Every recorded value
+  python scripts/elo_log.py sparkline claude --days 180 --points 24
+  python scripts/elo_log.py sparkline gemma --catalog open_weight_models
+
+`compact` folds data/elo_log.jsonl into data/elo_series.json (per-model
+date/value arrays) and empties the log. The series file records the length
+and hash of the log it folded ("folded"), so if the log survives a crash
+its folded lines are skipped rather than counted twice. Queries read the
+series file plus whatever the log has gained since, so compaction never
+changes an answer.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from array import array
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, write_json, file_lock, today_iso, JsonTransaction
+
+log = setup_logger("elo-log")
+
+SOURCES = ("arena", "override", "manual")
+_BARS = "▁▂▃▄▅▆▇█"
+
+
+class EloChange(NamedTuple):
+    date: str       # YYYY-MM-DD
+    catalog: str    # data file stem: "models" / "open_weight_models"
+    model_id: str
+    source: str     # one of SOURCES
+    old: int | None  # None when the model was just added
+    new: int
+
+
+class EloSeries:
+    """One model's published Elo over time: parallel day-ordinal / value arrays."""
+
+    def __init__(self) -> None:
+        self.days = array("I")
+        self.elo = array("i")
+
+    def append(self, day: str, elo: int) -> None:
+        """Add a point; a repeat of the last (date, value) is ignored."""
+        ordinal = date.fromisoformat(day).toordinal()
+        if self.days and self.days[-1] == ordinal and self.elo[-1] == elo:
+            return
+        self.days.append(ordinal)
+        self.elo.append(elo)
+
+    def points(self) -> list[tuple[str, int]]:
+        return [(date.fromordinal(d).isoformat(), e) for d, e in zip(self.days, self.elo)]
+
+    def value_on(self, ordinal: int) -> int | None:
+        """The value in effect on a day (last change on or before it)."""
+        lo, hi = 0, len(self.days)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.days[mid] <= ordinal:
+                lo = mid + 1
+            else:
+                hi = mid
+        return self.elo[lo - 1] if lo else None
+
+    def to_json(self) -> dict:
+        return {"days": self.days.tolist(), "elo": self.elo.tolist()}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "EloSeries":
+        series = cls()
+        series.days.extend(data["days"])
+        series.elo.extend(data["elo"])
+        return series
+
+
+# ─── Log ────────────────────────────────────────────────────────────────────
+
+def append_changes(
+    changes: Iterable[EloChange], txn: JsonTransaction, path: Path | None = None
+) -> int:
+    """Stage changes as log lines in txn, written with its other files. Returns the number staged."""
+    path = path or config.elo_log_path
+    lines = [json.dumps(list(change), ensure_ascii=False) + "\n" for change in changes]
+    if lines:
+        txn.append_lines(path, lines)
+    return len(lines)
+
+
+def _parse(raw: bytes) -> list[EloChange]:
+    return [EloChange(*json.loads(line)) for line in raw.decode("utf-8").splitlines() if line.strip()]
+
+
+def read_log(path: Path | None = None) -> list[EloChange]:
+    path = path or config.elo_log_path
+    return _parse(path.read_bytes()) if path.exists() else []
+
+
+def _unfolded(raw: bytes, folded: dict | None) -> bytes:
+    """The part of the log not yet in the series file (see compact)."""
+    if folded and len(raw) >= folded["bytes"]:
+        if hashlib.sha256(raw[:folded["bytes"]]).hexdigest() == folded["sha256"]:
+            return raw[folded["bytes"]:]
+    return raw
+
+
+def _fold(series: dict[str, EloSeries], changes: Iterable[EloChange]) -> None:
+    for change in changes:
+        key = f"{change.catalog}/{change.model_id}"
+        s = series.get(key)
+        if s is None:
+            s = series[key] = EloSeries()
+            if change.old is not None:
+                # The value before the first logged change, dated the day before
+                before = date.fromisoformat(change.date) - timedelta(days=1)
+                s.append(before.isoformat(), change.old)
+        s.append(change.date, change.new)
+
+
+# ─── Store ──────────────────────────────────────────────────────────────────
+
+class EloLog:
+    """Compacted series + uncompacted log tail, queried as one."""
+
+    def __init__(self, log_path: Path | None = None, series_path: Path | None = None) -> None:
+        self.log_path = log_path or config.elo_log_path
+        self.series_path = series_path or config.elo_series_path
+        self.series: dict[str, EloSeries] = {}
+        self.folded: dict | None = None
+        if self.series_path.exists():
+            data = read_json(self.series_path)
+            self.series = {key: EloSeries.from_json(s) for key, s in data["series"].items()}
+            self.folded = data.get("folded")
+        self._log = self.log_path.read_bytes() if self.log_path.exists() else b""
+        self._tail = _parse(_unfolded(self._log, self.folded))
+        _fold(self.series, self._tail)
+
+    def compact(self) -> int:
+        """
+        Write the series file and empty the log. Returns the lines folded.
+        The series file records the length and SHA-256 of the log it now
+        covers, so after a crash between the two steps the surviving log's
+        folded prefix is recognised and skipped instead of folded again.
+        """
+        write_json(
+            self.series_path,
+            {
+                "folded": {"bytes": len(self._log), "sha256": hashlib.sha256(self._log).hexdigest()},
+                "series": {key: s.to_json() for key, s in sorted(self.series.items())},
+            },
+            indent=None,
+        )
+        if self.log_path.exists():
+            self.log_path.write_text("", encoding="utf-8")
+        folded = len(self._tail)
+        self.folded, self._log, self._tail = None, b"", []
+        return folded
+
+    def get(self, model_id: str, catalog: str = "models") -> EloSeries | None:
+        return self.series.get(f"{catalog}/{model_id}")
+
+    def sparkline(
+        self,
+        model_id: str,
+        catalog: str = "models",
+        days: int = 90,
+        points: int = 30,
+        end: str | None = None,
+    ) -> list[int | None]:
+        """
+        `points` evenly spaced samples over the `days` days ending on `end`
+        (default today), each the value in effect that day; None before the
+        model's first recorded value.
+        """
+        series = self.get(model_id, catalog)
+        if series is None:
+            return []
+        last = date.fromisoformat(end or today_iso()).toordinal()
+        first = last - days
+        step = days / max(points - 1, 1)
+        return [series.value_on(round(first + i * step)) for i in range(points)]
+
+
+def render_sparkline(values: list[int | None]) -> str:
+    known = [v for v in values if v is not None]
+    if not known:
+        return ""
+    lo, hi = min(known), max(known)
+    span = (hi - lo) or 1
+    return "".join(
+        " " if v is None else _BARS[round((v - lo) / span * (len(_BARS) - 1))]
+        for v in values
+    )
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="History of published Elo values")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("compact", help="Fold the log into the series file")
+
+    for name, help_text in (
+        ("series", "Every recorded value for one model"),
+        ("sparkline", "Resampled values for a sparkline"),
+    ):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("model_id")
+        p.add_argument("--catalog", default="models",
+                       help="models or open_weight_models (default: models)")
+        if name == "sparkline":
+            p.add_argument("--days", type=int, default=90)
+            p.add_argument("--points", type=int, default=30)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.command == "compact":
+        with file_lock():
+            folded = EloLog().compact()
+        log.info(f"Folded {folded} log line(s) into {config.elo_series_path}")
+        return
+
+    history = EloLog()
+    if history.get(args.model_id, args.catalog) is None:
+        log.error(f"No Elo history for '{args.catalog}/{args.model_id}'")
+        sys.exit(1)
+    if args.command == "series":
+        for day, elo in history.get(args.model_id, args.catalog).points():
+            print(f"{day}  {elo}")
+    else:
+        values = history.sparkline(args.model_id, args.catalog, args.days, args.points)
+        print(render_sparkline(values))
+        print(json.dumps(values))
+
+
+if __name__ == "__main__":
+    main()
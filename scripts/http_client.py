@@ -0,0 +1,177 @@
+"""
+http_client.py — Shared HTTP client for HelloAi automation scripts.
+
+Every network call in scripts/ goes through get() so that all of them get:
+  - Keep-alive connection pooling (one pool shared by all threads)
+  - Retries with jittered exponential backoff on connection errors,
+    timeouts and transient statuses (429 / 5xx)
+  - Per-host (connect, read) timeouts
+  - A consistent User-Agent
+  - Per-host request timing metrics (log_metrics() at the end of a run)
+
+    from http_client import get
+    resp = get("https://example.com/data.json", stream=True)
+    resp.raise_for_status()
+
+Errors surface exactly as with requests.get: connection failures raise
+requests.RequestException after the last retry; HTTP error statuses are
+returned for the caller to raise_for_status().
+
+Only failures up to the response are retried: the headers, plus the body
+when it is read inside get() (stream=False). With stream=True the body is
+read by the caller, so a connection lost mid-body (ChunkedEncodingError,
+ConnectionError) reaches the caller unretried; arena.py's streamed sources
+download again themselves.
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger("http")
+
+USER_AGENT = "HelloAi-Bot/1.0 (+https://helloai.com)"
+
+# (connect, read) seconds. Read is per socket read, not the whole body.
+DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 20.0)
+HOST_TIMEOUTS: dict[str, tuple[float, float]] = {
+    "raw.githubusercontent.com": (5.0, 20.0),
+    "github.com": (5.0, 20.0),
+}
+
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5   # seconds; attempt n sleeps uniform(0, min(cap, base * 2**n))
+BACKOFF_CAP = 8.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# ChunkedEncodingError can only come from a body read inside request(),
+# i.e. without stream=True
+_RETRY_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+# One adapter → one urllib3 pool manager, shared by every thread's session.
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+_local = threading.local()
+
+
+@dataclass
+class HostStats:
+    """Request timing for one host (time to response headers)."""
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.requests if self.requests else 0.0
+
+
+_stats: dict[str, HostStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """This thread's session. Sessions aren't thread-safe; the pool underneath is."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        session.mount("https://", _ADAPTER)
+        session.mount("http://", _ADAPTER)
+        _local.session = session
+    return session
+
+
+def _record(host: str, elapsed: float, retried: bool, failed: bool) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(host, HostStats())
+        stats.requests += 1
+        stats.retries += retried
+        stats.failures += failed
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+
+
+def _backoff(attempt: int, resp: requests.Response | None) -> float:
+    """Full-jitter exponential backoff, never shorter than a numeric Retry-After."""
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+    retry_after = resp.headers.get("Retry-After", "") if resp is not None else ""
+    if retry_after.isdigit():
+        delay = max(delay, min(float(retry_after), BACKOFF_CAP))
+    return delay
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    retries: int | None = None,
+    timeout: float | tuple[float, float] | None = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send a request through the shared pooled session, retrying transient failures.
+
+    Args:
+        retries: Extra attempts after the first (default MAX_RETRIES; 0 disables).
+        timeout: Overrides the per-host (connect, read) timeout.
+        **kwargs: Passed through to requests.Session.request (headers, stream, ...).
+    """
+    host = urlsplit(url).hostname or ""
+    if retries is None:
+        retries = MAX_RETRIES
+    if timeout is None:
+        timeout = HOST_TIMEOUTS.get(host, DEFAULT_TIMEOUT)
+
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            resp = _session().request(method, url, timeout=timeout, **kwargs)
+        except _RETRY_EXCEPTIONS as e:
+            _record(host, time.perf_counter() - start, attempt > 0, failed=True)
+            if attempt >= retries:
+                raise
+            delay = _backoff(attempt, None)
+            reason = type(e).__name__
+        else:
+            transient = resp.status_code in RETRY_STATUSES
+            _record(host, time.perf_counter() - start, attempt > 0, failed=transient)
+            if not transient or attempt >= retries:
+                return resp
+            delay = _backoff(attempt, resp)
+            reason = f"HTTP {resp.status_code}"
+            resp.close()
+        attempt += 1
+        log.info(f"{host}: {reason}, retry {attempt}/{retries} in {delay:.1f}s")
+        time.sleep(delay)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET via the shared session. See request() for the extra keyword arguments."""
+    return request("GET", url, **kwargs)
+
+
+def metrics() -> dict[str, HostStats]:
+    """Snapshot of per-host request timing since the process started."""
+    with _stats_lock:
+        return {host: HostStats(**vars(stats)) for host, stats in _stats.items()}
+
+
+def log_metrics(logger: logging.Logger) -> None:
+    """Log one summary line per host contacted during this run."""
+    for host, stats in sorted(metrics().items()):
+        logger.info(
+            f"  HTTP {host}: {stats.requests} request(s), {stats.retries} retried, "
+            f"{stats.failures} failed, mean {stats.mean_seconds:.2f}s, max {stats.max_seconds:.2f}s"
+        )
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+json_diff.py — Structural diff of two JSON documents as RFC 6902 JSON Patch.
+
+Usage:
+  python scripts/json_diff.py old.json new.json           # Human-readable changes
+  python scripts/json_diff.py old.json new.json --patch   # JSON Patch to stdout
+
+    from json_diff import diff, apply_patch
+    d = diff(old_models, new_models)
+    d.patch   # [{"op": "replace", "path": "/0/elo", "value": 1512}, ...]
+    d.lines   # ["  ~ claude.elo: 1503 → 1512", ...]
+    assert apply_patch(old_models, d.patch) == new_models
+
+Every subtree of both documents is hashed once, bottom-up; the walk only
+descends where the hashes differ, so unchanged records and article bodies
+cost one comparison each.
+
+Lists of dicts that all carry a unique "id" or "slug" are matched by that
+key: removals, then moves/adds in the new order, then per-record changes.
+Other lists are aligned by trimming the common prefix and suffix and
+diffing the middle positionally, so an inserted paragraph is one "add".
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+_KEY_FIELDS = ("id", "slug")
+_MAX_SHOWN = 60  # chars of a value shown in a human-readable line
+
+
+@dataclass
+class Diff:
+    patch: list[dict] = field(default_factory=list)
+    lines: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.patch)
+
+
+# ─── Hashing ────────────────────────────────────────────────────────────────
+
+class _Hasher:
+    """Digest of every container in a document, keyed by id(), computed once."""
+
+    def __init__(self) -> None:
+        self._digests: dict[int, bytes] = {}
+        self._keep: list[Any] = []  # keep nodes alive so id()s stay unique
+
+    def __call__(self, node: Any) -> bytes:
+        if isinstance(node, (dict, list)):
+            digest = self._digests.get(id(node))
+            if digest is None:
+                h = hashlib.blake2b(digest_size=16)
+                if isinstance(node, dict):
+                    h.update(b"{")
+                    for key in sorted(node):
+                        h.update(json.dumps(key).encode())
+                        h.update(self(node[key]))
+                else:
+                    h.update(b"[")
+                    for item in node:
+                        h.update(self(item))
+                digest = h.digest()
+                self._digests[id(node)] = digest
+                self._keep.append(node)
+            return digest
+        # Scalars: JSON text distinguishes 1 / 1.0 / true / "1"
+        return hashlib.blake2b(
+            json.dumps(node, ensure_ascii=False).encode(), digest_size=16
+        ).digest()
+
+
+# ─── Paths and labels ───────────────────────────────────────────────────────
+
+def _pointer(parts: list[str | int]) -> str:
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+def _label(parts: list[str | int]) -> str:
+    out = ""
+    for p in parts:
+        out += f"[{p}]" if isinstance(p, int) else (f".{p}" if out else p)
+    return out or "(root)"
+
+
+def _short(value: Any) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= _MAX_SHOWN else text[:_MAX_SHOWN - 1] + "…"
+
+
+def _list_key(old: list, new: list) -> str | None:
+    """The id/slug field that uniquely keys every item of both lists, if any."""
+    for key in _KEY_FIELDS:
+        for items in (old, new):
+            if not all(isinstance(i, dict) and key in i for i in items):
+                break
+            if len({json.dumps(i[key]) for i in items}) != len(items):
+                break
+        else:
+            if old or new:
+                return key
+    return None
+
+
+# ─── Diff ───────────────────────────────────────────────────────────────────
+
+class _Differ:
+    def __init__(self) -> None:
+        self.hash = _Hasher()
+        self.out = Diff()
+
+    def op(self, op: str, parts: list, value: Any = None, from_parts: list | None = None) -> None:
+        entry: dict[str, Any] = {"op": op, "path": _pointer(parts)}
+        if from_parts is not None:
+            entry["from"] = _pointer(from_parts)
+        if op in ("add", "replace"):
+            entry["value"] = copy.deepcopy(value)
+        self.out.patch.append(entry)
+
+    def walk(self, old: Any, new: Any, parts: list, label: list) -> None:
+        if self.hash(old) == self.hash(new):
+            return
+        if isinstance(old, dict) and isinstance(new, dict):
+            self.walk_dict(old, new, parts, label)
+        elif isinstance(old, list) and isinstance(new, list):
+            key = _list_key(old, new)
+            if key:
+                self.walk_keyed(old, new, key, parts, label)
+            else:
+                self.walk_list(old, new, parts, label)
+        else:
+            self.op("replace", parts, new)
+            self.out.lines.append(f"  ~ {_label(label)}: {_short(old)} → {_short(new)}")
+
+    def walk_dict(self, old: dict, new: dict, parts: list, label: list) -> None:
+        for k in old:
+            if k not in new:
+                self.op("remove", parts + [k])
+                self.out.lines.append(f"  - {_label(label + [k])}: {_short(old[k])}")
+        for k in new:
+            if k not in old:
+                self.op("add", parts + [k], new[k])
+                self.out.lines.append(f"  + {_label(label + [k])}: {_short(new[k])}")
+            else:
+                self.walk(old[k], new[k], parts + [k], label + [k])
+
+    def walk_keyed(self, old: list, new: list, key: str, parts: list, label: list) -> None:
+        """Match records by key; emit removes, then moves/adds into new order, then edits."""
+        new_keys = {json.dumps(item[key]) for item in new}
+        by_key = {json.dumps(item[key]): item for item in old}
+
+        # Removals, highest index first so earlier indexes stay valid
+        working = [json.dumps(item[key]) for item in old]
+        for i in range(len(old) - 1, -1, -1):
+            if working[i] not in new_keys:
+                self.op("remove", parts + [i])
+                self.out.lines.append(f"  - Removed: {old[i][key]}")
+                del working[i]
+
+        position = {k: i for i, k in enumerate(working)}
+        for i, item in enumerate(new):
+            k = json.dumps(item[key])
+            if k not in by_key:
+                self.op("add", parts + [i], item)
+                self.out.lines.append(f"  + Added: {item[key]}")
+                working.insert(i, k)
+                position = None
+                continue
+            if position is None:
+                position = {w: j for j, w in enumerate(working)}
+            j = position[k]
+            if j != i:
+                self.op("move", parts + [i], from_parts=parts + [j])
+                working.insert(i, working.pop(j))
+                position = None
+        for i, item in enumerate(new):
+            previous = by_key.get(json.dumps(item[key]))
+            if previous is not None:
+                self.walk(previous, item, parts + [i], label + [str(item[key])])
+
+    def walk_list(self, old: list, new: list, parts: list, label: list) -> None:
+        """Trim the common prefix/suffix by hash, diff the middle by position."""
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and self.hash(old[start]) == self.hash(new[start]):
+            start += 1
+        end_old, end_new = len(old), len(new)
+        while (
+            end_old > start and end_new > start
+            and self.hash(old[end_old - 1]) == self.hash(new[end_new - 1])
+        ):
+            end_old -= 1
+            end_new -= 1
+
+        common = min(end_old, end_new) - start
+        for offset in range(common):
+            i = start + offset
+            self.walk(old[i], new[i], parts + [i], label + [i])
+        for i in range(end_old - 1, start + common - 1, -1):
+            self.op("remove", parts + [i])
+            self.out.lines.append(f"  - {_label(label + [i])}: {_short(old[i])}")
+        for i in range(start + common, end_new):
+            self.op("add", parts + [i], new[i])
+            self.out.lines.append(f"  + {_label(label + [i])}: {_short(new[i])}")
+
+
+def diff(old: Any, new: Any) -> Diff:
+    """Structural diff of two JSON values: a JSON Patch plus one line per change."""
+    differ = _Differ()
+    differ.walk(old, new, [], [])
+    return differ.out
+
+
+# ─── Apply ──────────────────────────────────────────────────────────────────
+
+def _parse_pointer(pointer: str) -> list[str]:
+    if not pointer:
+        return []
+    return [p.replace("~1", "/").replace("~0", "~") for p in pointer[1:].split("/")]
+
+
+def _resolve(doc: Any, tokens: list[str]) -> tuple[Any, str | int]:
+    """(container, key/index) addressed by the pointer tokens."""
+    node = doc
+    for token in tokens[:-1]:
+        node = node[int(token)] if isinstance(node, list) else node[token]
+    last = tokens[-1]
+    if isinstance(node, list):
+        return node, len(node) if last == "-" else int(last)
+    return node, last
+
+
+def apply_patch(doc: Any, patch: list[dict]) -> Any:
+    """Apply a JSON Patch (add/remove/replace/move/copy/test) to a copy of doc."""
+    doc = copy.deepcopy(doc)
+    for entry in patch:
+        op, tokens = entry["op"], _parse_pointer(entry["path"])
+        if not tokens:  # whole-document operation
+            if op in ("add", "replace"):
+                doc = copy.deepcopy(entry["value"])
+                continue
+            raise ValueError(f"Unsupported root operation: {op}")
+        if op in ("move", "copy"):
+            src, skey = _resolve(doc, _parse_pointer(entry["from"]))
+            value = src.pop(skey) if op == "move" else copy.deepcopy(src[skey])
+            target, key = _resolve(doc, tokens)
+            target.insert(key, value) if isinstance(target, list) else target.__setitem__(key, value)
+            continue
+        target, key = _resolve(doc, tokens)
+        if op == "add":
+            value = copy.deepcopy(entry["value"])
+            target.insert(key, value) if isinstance(target, list) else target.__setitem__(key, value)
+        elif op == "remove":
+            del target[key]
+        elif op == "replace":
+            target[key] = copy.deepcopy(entry["value"])
+        elif op == "test":
+            if target[key] != entry["value"]:
+                raise ValueError(f"JSON Patch test failed at {entry['path']}")
+        else:
+            raise ValueError(f"Unknown JSON Patch op: {op}")
+    return doc
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Structural JSON diff / JSON Patch")
+    parser.add_argument("old", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--patch", action="store_true", help="Print RFC 6902 JSON Patch")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    old = json.loads(args.old.read_text(encoding="utf-8"))
+    new = json.loads(args.new.read_text(encoding="utf-8"))
+    result = diff(old, new)
+    if args.patch:
+        print(json.dumps(result.patch, indent=2, ensure_ascii=False))
+    else:
+        for line in result.lines:
+            print(line)
+    sys.exit(1 if result else 0)
+
+
+if __name__ == "__main__":
+    main()
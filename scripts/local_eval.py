@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+local_eval.py — Evaluate local models over Ollama-compatible endpoints.
+
+Runs the prompt suite (scripts/evals/local_suite.json) against each model
+through POST /api/generate, many prompts in flight at once, grades every
+answer with its case's checks and writes one row per model to
+data/local_leaderboard.json:
+
+  {"model": "gemma3:4b", "avg_score": 80.6, "pass_rate": 100.0, "passed": 12,
+   "total": 12, "response_time": 22.2, "latency": {"p50": 19.8, "p90": 31.0, "p99": 35.2}}
+
+avg_score is the mean share of checks met (0–100); a case passes at the
+suite's pass_score. response_time is the mean seconds per answer and
+latency its percentiles, measured at the client (so time queued on a busy
+endpoint counts). Rows for other models (e.g. hosted baselines) are kept.
+
+Usage:
+  python scripts/local_eval.py gemma3:4b qwen3:4b        # Evaluate, update the leaderboard
+  python scripts/local_eval.py --all                     # Every model the endpoints list
+  python scripts/local_eval.py gemma3:4b --concurrency 8 --fresh
+  python scripts/local_eval.py gemma3:4b --endpoint http://gpu-box:11434 --endpoint http://localhost:11434
+  python scripts/local_eval.py gemma3:4b --dry-run       # Evaluate, write nothing
+
+Resumable: each graded answer is appended to data/cache/local_eval_results.jsonl
+as it arrives, and a model's row is written as soon as its last case is in.
+A rerun skips answers already recorded for the current wording of a case, so
+an interrupted run picks up where it stopped; --fresh re-asks everything.
+
+Endpoints default to $OLLAMA_HOST, else http://localhost:11434. Each model
+is pinned to one endpoint (listing it, if /api/tags says so) so it is loaded
+once; each endpoint has at most --concurrency requests in flight. Ollama
+itself serves OLLAMA_NUM_PARALLEL of them at a time and queues the rest.
+For offline runs: python scripts/local_eval_fixtures.py serve
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, NamedTuple
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, json_transaction, today_iso
+import http_client
+
+log = setup_logger("local-eval")
+
+DEFAULT_ENDPOINT = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+DEFAULT_CONCURRENCY = 4   # per endpoint; http_client keeps 8 pooled connections per host
+DEFAULT_TIMEOUT = 300.0   # seconds to wait for one (non-streamed) answer
+PERCENTILES = (50, 90, 99)
+
+_THINKING = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+
+# ─── Suite ──────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class EvalCase:
+    id: str
+    prompt: str
+    checks: tuple[dict, ...]
+    reference: str = ""   # an answer meeting every check (validated on load)
+
+
+@dataclass
+class Suite:
+    name: str
+    cases: list[EvalCase]
+    pass_score: float = 50.0
+    options: dict = field(default_factory=dict)   # passed to /api/generate
+
+    def version(self, case: EvalCase) -> str:
+        """Changes whenever the case's prompt, checks or the model options do."""
+        key = json.dumps([case.prompt, case.checks, self.options], sort_keys=True)
+        return hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+def _check(check: dict, text: str) -> bool:
+    kind, value = check["type"], check["value"]
+    if kind == "contains":
+        return value.lower() in text.lower()
+    if kind == "not_contains":
+        return value.lower() not in text.lower()
+    if kind == "regex":
+        return re.search(value, text) is not None
+    if kind == "max_words":
+        return len(text.split()) <= value
+    raise ValueError(f"Unknown check type: {kind}")
+
+
+def grade(case: EvalCase, answer: str) -> float:
+    """Share of the case's checks the answer meets, 0–100. <think> blocks are ignored."""
+    text = _THINKING.sub("", answer).strip()
+    return 100 * sum(_check(c, text) for c in case.checks) / len(case.checks)
+
+
+def load_suite(path: Path | None = None) -> Suite:
+    """Load a suite, refusing one whose reference answers fail their own checks."""
+    data = read_json(path or config.local_eval_suite_path)
+    suite = Suite(
+        name=data["name"],
+        cases=[
+            EvalCase(c["id"], c["prompt"], tuple(c["checks"]), c.get("reference", ""))
+            for c in data["cases"]
+        ],
+        pass_score=data.get("pass_score", 50.0),
+        options=data.get("options", {}),
+    )
+    ids = [c.id for c in suite.cases]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"{suite.name}: duplicate case ids")
+    for case in suite.cases:
+        if not case.checks:
+            raise ValueError(f"{suite.name}/{case.id}: no checks")
+        if case.reference and grade(case, case.reference) < 100:
+            raise ValueError(f"{suite.name}/{case.id}: reference answer fails its checks")
+    return suite
+
+
+# ─── Results ────────────────────────────────────────────────────────────────
+
+class CaseResult(NamedTuple):
+    model: str
+    case_id: str
+    version: str       # Suite.version() of the case when answered
+    score: float
+    seconds: float
+    date: str
+    error: str | None = None
+
+
+def read_results(path: Path | None = None) -> dict[tuple[str, str], CaseResult]:
+    """(model, case id) → latest successful result from the results log."""
+    path = path or config.local_eval_results_path
+    results = {}
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    r = CaseResult(**json.loads(line))
+                    if r.error is None:
+                        results[(r.model, r.case_id)] = r
+    return results
+
+
+def _append(f: IO[str] | None, result: CaseResult) -> None:
+    if f is not None:
+        f.write(json.dumps(result._asdict(), ensure_ascii=False) + "\n")
+        f.flush()
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Linear interpolation between closest ranks (NumPy's default method)."""
+    xs = sorted(values)
+    pos = (len(xs) - 1) * q / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(xs) - 1)
+    return xs[lo] + (xs[hi] - xs[lo]) * (pos - lo)
+
+
+def leaderboard_row(model: str, results: list[CaseResult], pass_score: float) -> dict:
+    scores = [r.score for r in results]
+    seconds = [r.seconds for r in results]
+    passed = sum(s >= pass_score for s in scores)
+    return {
+        "model": model,
+        "avg_score": round(sum(scores) / len(scores), 1),
+        "pass_rate": round(100 * passed / len(scores), 1),
+        "passed": passed,
+        "total": len(scores),
+        "response_time": round(sum(seconds) / len(seconds), 1),
+        "latency": {f"p{q}": round(percentile(seconds, q), 2) for q in PERCENTILES},
+    }
+
+
+def write_rows(rows: list[dict], path: Path | None = None) -> None:
+    """Replace these models' rows in the leaderboard, keep the rest, best first."""
+    path = path or config.local_leaderboard_path
+    with json_transaction() as txn:
+        board = {r["model"]: r for r in (txn.read(path) if path.exists() else [])}
+        board.update((r["model"], r) for r in rows)
+        txn.write(path, sorted(board.values(), key=lambda r: -r["avg_score"]))
+
+
+# ─── Runner ─────────────────────────────────────────────────────────────────
+
+def _base_url(endpoint: str) -> str:
+    """OLLAMA_HOST style values ("127.0.0.1:11434") as a base URL."""
+    url = endpoint if "://" in endpoint else f"http://{endpoint}"
+    return url.rstrip("/")
+
+
+def list_models(endpoint: str) -> list[str] | None:
+    """Model names from GET /api/tags, or None if the endpoint doesn't answer."""
+    try:
+        resp = http_client.get(f"{_base_url(endpoint)}/api/tags", retries=0)
+        resp.raise_for_status()
+        return [m["name"] for m in resp.json().get("models", [])]
+    except (requests.RequestException, ValueError) as e:
+        log.warning(f"{endpoint}: could not list models ({e})")
+        return None
+
+
+def assign_endpoints(
+    models: list[str], endpoints: list[str], listed: dict[str, list[str] | None]
+) -> dict[str, str]:
+    """Pin each model to the least-loaded endpoint that lists it (any, if none does)."""
+    load = {e: 0 for e in endpoints}
+    pinned = {}
+    for model in models:
+        hosts = [e for e in endpoints if model in (listed.get(e) or ())] or endpoints
+        pinned[model] = min(hosts, key=lambda e: load[e])
+        load[pinned[model]] += 1
+    return pinned
+
+
+@dataclass
+class EvalRun:
+    """One evaluation: which models, where, and where results go."""
+    suite: Suite
+    models: dict[str, str]                # model → endpoint base URL
+    concurrency: int = DEFAULT_CONCURRENCY
+    timeout: float = DEFAULT_TIMEOUT
+    results_path: Path | None = None
+    leaderboard_path: Path | None = None
+    fresh: bool = False
+    dry_run: bool = False
+    rows: dict[str, dict] = field(default_factory=dict)
+    requests: int = 0
+
+    async def _ask(self, slots: asyncio.Semaphore, endpoint: str, model: str, case: EvalCase) -> CaseResult:
+        version, day = self.suite.version(case), today_iso()
+        async with slots:
+            start = time.perf_counter()
+            try:
+                resp = await asyncio.to_thread(
+                    http_client.request, "POST", f"{endpoint}/api/generate",
+                    json={"model": model, "prompt": case.prompt, "stream": False,
+                          "options": self.suite.options},
+                    timeout=(5.0, self.timeout),
+                )
+                resp.raise_for_status()
+                answer = resp.json()["response"]
+            except (requests.RequestException, ValueError, KeyError) as e:
+                return CaseResult(model, case.id, version, 0.0, 0.0, day, str(e) or type(e).__name__)
+            finally:
+                self.requests += 1
+            elapsed = time.perf_counter() - start
+        return CaseResult(model, case.id, version, grade(case, answer), round(elapsed, 3), day)
+
+    async def _model(
+        self,
+        model: str,
+        slots: asyncio.Semaphore,
+        done: dict[tuple[str, str], CaseResult],
+        results_file: IO[str] | None,
+    ) -> None:
+        endpoint = self.models[model]
+
+        def current(case: EvalCase) -> CaseResult | None:
+            r = done.get((model, case.id))
+            return r if r is not None and r.version == self.suite.version(case) else None
+
+        todo = [c for c in self.suite.cases if current(c) is None]
+        errors = []
+        for task in asyncio.as_completed([self._ask(slots, endpoint, model, c) for c in todo]):
+            result = await task
+            _append(results_file, result)
+            if result.error is None:
+                done[(model, result.case_id)] = result
+            else:
+                errors.append(result)
+
+        if errors:
+            log.warning(f"{model}: {len(errors)} case(s) unanswered — rerun to resume "
+                        f"(first error, {errors[0].case_id}: {errors[0].error})")
+            return
+        results = [current(c) for c in self.suite.cases]
+        row = leaderboard_row(model, results, self.suite.pass_score)
+        self.rows[model] = row
+        if not self.dry_run:
+            await asyncio.to_thread(write_rows, [row], self.leaderboard_path)
+        lat = row["latency"]
+        log.info(
+            f"{model}: avg {row['avg_score']}, passed {row['passed']}/{row['total']}, "
+            f"p50 {lat['p50']}s p90 {lat['p90']}s ({len(todo)} asked, "
+            f"{len(self.suite.cases) - len(todo)} resumed)"
+        )
+
+    async def run(self) -> dict[str, dict]:
+        """Evaluate every model; returns the rows written (or that would be)."""
+        endpoints = sorted(set(self.models.values()))
+        slots = {e: asyncio.Semaphore(self.concurrency) for e in endpoints}
+        # to_thread's default pool may be smaller than the requests we allow in flight
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.concurrency * len(endpoints))
+        )
+        done = {} if self.fresh else read_results(self.results_path)
+        results_path = self.results_path or config.local_eval_results_path
+        results_file = None
+        if not self.dry_run:
+            results_path.parent.mkdir(parents=True, exist_ok=True)
+            results_file = open(results_path, "a", encoding="utf-8")
+        try:
+            await asyncio.gather(*(
+                self._model(m, slots[e], done, results_file) for m, e in self.models.items()
+            ))
+        finally:
+            if results_file is not None:
+                results_file.close()
+        return self.rows
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Evaluate local models → local_leaderboard.json")
+    parser.add_argument("models", nargs="*", help="Model names, e.g. gemma3:4b")
+    parser.add_argument("--all", action="store_true", help="Every model the endpoints list")
+    parser.add_argument("--endpoint", action="append", dest="endpoints",
+                        help=f"Ollama-compatible base URL, repeatable (default: {DEFAULT_ENDPOINT})")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Requests in flight per endpoint (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="Seconds to wait for one answer")
+    parser.add_argument("--suite", type=Path, help="Suite file (default: scripts/evals/local_suite.json)")
+    parser.add_argument("--fresh", action="store_true", help="Ignore previously recorded answers")
+    parser.add_argument("--dry-run", action="store_true", help="Evaluate but write nothing")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    setup_logger("http")
+    suite = load_suite(args.suite)
+    endpoints = [_base_url(e) for e in (args.endpoints or [DEFAULT_ENDPOINT])]
+
+    listed = {}
+    if args.all or len(endpoints) > 1:
+        listed = {e: list_models(e) for e in endpoints}
+    models = list(dict.fromkeys(args.models))
+    if args.all:
+        models += [m for e in endpoints for m in (listed[e] or ()) if m not in models]
+    if not models:
+        log.error("No models to evaluate — name some, or use --all")
+        sys.exit(1)
+
+    run = EvalRun(
+        suite=suite,
+        models=assign_endpoints(models, endpoints, listed),
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        fresh=args.fresh,
+        dry_run=args.dry_run,
+    )
+    log.info(f"Suite '{suite.name}': {len(suite.cases)} case(s) × {len(models)} model(s) "
+             f"on {len(endpoints)} endpoint(s), {args.concurrency} in flight per endpoint")
+    start = time.perf_counter()
+    rows = asyncio.run(run.run())
+    elapsed = time.perf_counter() - start
+
+    log.info(f"{run.requests} request(s) in {elapsed:.1f}s; {len(rows)}/{len(models)} model(s) complete")
+    if args.dry_run:
+        for row in rows.values():
+            print(json.dumps(row))
+        log.info(f"[DRY RUN] Would update {config.local_leaderboard_path}")
+    elif rows:
+        log.info(f"Updated {config.local_leaderboard_path}")
+    http_client.log_metrics(log)
+    if len(rows) < len(models):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
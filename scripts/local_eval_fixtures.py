@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+local_eval_fixtures.py — A local stand-in for an Ollama endpoint, for local_eval.py.
+
+Serves GET /api/tags and POST /api/generate for a set of fake models. Each
+fake model answers a suite prompt with the case's reference answer for a
+deterministic share of the cases (its skill) and with a wrong answer
+otherwise, after a configurable delay, so runs are reproducible offline.
+
+Usage:
+  python scripts/local_eval_fixtures.py serve                        # Two default fake models
+  python scripts/local_eval_fixtures.py serve --model fast:0.9:0.2 --model slow:0.6:2
+  python scripts/local_eval_fixtures.py bench --models 6 --latency 0.2 --concurrency 1 4 8
+
+`serve` prints the OLLAMA_HOST export that points local_eval.py at the
+stand-in. --model is NAME:SKILL:SECONDS. The stand-in serves --parallel
+requests at a time and queues the rest, like OLLAMA_NUM_PARALLEL.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+sys.path.insert(0, str(Path(__file__).parent))
+from utils import setup_logger
+from local_eval import EvalRun, Suite, load_suite
+import http_client
+
+log = setup_logger("local-eval-fixtures")
+
+WRONG_ANSWER = "I'm not sure."
+
+
+@dataclass
+class FakeModel:
+    skill: float = 0.8      # share of cases answered with the reference
+    latency: float = 0.0    # seconds per answer, once a slot is free
+
+
+def _correct(model: str, prompt: str, skill: float) -> bool:
+    """Deterministic per (model, prompt): a stable hash compared with the skill."""
+    digest = hashlib.sha256(f"{model}\0{prompt}".encode()).digest()
+    return int.from_bytes(digest[:4], "big") / 2 ** 32 < skill
+
+
+class _OllamaHandler(BaseHTTPRequestHandler):
+    server: "OllamaStandIn"
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client timed out
+
+    def do_GET(self) -> None:
+        if self.path != "/api/tags":
+            self.send_error(404)
+            return
+        self._send_json(200, {"models": [{"name": name} for name in self.server.models]})
+
+    def do_POST(self) -> None:
+        if self.path != "/api/generate":
+            self.send_error(404)
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        name, prompt = request.get("model"), request.get("prompt", "")
+        model = self.server.models.get(name)
+        if model is None:
+            self._send_json(404, {"error": f"model '{name}' not found"})
+            return
+
+        start = time.perf_counter()
+        with self.server.slots:
+            with self.server.lock:
+                self.server.requests += 1
+                self.server.in_flight += 1
+                self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+            time.sleep(model.latency)
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+        reference = self.server.references.get(prompt)
+        correct = reference is not None and _correct(name, prompt, model.skill)
+        self._send_json(200, {
+            "model": name,
+            "response": reference if correct else WRONG_ANSWER,
+            "done": True,
+            "total_duration": int((time.perf_counter() - start) * 1e9),
+        })
+
+    def log_message(self, format: str, *args) -> None:
+        log.debug(f"{self.address_string()} {format % args}")
+
+
+class OllamaStandIn(ThreadingHTTPServer):
+    """Threaded local server answering suite prompts for fake models."""
+    daemon_threads = True
+
+    def __init__(self, models: dict[str, FakeModel], suite: Suite, parallel: int = 4, port: int = 0) -> None:
+        super().__init__(("127.0.0.1", port), _OllamaHandler)
+        self.models = models
+        self.references = {c.prompt: c.reference for c in suite.cases}
+        self.slots = threading.BoundedSemaphore(parallel)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@contextmanager
+def serve_ollama(
+    models: dict[str, FakeModel], suite: Suite | None = None, parallel: int = 4
+) -> Iterator[OllamaStandIn]:
+    """Serve the fake models on a random local port for the duration of the block."""
+    server = OllamaStandIn(models, suite or load_suite(), parallel)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def _parse_model(spec: str) -> tuple[str, FakeModel]:
+    """NAME:SKILL:SECONDS — split from the right, model names contain colons."""
+    name, skill, latency = spec.rsplit(":", 2)
+    return name, FakeModel(float(skill), float(latency))
+
+
+def _bench(args: argparse.Namespace) -> None:
+    """Time full evaluations at each concurrency against the stand-in."""
+    suite = load_suite()
+    models = {f"fake-{i}:1b": FakeModel(0.5 + i / (2 * args.models), args.latency) for i in range(args.models)}
+    with serve_ollama(models, suite, parallel=max(args.concurrency)) as server:
+        for concurrency in args.concurrency:
+            with tempfile.TemporaryDirectory() as tmp:
+                run = EvalRun(
+                    suite=suite,
+                    models={m: server.url for m in models},
+                    concurrency=concurrency,
+                    results_path=Path(tmp) / "results.jsonl",
+                    leaderboard_path=Path(tmp) / "leaderboard.json",
+                )
+                start = time.perf_counter()
+                asyncio.run(run.run())
+                elapsed = time.perf_counter() - start
+            log.info(f"concurrency {concurrency:>3}: {run.requests} requests in {elapsed:6.2f}s "
+                     f"({run.requests / elapsed:6.1f} req/s)")
+    http_client.log_metrics(log)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local stand-in for an Ollama endpoint")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve", help="Run the stand-in until interrupted")
+    p.add_argument("--model", action="append", type=_parse_model, dest="models",
+                   metavar="NAME:SKILL:SECONDS",
+                   help="Fake model (default: gemma3:4b:0.9:0.5 and qwen3:4b:0.7:1.5)")
+    p.add_argument("--parallel", type=int, default=4, help="Requests served at once")
+    p.add_argument("--port", type=int, default=11435)
+
+    p = sub.add_parser("bench", help="Time evaluations at several concurrency levels")
+    p.add_argument("--models", type=int, default=4, help="Fake models to evaluate")
+    p.add_argument("--latency", type=float, default=0.1, help="Seconds per answer")
+    p.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    setup_logger("local-eval")
+    setup_logger("http")
+
+    if args.command == "bench":
+        _bench(args)
+        return
+    models = dict(args.models or [
+        ("gemma3:4b", FakeModel(0.9, 0.5)),
+        ("qwen3:4b", FakeModel(0.7, 1.5)),
+    ])
+    server = OllamaStandIn(models, load_suite(), args.parallel, port=args.port)
+    print(f"export OLLAMA_HOST={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+near_duplicates.py — MinHash/LSH near-duplicate detection for articles.
+
+add_article.py checks each incoming article against every published one
+(live and archived) before inserting it, and rejects it (or, with
+--allow-duplicates, flags it) above config.near_duplicate_threshold.
+
+An article is the set of its 3-word shingles (search_index.tokenize over
+title, excerpt and body). Its signature is the minimum of NUM_PERM hash
+permutations over those shingles; the share of equal signature rows
+estimates the Jaccard similarity of two articles. The signature is split
+into BANDS bands of ROWS rows, and only articles sharing a band are
+compared, so a check costs BANDS dict lookups however large the archive
+gets. With 32 x 4, a pair at similarity 0.7 becomes a candidate 99.9% of
+the time; unrelated articles (similarity ~0.05) almost never do. A 3%
+word-level rewrite of an article scores about 0.8.
+
+  data/minhash_index.json
+    {"version": 1, "params": {...},
+     "signatures": {"slug": "<base64 uint32 x NUM_PERM>", ...}}
+
+The band buckets are rebuilt from the signatures when the file is loaded.
+
+Usage:
+  python scripts/near_duplicates.py check --file draft.json     # Nearest published articles
+  python scripts/near_duplicates.py pairs                       # Near-duplicates already published
+  python scripts/near_duplicates.py stats
+  python scripts/near_duplicates.py rebuild                     # From articles.json + the archive
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, JsonTransaction
+from search_index import tokenize
+
+log = setup_logger("near-duplicates")
+
+INDEX_VERSION = 1
+SHINGLE_WORDS = 3
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+PARAMS = {"shingle_words": SHINGLE_WORDS, "num_perm": NUM_PERM, "bands": BANDS}
+
+_PRIME = np.uint64((1 << 61) - 1)
+_MASK = np.uint64(0xFFFFFFFF)
+
+
+def _coefficients(name: str, low: int) -> np.ndarray:
+    # Derived from fixed strings, not an RNG, so stored signatures stay valid
+    values = [
+        low + int.from_bytes(hashlib.blake2b(f"{name}{i}".encode(), digest_size=8).digest(), "little")
+        % ((1 << 61) - 1 - low)
+        for i in range(NUM_PERM)
+    ]
+    return np.array(values, dtype=np.uint64)
+
+
+_A = _coefficients("a", 1)
+_B = _coefficients("b", 0)
+
+
+def shingles(article: dict) -> set[str]:
+    """Overlapping SHINGLE_WORDS-word runs; a shorter text is one shingle."""
+    words = tokenize(" ".join([article["title"], article.get("excerpt", ""), *article.get("content", [])]))
+    k = min(SHINGLE_WORDS, len(words))
+    return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)} if words else set()
+
+
+def signature(article: dict) -> np.ndarray:
+    """NUM_PERM uint32 MinHash values."""
+    found = shingles(article)
+    if not found:
+        return np.full(NUM_PERM, 0xFFFFFFFF, dtype=np.uint32)
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little") for s in found),
+        dtype=np.uint64,
+        count=len(found),
+    )
+    # (a * x + b) mod p per permutation; uint64 wraparound is part of the hash
+    values = (hashes[:, None] * _A + _B) % _PRIME & _MASK
+    return values.min(axis=0).astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the articles behind two signatures."""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+def band_keys(sig: np.ndarray) -> list[tuple[int, bytes]]:
+    return [(band, sig[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+
+def _encode(sig: np.ndarray) -> str:
+    return base64.b64encode(sig.astype("<u4").tobytes()).decode("ascii")
+
+
+def _decode(text: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(text), dtype="<u4").astype(np.uint32)
+
+
+class Match(NamedTuple):
+    slug: str
+    similarity: float
+
+
+class MinHashIndex:
+    """Lazily loaded signatures + LSH buckets, with incremental add/remove and write-back."""
+
+    def __init__(self, path: Path | None = None, read: Callable[[Path], Any] = read_json) -> None:
+        self.path = path or config.minhash_index_path
+        self._read = read
+        self._data: dict | None = None
+        self._buckets: dict[tuple[int, bytes], list[str]] | None = None
+        self._dirty = False
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            if self.path.exists():
+                self._data = self._read(self.path)
+                if self._data.get("params") != PARAMS:
+                    raise ValueError(
+                        f"{self.path.name} was built with {self._data.get('params')}, expected {PARAMS}; "
+                        "run `python scripts/near_duplicates.py rebuild`"
+                    )
+            else:
+                self._data = {"version": INDEX_VERSION, "params": PARAMS, "signatures": {}}
+        return self._data
+
+    @property
+    def buckets(self) -> dict[tuple[int, bytes], list[str]]:
+        """(band, band rows) → slugs."""
+        if self._buckets is None:
+            self._buckets = {}
+            for slug in self.data["signatures"]:
+                for key in band_keys(self.signature_of(slug)):
+                    self._buckets.setdefault(key, []).append(slug)
+        return self._buckets
+
+    def __len__(self) -> int:
+        return len(self.data["signatures"])
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self.data["signatures"]
+
+    def signature_of(self, slug: str) -> np.ndarray:
+        return _decode(self.data["signatures"][slug])
+
+    def candidates(self, sig: np.ndarray) -> set[str]:
+        """Slugs sharing at least one band with sig."""
+        buckets = self.buckets
+        return {slug for key in band_keys(sig) for slug in buckets.get(key, ())}
+
+    def matches(self, sig: np.ndarray, threshold: float | None = None) -> list[Match]:
+        """Candidates at or above threshold (default: config.near_duplicate_threshold), most similar first."""
+        threshold = config.near_duplicate_threshold if threshold is None else threshold
+        found = [Match(slug, similarity(sig, self.signature_of(slug))) for slug in self.candidates(sig)]
+        return sorted((m for m in found if m.similarity >= threshold), key=lambda m: (-m.similarity, m.slug))
+
+    def add(self, slug: str, sig: np.ndarray) -> None:
+        if slug in self:
+            self.remove(slug)
+        buckets = self.buckets  # built before sig is stored, or it would be bucketed twice
+        self.data["signatures"][slug] = _encode(sig)
+        for key in band_keys(sig):
+            buckets.setdefault(key, []).append(slug)
+        self._dirty = True
+
+    def add_articles(self, articles: Iterable[dict]) -> None:
+        for article in articles:
+            self.add(article["slug"], signature(article))
+
+    def remove(self, slug: str) -> bool:
+        if slug not in self:
+            return False
+        buckets = self.buckets
+        for key in band_keys(self.signature_of(slug)):
+            members = buckets.get(key, [])
+            if slug in members:
+                members.remove(slug)
+            if not members:
+                buckets.pop(key, None)
+        del self.data["signatures"][slug]
+        self._dirty = True
+        return True
+
+    def rebuild(self, articles: Iterable[dict]) -> None:
+        self._data = {"version": INDEX_VERSION, "params": PARAMS, "signatures": {}}
+        self._buckets = {}
+        self.add_articles(articles)
+        self._dirty = True
+
+    def pairs(self, threshold: float | None = None) -> list[tuple[str, str, float]]:
+        """Indexed pairs at or above threshold, from shared buckets only."""
+        threshold = config.near_duplicate_threshold if threshold is None else threshold
+        seen: set[tuple[str, str]] = set()
+        out = []
+        for members in self.buckets.values():
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    pair = (a, b) if a < b else (b, a)
+                    if pair in seen:
+                        continue
+                    seen.add(pair)
+                    s = similarity(self.signature_of(a), self.signature_of(b))
+                    if s >= threshold:
+                        out.append((*pair, s))
+        return sorted(out, key=lambda p: (-p[2], p[0], p[1]))
+
+    @property
+    def dirty_paths(self) -> list[Path]:
+        return [self.path] if self._dirty else []
+
+    def write(self, txn: JsonTransaction) -> list[Path]:
+        """Stage the index in txn (compact). Returns its path."""
+        paths = self.dirty_paths
+        if paths:
+            txn.write(self.path, self.data, indent=None)
+            self._dirty = False
+        return paths
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="MinHash near-duplicate detection for articles")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("check", help="Nearest published articles to a draft")
+    p.add_argument("--file", type=Path, help="Article JSON (default: stdin)")
+    p.add_argument("--threshold", type=float, default=0.0, help="Report matches from this similarity")
+    p = sub.add_parser("pairs", help="Near-duplicate pairs already published")
+    p.add_argument("--threshold", type=float, help="Default: config.near_duplicate_threshold")
+    sub.add_parser("stats", help="Signatures and buckets")
+    p = sub.add_parser("rebuild", help="Rebuild from articles.json and the archive")
+    p.add_argument("--dry-run", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.command == "check":
+        raw = args.file.read_text(encoding="utf-8") if args.file else sys.stdin.read()
+        sig = signature(json.loads(raw))
+        found = MinHashIndex().matches(sig, args.threshold)
+        if not found:
+            print("  No candidates share a band")
+        for m in found:
+            flag = "  ← over threshold" if m.similarity >= config.near_duplicate_threshold else ""
+            print(f"  {m.similarity:.3f}  {m.slug}{flag}")
+    elif args.command == "pairs":
+        for a, b, s in MinHashIndex().pairs(args.threshold):
+            print(f"  {s:.3f}  {a}  ~  {b}")
+    elif args.command == "stats":
+        index = MinHashIndex()
+        size = index.path.stat().st_size if index.path.exists() else 0
+        shared = sum(1 for m in index.buckets.values() if len(m) > 1)
+        print(f"  articles  {len(index):>7}")
+        print(f"  buckets   {len(index.buckets):>7}  ({shared} shared)")
+        print(f"  size      {size / 1024:>7.1f} KB")
+    else:
+        from datastore import open_store
+        from article_bodies import all_articles
+        with open_store() as store:
+            store.near_duplicates.rebuild(all_articles(store))
+            log.info(f"Signed {len(store.near_duplicates)} articles"
+                     f"{' (dry run)' if args.dry_run else ''}")
+            if not args.dry_run:
+                store.commit()
+
+
+if __name__ == "__main__":
+    main()
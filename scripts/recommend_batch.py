@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+recommend_batch.py — Offline evaluation of the /api/recommend ranking weights.
+
+Scores thousands of queries (task × max_cost × min_context × provider) in one
+NumPy pass: filters, min/max normalization, the weighted sum and JS rounding
+run on a (queries × models) grid in the same floating-point order as
+data/recommend.ts scoreAndRank(), so scores and orderings agree exactly.
+
+Reports:
+  - throughput (queries/s)
+  - how often each model is filtered out
+  - ranking stability: top-1 / top-k agreement when the weights are jittered
+  - a sweep over the weight simplex, compared with the shipped weights
+
+Usage:
+  python scripts/recommend_batch.py                        # Grid over data/, report
+  python scripts/recommend_batch.py --random 50000 --seed 7
+  python scripts/recommend_batch.py --jitter 0.1 --trials 50
+  python scripts/recommend_batch.py sweep --step 0.05 --weights no-task
+  python scripts/recommend_batch.py fixture                # Rewrite the shared fixture
+  python scripts/recommend_batch.py check                  # Batch vs the shared fixture
+
+The shared fixture (__tests__/fixtures/recommend_cases.json) is checked by
+both sides: jest asserts scoreAndRank() reproduces it, test_recommend.py
+asserts this module and recommend_index.py do.
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, write_json
+from recommend_index import (
+    WEIGHTS_TASK, WEIGHTS_NO_TASK, COMMON_MAX_COST, COMMON_MIN_CONTEXT,
+    find_matching_category, score_and_rank,
+)
+
+log = setup_logger("recommend-batch")
+
+WEIGHT_KEYS = ("task", "elo", "cost", "context")  # summation order in scoreAndRank
+
+
+# ─── Inputs ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class Catalog:
+    """models.json / categories.json as column arrays."""
+    ids: list[str]
+    providers: list[str]       # lower-cased
+    categories: list[dict]
+    elo: np.ndarray            # (N,) float64
+    cost: np.ndarray           # (N,) float64
+    context: np.ndarray        # (N,) float64
+    task_score: np.ndarray     # (C + 1, N): 1 leader, 0.5 tagged; last row = no task
+
+    @classmethod
+    def from_data(cls, models: list[dict], categories: list[dict]) -> "Catalog":
+        task_score = np.zeros((len(categories) + 1, len(models)))
+        for c, cat in enumerate(categories):
+            for n, m in enumerate(models):
+                if m["name"] == cat["leader"]:
+                    task_score[c, n] = 1.0
+                elif cat["name"] in m["strengths"]:
+                    task_score[c, n] = 0.5
+        return cls(
+            ids=[m["id"] for m in models],
+            providers=[m["provider"].lower() for m in models],
+            categories=categories,
+            elo=np.array([m["elo"] for m in models], dtype=np.float64),
+            cost=np.array([m["cost_per_million_tokens"] for m in models], dtype=np.float64),
+            context=np.array([m["context_window"] for m in models], dtype=np.float64),
+            task_score=task_score,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass
+class QueryBatch:
+    """Q queries as arrays. -1 / NaN mean "not set"."""
+    task: np.ndarray           # (Q,) int, category index
+    max_cost: np.ndarray       # (Q,) float64
+    min_context: np.ndarray    # (Q,) float64
+    provider: np.ndarray       # (Q,) int, index into `filters`
+    filters: list[str]         # distinct provider filters, lower-cased
+
+    def __len__(self) -> int:
+        return len(self.task)
+
+    @classmethod
+    def from_opts(cls, catalog: Catalog, queries: list[dict]) -> "QueryBatch":
+        """From route-style opts: {task, maxCost, minContext, provider}."""
+        names = {c["name"]: i for i, c in enumerate(catalog.categories)}
+        filters: dict[str, int] = {}
+        task, max_cost, min_context, provider = [], [], [], []
+        for q in queries:
+            matched = find_matching_category(q["task"], catalog.categories) if q.get("task") else None
+            task.append(names[matched["name"]] if matched else -1)
+            max_cost.append(np.nan if q.get("maxCost") is None else q["maxCost"])
+            min_context.append(np.nan if q.get("minContext") is None else q["minContext"])
+            p = (q.get("provider") or "").lower()
+            provider.append(filters.setdefault(p, len(filters)) if p else -1)
+        return cls(
+            task=np.array(task, dtype=np.int64),
+            max_cost=np.array(max_cost, dtype=np.float64),
+            min_context=np.array(min_context, dtype=np.float64),
+            provider=np.array(provider, dtype=np.int64),
+            filters=list(filters),
+        )
+
+    @classmethod
+    def grid(cls, catalog: Catalog) -> "QueryBatch":
+        """
+        Every combination of task (each category, none), max_cost (the route's
+        common buckets plus every model's price), min_context (likewise) and
+        provider (each provider, none).
+        """
+        costs = sorted({*(c for c in COMMON_MAX_COST if c is not None), *catalog.cost.tolist()})
+        contexts = sorted({*(c for c in COMMON_MIN_CONTEXT if c is not None), *catalog.context.tolist()})
+        filters = sorted(set(catalog.providers))
+        combos = np.array(list(itertools.product(
+            range(-1, len(catalog.categories)),
+            [np.nan, *costs],
+            [np.nan, *contexts],
+            range(-1, len(filters)),
+        )))
+        return cls(
+            task=combos[:, 0].astype(np.int64),
+            max_cost=combos[:, 1],
+            min_context=combos[:, 2],
+            provider=combos[:, 3].astype(np.int64),
+            filters=filters,
+        )
+
+    @classmethod
+    def random(cls, catalog: Catalog, n: int, seed: int = 0) -> "QueryBatch":
+        """n synthetic queries; each filter is set about half the time."""
+        rng = np.random.default_rng(seed)
+        filters = sorted(set(catalog.providers))
+        lo_cost, hi_cost = catalog.cost.min(), catalog.cost.max()
+        lo_ctx, hi_ctx = catalog.context.min(), catalog.context.max()
+
+        def maybe(values: np.ndarray, unset: float) -> np.ndarray:
+            return np.where(rng.random(n) < 0.5, values, unset)
+
+        return cls(
+            task=maybe(rng.integers(0, len(catalog.categories), n), -1).astype(np.int64),
+            max_cost=maybe(np.round(rng.uniform(lo_cost, hi_cost * 1.2, n), 2), np.nan),
+            min_context=maybe(np.round(rng.uniform(lo_ctx * 0.5, hi_ctx, n), -3), np.nan),
+            provider=maybe(rng.integers(0, len(filters), n), -1).astype(np.int64),
+            filters=filters,
+        )
+
+
+# ─── Scoring ────────────────────────────────────────────────────────────────
+
+@dataclass
+class BatchResult:
+    """Scores for every (query, model); NaN where the model was filtered out."""
+    scores: np.ndarray         # (Q, N) float64
+    order: np.ndarray          # (Q, N) int: candidates best-first, then excluded
+    candidates: np.ndarray     # (Q,) int
+
+    @property
+    def excluded(self) -> np.ndarray:
+        return self.scores.shape[1] - self.candidates
+
+    def top(self, k: int) -> np.ndarray:
+        """(Q, k) model indexes of the top k, -1 past the last candidate."""
+        top = self.order[:, :k].copy()
+        top[np.arange(top.shape[1])[None, :] >= self.candidates[:, None]] = -1
+        return top
+
+    def ranking(self, q: int, catalog: Catalog) -> list[list]:
+        """[[id, score], ...] for one query, best first."""
+        return [
+            [catalog.ids[n], float(self.scores[q, n])]
+            for n in self.order[q, :self.candidates[q]]
+        ]
+
+
+def _weights(weights: dict[str, float]) -> np.ndarray:
+    return np.array([weights[k] for k in WEIGHT_KEYS], dtype=np.float64)
+
+
+def _normalized(values: np.ndarray, mask: np.ndarray, invert: bool = False) -> np.ndarray:
+    """Per-query (v - min) / (max - min) over the candidates; 1 when they all tie."""
+    lo = np.where(mask, values, np.inf).min(axis=1, keepdims=True)
+    hi = np.where(mask, values, -np.inf).max(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scaled = (hi - values) / (hi - lo) if invert else (values - lo) / (hi - lo)
+    return np.where(hi == lo, 1.0, scaled)
+
+
+def js_round2(x: np.ndarray) -> np.ndarray:
+    """Math.round(x * 100) / 100, elementwise (half up, exact at the boundary)."""
+    y = x * 100
+    r = np.floor(y)
+    return (r + (y - r >= 0.5)) / 100
+
+
+def score_batch(
+    catalog: Catalog,
+    batch: QueryBatch,
+    weights_task: dict[str, float] = WEIGHTS_TASK,
+    weights_no_task: dict[str, float] = WEIGHTS_NO_TASK,
+) -> BatchResult:
+    """scoreAndRank() for every query in the batch at once."""
+    cost, context = catalog.cost[None, :], catalog.context[None, :]
+    # Comparisons with NaN are False, so unset bounds exclude nothing
+    mask = ~(cost > batch.max_cost[:, None]) & ~(context < batch.min_context[:, None])
+    provider_ok = np.array(
+        [[f in p for p in catalog.providers] for f in batch.filters] + [[True] * len(catalog)],
+        dtype=bool,
+    ).reshape(len(batch.filters) + 1, len(catalog))
+    mask &= provider_ok[batch.provider]  # -1 → the last, all-True row
+
+    elo_score = _normalized(catalog.elo[None, :], mask)
+    cost_score = _normalized(cost, mask, invert=True)
+    ctx_score = _normalized(context, mask)
+    task_score = catalog.task_score[batch.task]
+
+    w = np.where((batch.task >= 0)[:, None], _weights(weights_task), _weights(weights_no_task))
+    # Same operation order as the TS expression, so the doubles are identical
+    total = (
+        w[:, 0:1] * task_score
+        + w[:, 1:2] * elo_score
+        + w[:, 2:3] * cost_score
+        + w[:, 3:4] * ctx_score
+    )
+    scores = np.where(mask, js_round2(total), np.nan)
+    # Stable sort by descending score keeps catalog order among ties, like Array.sort
+    order = np.argsort(np.where(mask, -scores, np.inf), axis=1, kind="stable")
+    return BatchResult(scores=scores, order=order, candidates=mask.sum(axis=1))
+
+
+# ─── Metrics ────────────────────────────────────────────────────────────────
+
+def exclusion_frequency(result: BatchResult) -> np.ndarray:
+    """(N,) share of queries that filtered each model out."""
+    return np.isnan(result.scores).mean(axis=0)
+
+
+def agreement(base: BatchResult, other: BatchResult, k: int = 3) -> dict[str, float]:
+    """
+    Over queries with at least one candidate: share whose top pick is
+    unchanged, and the mean share of the top k still in the top k.
+    """
+    answered = base.candidates > 0
+    if not answered.any():
+        return {"top1": 1.0, f"top{k}": 1.0}
+    a, b = base.top(k)[answered], other.top(k)[answered]
+    shown = (a >= 0).sum(axis=1)
+    overlap = ((a[:, :, None] == b[:, None, :]) & (a[:, :, None] >= 0)).any(axis=2).sum(axis=1)
+    return {
+        "top1": float((a[:, 0] == b[:, 0]).mean()),
+        f"top{k}": float((overlap / shown).mean()),
+    }
+
+
+def jitter_weights(weights: dict[str, float], scale: float, rng: np.random.Generator) -> dict[str, float]:
+    """Each weight × (1 ± scale), renormalized to sum to 1; zero weights stay zero."""
+    w = _weights(weights) * (1 + rng.uniform(-scale, scale, len(WEIGHT_KEYS)))
+    return dict(zip(WEIGHT_KEYS, (w / w.sum()).tolist()))
+
+
+def stability(
+    catalog: Catalog,
+    batch: QueryBatch,
+    scale: float = 0.1,
+    trials: int = 20,
+    k: int = 3,
+    seed: int = 0,
+) -> dict[str, float]:
+    """Mean and worst agreement with the shipped weights under random jitter."""
+    rng = np.random.default_rng(seed)
+    base = score_batch(catalog, batch)
+    runs = [
+        agreement(base, score_batch(
+            catalog, batch,
+            jitter_weights(WEIGHTS_TASK, scale, rng),
+            jitter_weights(WEIGHTS_NO_TASK, scale, rng),
+        ), k)
+        for _ in range(trials)
+    ]
+    out = {}
+    for key in runs[0]:
+        values = [r[key] for r in runs]
+        out[f"{key}_mean"] = float(np.mean(values))
+        out[f"{key}_min"] = float(np.min(values))
+    return out
+
+
+def simplex(step: float, dims: int) -> list[tuple[float, ...]]:
+    """Every weight vector on a `step` grid with non-negative entries summing to 1."""
+    n = round(1 / step)
+    return [
+        tuple(p / n for p in parts)
+        for parts in itertools.product(range(n + 1), repeat=dims)
+        if sum(parts) == n
+    ]
+
+
+def sweep(
+    catalog: Catalog,
+    batch: QueryBatch,
+    step: float = 0.05,
+    which: str = "task",
+    k: int = 3,
+) -> list[dict]:
+    """
+    Score the batch under every weight vector on the simplex grid, varying
+    one weight set ("task" or "no-task") and keeping the other as shipped.
+    Rows: weights, agreement with the shipped ranking, and the share of
+    top picks held by the most frequent top pick.
+    """
+    base = score_batch(catalog, batch)
+    answered = base.candidates > 0
+    rows = []
+    keys = WEIGHT_KEYS if which == "task" else WEIGHT_KEYS[1:]
+    for vector in simplex(step, len(keys)):
+        weights = dict(zip(keys, vector))
+        if which == "task":
+            result = score_batch(catalog, batch, weights_task=weights)
+        else:
+            result = score_batch(catalog, batch, weights_no_task={"task": 0.0, **weights})
+        top1 = result.top(1)[answered, 0]
+        dominant = np.bincount(top1, minlength=len(catalog)).max() / max(len(top1), 1)
+        rows.append({"weights": weights, **agreement(base, result, k), "dominance": float(dominant)})
+    return rows
+
+
+# ─── Shared fixture ─────────────────────────────────────────────────────────
+
+def _fixture_models(seed: int) -> tuple[list[dict], list[dict]]:
+    """A synthetic catalog built to hit ties, equal bounds and decimal prices."""
+    rng = np.random.default_rng(seed)
+    categories = [
+        {"name": "Coding & Engineering", "leader": "Model 2"},
+        {"name": "Creative Writing", "leader": "Model 5"},
+        {"name": "Hard Reasoning & Science", "leader": "Nobody"},
+    ]
+    providers = ["Acme", "Acme Labs", "Beta", "Gamma AI"]
+    models = []
+    for i in range(12):
+        models.append({
+            "id": f"m{i}",
+            "name": f"Model {i}",
+            "provider": providers[i % len(providers)],
+            "elo": int(rng.choice([1380, 1400, 1400, 1433, 1467, 1500])),
+            "cost_per_million_tokens": float(rng.choice([0.15, 0.5, 1, 2.5, 3, 3, 15])),
+            "context_window": int(rng.choice([32000, 128000, 128000, 200000, 1000000])),
+            "strengths": [c["name"] for c in categories if rng.random() < 0.4],
+        })
+    return models, categories
+
+
+def _fixture_queries(models: list[dict], categories: list[dict], n: int, seed: int) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    tasks = [None, "coding", "writing", "science", "nothing like it", *(c["name"] for c in categories)]
+    costs = [None, 0.15, 1, 2.5, 3, 10, *(m["cost_per_million_tokens"] for m in models)]
+    contexts = [None, 32000, 128000, 150000, 1000000]
+    providers = [None, "", *{m["provider"].lower() for m in models}, "acme", "LABS", "none"]
+    return [
+        {
+            "task": tasks[rng.integers(len(tasks))],
+            "maxCost": costs[rng.integers(len(costs))],
+            "minContext": contexts[rng.integers(len(contexts))],
+            "provider": providers[rng.integers(len(providers))],
+        }
+        for _ in range(n)
+    ]
+
+
+def build_fixture(cases_per_suite: int = 100) -> dict:
+    """
+    Suites of (models, categories, opts → expected) from the scalar port in
+    recommend_index.py, plus rounding probes around every .xx5 boundary.
+    """
+    suites = [("data", read_json(config.models_path), read_json(config.categories_path))]
+    for seed in (1, 2):
+        suites.append((f"synthetic-{seed}", *_fixture_models(seed)))
+
+    out = []
+    for name, models, categories in suites:
+        cases = []
+        for opts in _fixture_queries(models, categories, cases_per_suite, seed=len(out)):
+            recs, excluded, matched = score_and_rank(
+                models, categories, opts["task"], opts["maxCost"], opts["minContext"], opts["provider"]
+            )
+            cases.append({
+                "opts": opts,
+                "matchedCategory": matched["name"] if matched else None,
+                "excluded": excluded,
+                "ranking": [[r.model["id"], r.score, r.reasons] for r in recs],
+            })
+        out.append({"name": name, "models": models, "categories": categories, "cases": cases})
+
+    probes = []
+    for k in range(100):
+        x = (k + 0.5) / 100
+        probes += [float(np.nextafter(x, 0)), x, float(np.nextafter(x, 1))]
+    return {"suites": out, "rounding": [[x, float(js_round2(np.array(x)))] for x in probes]}
+
+
+def check_fixture(path: Path | None = None) -> list[str]:
+    """Batch results that differ from the shared fixture (empty when all agree)."""
+    fixture = read_json(path or config.recommend_fixture_path)
+    failures = []
+    for suite in fixture["suites"]:
+        catalog = Catalog.from_data(suite["models"], suite["categories"])
+        batch = QueryBatch.from_opts(catalog, [case["opts"] for case in suite["cases"]])
+        result = score_batch(catalog, batch)
+        for q, case in enumerate(suite["cases"]):
+            task = batch.task[q]
+            matched = catalog.categories[task]["name"] if task >= 0 else None
+            expected = [entry[:2] for entry in case["ranking"]]
+            got = result.ranking(q, catalog)
+            if (matched, int(result.excluded[q]), got) != (case["matchedCategory"], case["excluded"], expected):
+                failures.append(f"{suite['name']} case {q} {case['opts']}: got {got}, expected {expected}")
+    xs = np.array([x for x, _ in fixture["rounding"]])
+    for x, got, expected in zip(xs, js_round2(xs), (e for _, e in fixture["rounding"])):
+        if got != expected:
+            failures.append(f"rounding {x!r}: got {got!r}, expected {expected!r}")
+    return failures
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Batch evaluation of the recommend weights")
+    parser.add_argument("--random", type=int, metavar="N",
+                        help="N random queries instead of the full grid")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jitter", type=float, default=0.1,
+                        help="Relative weight jitter for the stability report (default: 0.1)")
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--top", type=int, default=3, help="k for top-k agreement")
+    sub = parser.add_subparsers(dest="command")
+    p = sub.add_parser("sweep", help="Score every weight vector on a simplex grid")
+    p.add_argument("--step", type=float, default=0.05)
+    p.add_argument("--weights", choices=("task", "no-task"), default="task")
+    p.add_argument("--show", type=int, default=15,
+                   help="Rows to print, least like the shipped ranking first")
+    p = sub.add_parser("fixture", help=f"Rewrite {config.recommend_fixture_path.name}")
+    p.add_argument("--dry-run", action="store_true")
+    sub.add_parser("check", help="Compare the batch scorer with the shared fixture")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.command == "fixture":
+        fixture = build_fixture()
+        cases = sum(len(s["cases"]) for s in fixture["suites"])
+        if args.dry_run:
+            log.info(f"[DRY RUN] Would write {config.recommend_fixture_path} ({cases} cases)")
+        else:
+            write_json(config.recommend_fixture_path, fixture, indent=None)
+            log.info(f"Wrote {config.recommend_fixture_path} ({cases} cases) — run jest to confirm the TS agrees")
+        return
+    if args.command == "check":
+        failures = check_fixture()
+        for f in failures[:20]:
+            log.error(f)
+        if failures:
+            sys.exit(1)
+        log.info("Batch scorer agrees with the shared fixture")
+        return
+
+    catalog = Catalog.from_data(read_json(config.models_path), read_json(config.categories_path))
+    batch = (
+        QueryBatch.random(catalog, args.random, args.seed) if args.random
+        else QueryBatch.grid(catalog)
+    )
+
+    if args.command == "sweep":
+        start = time.perf_counter()
+        rows = sweep(catalog, batch, args.step, args.weights, args.top)
+        elapsed = time.perf_counter() - start
+        log.info(f"{len(rows)} weight vectors × {len(batch):,} queries in {elapsed:.2f}s "
+                 f"({len(rows) * len(batch) / elapsed:,.0f} queries/s)")
+        rows.sort(key=lambda r: (r["top1"], r[f"top{args.top}"], -r["dominance"]))
+        for r in rows[:args.show]:
+            w = " ".join(f"{k}={v:.2f}" for k, v in r["weights"].items())
+            print(f"  {w:<44} top1 {r['top1']:.3f}  top{args.top} "
+                  f"{r[f'top{args.top}']:.3f}  dominance {r['dominance']:.3f}")
+        return
+
+    start = time.perf_counter()
+    result = score_batch(catalog, batch)
+    elapsed = time.perf_counter() - start
+    answered = result.candidates > 0
+    print(f"{len(batch):,} queries × {len(catalog)} models in {elapsed * 1000:.1f} ms "
+          f"({len(batch) / elapsed:,.0f} queries/s); {int((~answered).sum()):,} with no candidate")
+
+    print("\nExcluded by filters:")
+    top1 = np.bincount(result.top(1)[answered, 0], minlength=len(catalog)) / max(answered.sum(), 1)
+    for n, freq in sorted(enumerate(exclusion_frequency(result)), key=lambda x: -x[1]):
+        print(f"  {catalog.ids[n]:<12} {freq:6.1%}   top pick in {top1[n]:6.1%}")
+
+    report = stability(catalog, batch, args.jitter, args.trials, args.top, args.seed)
+    print(f"\nStability under ±{args.jitter:.0%} weight jitter ({args.trials} trials):")
+    for key, value in report.items():
+        print(f"  {key:<12} {value:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+recommend_index.py — Precompute /api/recommend answers into data/recommend_index.json.
+
+Mirrors data/recommend.ts scoreAndRank() exactly (same filters, weights,
+JS rounding and reason strings) and evaluates it ahead of time for:
+
+  - every provider (and no provider filter)
+  - max_cost ∈ COMMON_MAX_COST, min_context ∈ COMMON_MIN_CONTEXT
+  - every category as the matched task (and no task)
+
+Each bucket keeps the top MAX_LIMIT recommendations. Buckets with the same
+candidate set share one entry, so the file grows with the number of distinct
+candidate sets, not with the bucket grid. The route looks buckets up and
+falls back to scoreAndRank() for anything else, or when the `signature`
+block no longer matches models.json / categories.json.
+
+Usage:
+  python scripts/recommend_index.py                       # Rebuild the index
+  python scripts/recommend_index.py --dry-run
+  python scripts/recommend_index.py query --task coding --max-cost 5
+
+Also rebuilt by update_leaderboard.py and add_article.py.
+"""
+
+import argparse
+import math
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, write_json, today_iso
+
+log = setup_logger("recommend-index")
+
+WEIGHTS_TASK = {"task": 0.40, "elo": 0.35, "cost": 0.15, "context": 0.10}
+WEIGHTS_NO_TASK = {"task": 0.00, "elo": 0.55, "cost": 0.25, "context": 0.20}
+
+COMMON_MAX_COST: tuple[float | None, ...] = (None, 1, 2, 5, 10, 20)
+COMMON_MIN_CONTEXT: tuple[int | None, ...] = (None, 32000, 128000, 200000, 1000000)
+MAX_LIMIT = 10  # the route caps ?limit= at 10
+
+INDEX_VERSION = 1
+
+
+class Recommendation(NamedTuple):
+    model: dict
+    score: float
+    reasons: list[str]
+
+
+# ─── JS-compatible formatting ───────────────────────────────────────────────
+
+def _js_round2(x: float) -> float:
+    """
+    Math.round(x * 100) / 100 — JS rounds .5 up, Python's round() to even.
+    floor(y + 0.5) is not equivalent: y + 0.5 itself can round up.
+    """
+    y = x * 100
+    r = math.floor(y)
+    return (r + 1 if y - r >= 0.5 else r) / 100
+
+
+def _js_number(x: float | int) -> str:
+    """`${x}` for a JS number: 5 → "5", 1.25 → "1.25"."""
+    if isinstance(x, float) and x.is_integer():
+        return str(int(x))
+    return repr(x)
+
+
+def _js_fixed0(x: float) -> str:
+    """x.toFixed(0) for x >= 0 (half rounds up)."""
+    return str(math.floor(x + 0.5))
+
+
+# ─── scoreAndRank port ──────────────────────────────────────────────────────
+
+def find_matching_category(task: str, categories: list[dict]) -> dict | None:
+    """Port of findMatchingCategory()."""
+    t = task.lower().strip()
+    if not t:
+        return None
+    for c in categories:
+        if t in c["name"].lower():
+            return c
+    for c in categories:
+        if c["name"].lower().split(" ")[0] in t:
+            return c
+    return None
+
+
+def score_and_rank(
+    models: list[dict],
+    categories: list[dict],
+    task: str | None = None,
+    max_cost: float | None = None,
+    min_context: int | None = None,
+    provider: str | None = None,
+    matched: dict | None = None,
+) -> tuple[list[Recommendation], int, dict | None]:
+    """
+    Port of scoreAndRank(). Returns (recommendations, excluded, matched category).
+    Pass `matched` to skip the task → category lookup.
+    """
+    if matched is None and task:
+        matched = find_matching_category(task, categories)
+
+    candidates = [
+        m for m in models
+        if not (max_cost is not None and m["cost_per_million_tokens"] > max_cost)
+        and not (min_context is not None and m["context_window"] < min_context)
+        and not (provider and provider.lower() not in m["provider"].lower())
+    ]
+    excluded = len(models) - len(candidates)
+    if not candidates:
+        return [], excluded, matched
+
+    weights = WEIGHTS_TASK if matched is not None else WEIGHTS_NO_TASK
+    elos = [m["elo"] for m in candidates]
+    costs = [m["cost_per_million_tokens"] for m in candidates]
+    contexts = [m["context_window"] for m in candidates]
+    min_elo, max_elo = min(elos), max(elos)
+    min_cost, max_cost2 = min(costs), max(costs)
+    min_ctx, max_ctx = min(contexts), max(contexts)
+
+    recommendations = []
+    for m in candidates:
+        reasons = []
+
+        task_score = 0.0
+        if matched is not None:
+            if m["name"] == matched["leader"]:
+                task_score = 1.0
+                reasons.append(f"Category leader for {matched['name']}")
+            elif matched["name"] in m["strengths"]:
+                task_score = 0.5
+                reasons.append(f"Strong in {matched['name']}")
+
+        elo_score = 1 if max_elo == min_elo else (m["elo"] - min_elo) / (max_elo - min_elo)
+        if m["elo"] == max_elo:
+            reasons.append(f"Highest Elo ({_js_number(m['elo'])})")
+        else:
+            reasons.append(f"Elo {_js_number(m['elo'])}")
+
+        cost = m["cost_per_million_tokens"]
+        cost_score = 1 if max_cost2 == min_cost else (max_cost2 - cost) / (max_cost2 - min_cost)
+        if cost == min_cost:
+            reasons.append(f"Most cost-efficient (${_js_number(cost)}/M)")
+
+        ctx = m["context_window"]
+        ctx_score = 1 if max_ctx == min_ctx else (ctx - min_ctx) / (max_ctx - min_ctx)
+        if ctx == max_ctx:
+            reasons.append(f"Largest context ({_js_fixed0(ctx / 1000)}k tokens)")
+
+        score = _js_round2(
+            weights["task"] * task_score
+            + weights["elo"] * elo_score
+            + weights["cost"] * cost_score
+            + weights["context"] * ctx_score
+        )
+        recommendations.append(Recommendation(m, score, reasons))
+
+    recommendations.sort(key=lambda r: -r.score)  # stable, like Array.prototype.sort
+    return recommendations, excluded, matched
+
+
+# ─── Index ──────────────────────────────────────────────────────────────────
+
+def _bucket_key(provider: str | None, max_cost: float | None, min_context: int | None) -> str:
+    """Matches the route's `${provider}|${maxCost}|${minContext}` (empty when unset)."""
+    parts = (
+        provider or "",
+        "" if max_cost is None else _js_number(max_cost),
+        "" if min_context is None else str(min_context),
+    )
+    return "|".join(parts)
+
+
+def signature(models: list[dict], categories: list[dict]) -> dict:
+    """Every input the scores depend on; the route only trusts a matching index."""
+    return {
+        "models": [
+            [m["id"], m["name"], m["provider"], m["elo"], m["cost_per_million_tokens"],
+             m["context_window"], m["strengths"]]
+            for m in models
+        ],
+        "leaders": [[c["name"], c["leader"]] for c in categories],
+    }
+
+
+def build_index(models: list[dict], categories: list[dict]) -> dict:
+    """The full precomputed index for one models/categories pair."""
+    providers = sorted({m["provider"].lower() for m in models})
+    tasks: list[dict | None] = [None, *categories]
+
+    sets: list[dict] = []
+    set_of: dict[tuple[str, ...], int] = {}
+    buckets: dict[str, int] = {}
+    for provider in (None, *providers):
+        for max_cost in COMMON_MAX_COST:
+            for min_context in COMMON_MIN_CONTEXT:
+                key = _bucket_key(provider, max_cost, min_context)
+                candidates = tuple(
+                    m["id"] for m in models
+                    if not (max_cost is not None and m["cost_per_million_tokens"] > max_cost)
+                    and not (min_context is not None and m["context_window"] < min_context)
+                    and not (provider and provider not in m["provider"].lower())
+                )
+                if candidates not in set_of:
+                    ranked = {}
+                    for category in tasks:
+                        recs, excluded, _ = score_and_rank(
+                            models, categories, None, max_cost, min_context, provider,
+                            matched=category,
+                        )
+                        ranked[category["name"] if category else ""] = [
+                            [r.model["id"], r.score, r.reasons] for r in recs[:MAX_LIMIT]
+                        ]
+                    set_of[candidates] = len(sets)
+                    sets.append({"excluded": excluded, "ranked": ranked})
+                buckets[key] = set_of[candidates]
+
+    def bounds(field: str) -> list:
+        values = [m[field] for m in models]
+        return [min(values), max(values)] if values else [None, None]
+
+    return {
+        "version": INDEX_VERSION,
+        "generated": today_iso(),
+        "signature": signature(models, categories),
+        "bounds": {
+            "elo": bounds("elo"),
+            "cost": bounds("cost_per_million_tokens"),
+            "context": bounds("context_window"),
+        },
+        # Unfiltered orderings per category — the "no filters" bucket, by task
+        "categories": {
+            name: [entry[0] for entry in ranking]
+            for name, ranking in sets[buckets[_bucket_key(None, None, None)]]["ranked"].items()
+            if name
+        } if models else {},
+        "providers": providers,
+        "maxCostBuckets": [c for c in COMMON_MAX_COST if c is not None],
+        "minContextBuckets": [c for c in COMMON_MIN_CONTEXT if c is not None],
+        "buckets": buckets,
+        "sets": sets,
+    }
+
+
+def index_if_changed(models: list[dict], categories: list[dict], path: Path | None = None) -> dict | None:
+    """The rebuilt index, or None if it matches the one on disk (ignoring `generated`)."""
+    path = path or config.recommend_index_path
+    index = build_index(models, categories)
+    if path.exists():
+        previous = read_json(path)
+        previous["generated"] = index["generated"]
+        if previous == index:
+            return None
+    return index
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Precomputed /api/recommend index")
+    parser.add_argument("--dry-run", action="store_true", help="Build without writing")
+    sub = parser.add_subparsers(dest="command")
+    p = sub.add_parser("query", help="Answer one query from the live port (no index)")
+    p.add_argument("--task")
+    p.add_argument("--max-cost", type=float)
+    p.add_argument("--min-context", type=int)
+    p.add_argument("--provider")
+    p.add_argument("--limit", type=int, default=3)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    models = read_json(config.models_path)
+    categories = read_json(config.categories_path)
+
+    if args.command == "query":
+        recs, excluded, matched = score_and_rank(
+            models, categories, args.task, args.max_cost, args.min_context, args.provider
+        )
+        print(f"matched category: {matched['name'] if matched else None}, excluded: {excluded}")
+        for i, r in enumerate(recs[:args.limit], 1):
+            print(f"  #{i} {r.model['id']:<10} {r.score:.2f}  {'; '.join(r.reasons)}")
+        return
+
+    index = index_if_changed(models, categories)
+    if index is None:
+        log.info(f"{config.recommend_index_path.name} unchanged")
+    elif args.dry_run:
+        log.info(f"[DRY RUN] Would write {config.recommend_index_path} "
+                 f"({len(index['buckets'])} buckets, {len(index['sets'])} distinct sets)")
+    else:
+        write_json(config.recommend_index_path, index, indent=None)
+        log.info(f"Wrote {config.recommend_index_path} "
+                 f"({len(index['buckets'])} buckets, {len(index['sets'])} distinct sets)")
+
+
+if __name__ == "__main__":
+    main()
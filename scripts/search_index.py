@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+search_index.py — Inverted index over every published article (live and archived).
+
+add_article.py updates data/search_index.json in the same transaction that
+inserts articles, so the site can search without shipping article bodies:
+
+  {"version": 1,
+   "docs":  [["slug", "title", "2026-04-01", length], null, ...],
+   "terms": {"token": [doc, tf, doc, tf, ...], ...}}            sorted keys
+
+A doc is its position in "docs"; removed docs leave a null slot that the
+next insert reuses. Postings are flat (doc, term frequency) pairs. Tokens
+are lowercased, accent-stripped runs of [a-z0-9]; single letters and a few
+stopwords are dropped. Title tokens count TITLE_WEIGHT times.
+
+Search is BM25 over the query tokens, all of which must match. The last
+token also matches as a prefix ("clau" finds "claude"), by bisecting the
+sorted term list. data/search.ts implements the same tokenizer and scoring.
+
+Usage:
+  python scripts/search_index.py search "open weight models"
+  python scripts/search_index.py stats
+  python scripts/search_index.py rebuild              # From articles.json + the archive
+  python scripts/search_index.py rebuild --dry-run
+
+Trimmed articles stay published in the archive (article_archive.py), so
+they stay indexed; rebuild is only for recovery.
+"""
+
+import argparse
+import bisect
+import math
+import re
+import sys
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from utils import setup_logger, read_json, JsonTransaction
+
+log = setup_logger("search-index")
+
+INDEX_VERSION = 1
+TITLE_WEIGHT = 3
+MAX_EXPANSIONS = 50     # prefix matches considered for the last query token
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Keep in step with STOPWORDS in data/search.ts
+STOPWORDS = frozenset(
+    "an and are as at be by for from has in is it its of on or that the this to was were with".split()
+)
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase, strip accents, split on anything but [a-z0-9], drop noise."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return [t for t in _TOKEN.findall(text) if (len(t) > 1 or t.isdigit()) and t not in STOPWORDS]
+
+
+def article_terms(article: dict) -> Counter:
+    """Term frequencies for one article: title (weighted), excerpt, category, body."""
+    counts = Counter(tokenize(article["title"]) * TITLE_WEIGHT)
+    counts.update(tokenize(article.get("excerpt", "")))
+    counts.update(tokenize(article.get("category", "")))
+    for paragraph in article.get("content", []):
+        counts.update(tokenize(paragraph))
+    return counts
+
+
+class Hit(NamedTuple):
+    slug: str
+    title: str
+    date: str
+    score: float
+
+
+class SearchIndex:
+    """Lazily loaded inverted index with incremental add/remove and write-back."""
+
+    def __init__(self, path: Path | None = None, read: Callable[[Path], Any] = read_json) -> None:
+        self.path = path or config.search_index_path
+        self._read = read
+        self._data: dict | None = None
+        self._ids: dict[str, int] | None = None
+        self._sorted_terms: list[str] | None = None
+        self._dirty = False
+
+    # ── Data ─────────────────────────────────────────────────────────────
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            if self.path.exists():
+                self._data = self._read(self.path)
+            else:
+                self._data = {"version": INDEX_VERSION, "docs": [], "terms": {}}
+        return self._data
+
+    @property
+    def ids(self) -> dict[str, int]:
+        """slug → doc."""
+        if self._ids is None:
+            self._ids = {d[0]: i for i, d in enumerate(self.data["docs"]) if d is not None}
+        return self._ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self.ids
+
+    def terms_with_prefix(self, prefix: str) -> list[str]:
+        """Indexed terms starting with prefix, in sorted order."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.data["terms"])
+        terms = self._sorted_terms
+        out = []
+        for i in range(bisect.bisect_left(terms, prefix), len(terms)):
+            if not terms[i].startswith(prefix):
+                break
+            out.append(terms[i])
+        return out
+
+    def postings(self) -> dict[str, dict[str, int]]:
+        """term → {slug: tf}, independent of doc numbering (for comparisons)."""
+        docs = self.data["docs"]
+        return {
+            term: {docs[p[i]][0]: p[i + 1] for i in range(0, len(p), 2)}
+            for term, p in self.data["terms"].items()
+        }
+
+    # ── Mutation ─────────────────────────────────────────────────────────
+
+    def add(self, articles: Iterable[dict]) -> None:
+        """Index articles; an already indexed slug is re-indexed."""
+        docs, terms = self.data["docs"], self.data["terms"]
+        free = [i for i, d in enumerate(docs) if d is None]
+        free.reverse()
+        for article in articles:
+            if article["slug"] in self.ids:
+                free.append(self._remove_doc(self.ids[article["slug"]]))
+            counts = article_terms(article)
+            doc = free.pop() if free else len(docs)
+            entry = [article["slug"], article["title"], article["date"], sum(counts.values())]
+            if doc == len(docs):
+                docs.append(entry)
+            else:
+                docs[doc] = entry
+            self.ids[article["slug"]] = doc
+            for term, tf in counts.items():
+                if term not in terms:
+                    self._sorted_terms = None
+                terms.setdefault(term, []).extend((doc, tf))
+            self._dirty = True
+
+    def remove(self, article: dict) -> bool:
+        """Drop an article, touching only the postings of its own terms."""
+        doc = self.ids.get(article["slug"])
+        if doc is None:
+            return False
+        self._remove_doc(doc, article_terms(article))
+        return True
+
+    def _remove_doc(self, doc: int, terms: Iterable[str] | None = None) -> int:
+        # Without the article text every posting list has to be scanned
+        index = self.data["terms"]
+        for term in list(index if terms is None else terms):
+            p = index.get(term)
+            if p is None:
+                continue
+            kept = [x for i in range(0, len(p), 2) if p[i] != doc for x in p[i:i + 2]]
+            if kept:
+                index[term] = kept
+            else:
+                del index[term]
+                self._sorted_terms = None
+        del self.ids[self.data["docs"][doc][0]]
+        self.data["docs"][doc] = None
+        self._dirty = True
+        return doc
+
+    def rebuild(self, articles: Iterable[dict]) -> None:
+        """Replace the whole index with one built from articles."""
+        self._data = {"version": INDEX_VERSION, "docs": [], "terms": {}}
+        self._ids = {}
+        self._sorted_terms = None
+        self.add(articles)
+        self._dirty = True
+
+    @property
+    def dirty_paths(self) -> list[Path]:
+        return [self.path] if self._dirty else []
+
+    def write(self, txn: JsonTransaction) -> list[Path]:
+        """Stage the index in txn (compact, sorted terms). Returns its path."""
+        paths = self.dirty_paths
+        if paths:
+            data = self.data
+            data["terms"] = {t: data["terms"][t] for t in sorted(data["terms"])}
+            txn.write(self.path, data, indent=None)
+            self._dirty = False
+        return paths
+
+    # ── Search ───────────────────────────────────────────────────────────
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> list[Hit]:
+        """Docs matching every query token, best BM25 score first."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        docs, index = self.data["docs"], self.data["terms"]
+        if not tokens or not self.ids:
+            return []
+        n = len(self.ids)
+        avg_len = sum(d[3] for d in docs if d is not None) / n
+
+        scores: dict[int, float] | None = None
+        for i, token in enumerate(tokens):
+            expansions = (
+                self.terms_with_prefix(token)[:MAX_EXPANSIONS]
+                if prefix and i == len(tokens) - 1
+                else [token] if token in index else []
+            )
+            token_scores: dict[int, float] = {}
+            for term in expansions:
+                p = index[term]
+                df = len(p) // 2
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                for j in range(0, len(p), 2):
+                    doc, tf = p[j], p[j + 1]
+                    norm = 1 - BM25_B + BM25_B * docs[doc][3] / avg_len
+                    score = idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+                    token_scores[doc] = token_scores.get(doc, 0.0) + score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {d: s + token_scores[d] for d, s in scores.items() if d in token_scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], _neg_date(docs[kv[0]][2]), docs[kv[0]][0]))
+        return [Hit(docs[d][0], docs[d][1], docs[d][2], s) for d, s in ranked[:limit]]
+
+
+def _neg_date(date: str) -> tuple[int, ...]:
+    """Sort key for newest first on ties."""
+    return tuple(-int(x) for x in date.split("-"))
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Article search index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("search", help="Query the index")
+    p.add_argument("query")
+    p.add_argument("--limit", type=int, default=10)
+    p.add_argument("--exact", action="store_true", help="No prefix match on the last token")
+    p = sub.add_parser("rebuild", help="Rebuild from articles.json and the archive")
+    p.add_argument("--dry-run", action="store_true", help="Report drift without writing")
+    sub.add_parser("stats", help="Docs, terms and postings")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.command == "search":
+        index = SearchIndex()
+        for hit in index.search(args.query, args.limit, prefix=not args.exact):
+            print(f"  {hit.score:7.3f}  {hit.date}  {hit.slug:<50} {hit.title}")
+    elif args.command == "stats":
+        index = SearchIndex()
+        postings = sum(len(p) // 2 for p in index.data["terms"].values())
+        size = index.path.stat().st_size if index.path.exists() else 0
+        print(f"  docs      {len(index):>7}")
+        print(f"  terms     {len(index.data['terms']):>7}")
+        print(f"  postings  {postings:>7}")
+        print(f"  size      {size / 1024:>7.1f} KB")
+    else:
+        from datastore import open_store
+        from article_bodies import all_articles
+        with open_store() as store:
+            before = store.search.postings()
+            store.search.rebuild(all_articles(store))
+            drift = before != store.search.postings()
+            log.info(f"Indexed {len(store.search)} articles, {len(store.search.data['terms'])} terms "
+                     f"({'drift repaired' if drift else 'no drift'}{', dry run' if args.dry_run else ''})")
+            if not args.dry_run:
+                store.commit()
+
+
+if __name__ == "__main__":
+    main()
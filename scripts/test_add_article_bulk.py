@@ -0,0 +1,253 @@
+"""
+test_add_article_bulk.py — Offline tests for add_article.py bulk mode: JSONL and
+directory input, per-entry error reporting, --strict exit status, slug
+collisions inside one batch and the process-pool validation path; plus date
+validation and the month-sharded archive (article_archive.py) trimmed
+articles move to.
+
+Run with: python scripts/test_add_article_bulk.py
+"""
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+from dataclasses import fields
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import add_article
+from add_article import PARALLEL_MIN, bulk_main, prepare_batch, read_batch, validate_input
+from article_archive import ArticleArchive, shard_of
+from config import config
+from utils import JsonTransaction, read_json, write_json
+
+WORDS = ("model benchmark latency token context reasoning agent vision audio "
+         "training inference dataset eval prompt safety cost open weights arena").split()
+
+
+def _article(rng: random.Random, title: str, **extra) -> dict:
+    """A valid article whose body is random enough not to be a near-duplicate."""
+    content = [" ".join(rng.choices(WORDS, k=40)) + f" {title} {i}" for i in range(3)]
+    return {"title": title, "excerpt": f"About {title}.", "category": "Analysis",
+            "content": content, "date": "2026-10-18", **extra}
+
+
+def _args(**overrides) -> argparse.Namespace:
+    args = dict(dir=None, jsonl=None, strict=False, workers=1, allow_duplicates=False, dry_run=False)
+    return argparse.Namespace(**{**args, **overrides})
+
+
+class _Capture(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(record.getMessage())
+
+
+def _run(args: argparse.Namespace, capture: _Capture) -> int:
+    """bulk_main's exit status; capture holds only this run's log lines."""
+    capture.lines.clear()
+    try:
+        bulk_main(args)
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+def _reset(root: Path) -> None:
+    """Fresh data files: no articles, archive, bodies or indexes."""
+    for name in ("content", "archive", "search_index.json", "minhash_index.json", "recommend_index.json"):
+        path = root / name
+        if path.is_dir():
+            for f in path.rglob("*"):
+                if f.is_file():
+                    f.unlink()
+        elif path.exists():
+            path.unlink()
+    write_json(config.models_path, [])
+    write_json(config.categories_path, [])
+    write_json(config.articles_path, [])
+    write_json(config.site_path, {"lastUpdated": "2026-10-01"})
+
+
+class _CountingPool(add_article.ProcessPoolExecutor):
+    created = 0
+
+    def __init__(self, *args, **kwargs) -> None:
+        type(self).created += 1
+        super().__init__(*args, **kwargs)
+
+
+def main() -> None:
+    failures: list[str] = []
+    rng = random.Random(21)
+    capture = _Capture()
+    add_article.log.addHandler(capture)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        saved = {f.name: getattr(config, f.name) for f in fields(config) if f.name.endswith(("_path", "_dir"))}
+        try:
+            for name, value in saved.items():
+                setattr(config, name, root / "data" / value.name)
+            data = root / "data"
+            data.mkdir()
+            _reset(data)
+
+            # Test 1: read_batch — JSONL sources are file:line, blank lines skipped;
+            # a directory gives every *.json, sorted by name
+            jsonl = root / "batch.jsonl"
+            jsonl.write_text('{"a": 1}\n\n   \n{"b": 2}\n', encoding="utf-8")
+            if read_batch(jsonl, jsonl=True) != [("batch.jsonl:1", '{"a": 1}'), ("batch.jsonl:4", '{"b": 2}')]:
+                failures.append(f"FAIL: JSONL items {read_batch(jsonl, jsonl=True)}")
+            drafts = root / "drafts"
+            drafts.mkdir()
+            for name in ("b.json", "a.json", "notes.txt"):
+                (drafts / name).write_text("{}", encoding="utf-8")
+            if [source for source, _ in read_batch(drafts, jsonl=False)] != ["a.json", "b.json"]:
+                failures.append(f"FAIL: directory items {read_batch(drafts, jsonl=False)}")
+
+            # Test 2: a mixed JSONL batch — valid lines are written, each bad line is
+            # reported by line number, and without --strict the exit status is 0
+            lines = [
+                json.dumps(_article(rng, "First Post")),
+                "{not json",
+                json.dumps(["a", "list"]),
+                json.dumps({**_article(rng, "Bad Category"), "category": "Gossip"}),
+                json.dumps(_article(rng, "Second Post")),
+            ]
+            jsonl.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            status = _run(_args(jsonl=jsonl), capture)
+            slugs = [a["slug"] for a in read_json(config.articles_path)]
+            if status != 0 or sorted(slugs) != ["first-post", "second-post"]:
+                failures.append(f"FAIL: mixed batch exited {status}, wrote {slugs}")
+            errors = [line for line in capture.lines if line.startswith("  ✗")]
+            expected = ["batch.jsonl:2: Invalid JSON", "batch.jsonl:3: Expected a JSON object",
+                        "batch.jsonl:4: 'category' must be one of"]
+            if len(errors) != 3 or any(f"✗ {e}" not in line for e, line in zip(expected, errors)):
+                failures.append(f"FAIL: per-line errors {errors}")
+            if "Report (2 valid, 3 rejected):" not in capture.lines:
+                failures.append(f"FAIL: report header missing from {capture.lines}")
+
+            # Test 3: --strict — one bad entry means nothing is written and exit 1
+            _reset(data)
+            status = _run(_args(jsonl=jsonl, strict=True), capture)
+            if status != 1 or read_json(config.articles_path) != []:
+                failures.append(f"FAIL: --strict exited {status}, wrote {read_json(config.articles_path)}")
+            jsonl.write_text(lines[0] + "\n" + lines[4] + "\n", encoding="utf-8")
+            status = _run(_args(jsonl=jsonl, strict=True), capture)
+            if status != 0 or len(read_json(config.articles_path)) != 2:
+                failures.append(f"FAIL: clean --strict batch exited {status}")
+
+            # Test 4: slug collisions inside one directory batch and with a published slug
+            _reset(data)
+            for f in drafts.iterdir():
+                f.unlink()
+            write_json(drafts / "1.json", _article(rng, "Same Title"))
+            write_json(drafts / "2.json", _article(rng, "Same Title"))
+            write_json(drafts / "3.json", _article(rng, "Other", slug="same-title"))
+            status = _run(_args(dir=drafts), capture)
+            today = add_article.today_iso()
+            slugs = sorted(a["slug"] for a in read_json(config.articles_path))
+            if status != 0 or slugs != sorted(["same-title", f"same-title-{today}", f"same-title-{today}-2"]):
+                failures.append(f"FAIL: in-batch collisions gave {slugs} (exit {status})")
+            renamed = [line for line in capture.lines if "renamed from 'same-title'" in line]
+            if len(renamed) != 2:
+                failures.append(f"FAIL: renames not reported: {capture.lines}")
+            for f in drafts.iterdir():
+                f.unlink()
+            write_json(drafts / "4.json", _article(rng, "Fresh", slug="same-title"))
+            _run(_args(dir=drafts), capture)
+            if f"same-title-{today}-3" not in {a["slug"] for a in read_json(config.articles_path)}:
+                failures.append("FAIL: collision with a published slug not renamed")
+
+            # Test 5: from PARALLEL_MIN entries validation runs in a process pool,
+            # with the same results, in input order
+            items = [(f"big.jsonl:{n}", json.dumps(_article(rng, f"Bulk {n}"))) for n in range(PARALLEL_MIN)]
+            items[7] = ("big.jsonl:7", "{broken")
+            add_article.ProcessPoolExecutor = _CountingPool
+            try:
+                parallel = prepare_batch(items, workers=2)
+                small = prepare_batch(items[:PARALLEL_MIN - 1], workers=2)
+            finally:
+                add_article.ProcessPoolExecutor = _CountingPool.__bases__[0]
+            if _CountingPool.created != 1:
+                failures.append(f"FAIL: {_CountingPool.created} process pool(s) for one large and one small batch")
+            if parallel != prepare_batch(items, workers=1) or parallel[:PARALLEL_MIN - 1] != small:
+                failures.append("FAIL: process pool results differ from the sequential path")
+            if [p.source for p in parallel] != [s for s, _ in items] or parallel[7].article is not None:
+                failures.append("FAIL: process pool lost input order or the bad entry")
+
+            # Test 6: dates must be YYYY-MM-DD — anything else would name a bogus
+            # (or escaping) archive shard; shard_of refuses them too
+            for bad in ("April 2026", "2026/4/1", "2026-4-01", "2026-02-30", "2026-W14-3",
+                        "20260401", "../../etc", 20260401):
+                if not any("'date'" in e for e in validate_input(_article(rng, "Dated", date=bad))):
+                    failures.append(f"FAIL: date {bad!r} accepted")
+            for bad in ("April 2026", "2026/4/1", "2026-4-01", "2026-13-01", "../../etc", 20260401, None):
+                try:
+                    shard_of({"slug": "dated", "date": bad})
+                    failures.append(f"FAIL: shard_of accepted {bad!r}")
+                except ValueError:
+                    pass
+            if validate_input(_article(rng, "Dated", date="2026-02-28")) or shard_of({"date": "2026-02-28"}) != "2026-02":
+                failures.append("FAIL: a valid date rejected")
+
+        finally:
+            for name, value in saved.items():
+                setattr(config, name, value)
+            add_article.log.removeHandler(capture)
+
+        # Test 7: the archive — shards newest first with counts, replacement
+        # re-shards, slice/page walk shards in order, and it reloads from disk
+        archive_dir = root / "archive"
+        archive = ArticleArchive(archive_dir)
+        dated = [{"slug": f"a{n}", "title": f"A{n}", "date": d} for n, d in enumerate(
+            ["2026-03-05", "2026-04-20", "2026-03-28", "2026-01-02", "2026-04-01"]
+        )]
+        archive.add(dated)
+        archive.add([{"slug": "a3", "title": "A3 moved", "date": "2026-04-10"}])
+        txn = JsonTransaction()
+        written = archive.write(txn)
+        txn.commit()
+        if sorted(p.name for p in written) != ["2026-01.json", "2026-03.json", "2026-04.json", "index.json"]:
+            failures.append(f"FAIL: archive wrote {[p.name for p in written]}")
+        for label, a in (("live", archive), ("reloaded", ArticleArchive(archive_dir))):
+            if a.index["shards"] != {"2026-04": 3, "2026-03": 2}:
+                failures.append(f"FAIL: {label} shard counts {a.index['shards']}")
+            order = [x["slug"] for x in a.slice(0, 10)]
+            if order != ["a1", "a3", "a4", "a2", "a0"]:
+                failures.append(f"FAIL: {label} archive order {order}")
+            if [x["slug"] for x in a.slice(2, 2)] != ["a4", "a2"]:
+                failures.append(f"FAIL: {label} slice across shards {a.slice(2, 2)}")
+            page, total = a.page(2, per_page=2)
+            if [x["slug"] for x in page] != ["a4", "a2"] or total != 5 or a.page(4, per_page=2) != ([], 5):
+                failures.append(f"FAIL: {label} paging {page}, {total}")
+            if a.get("a3")["title"] != "A3 moved" or a.slugs["a3"] != "2026-04" or a.get("nope") is not None:
+                failures.append(f"FAIL: {label} lookup after re-sharding")
+        if read_json(archive_dir / "2026-01.json") != []:
+            failures.append("FAIL: the emptied shard still holds articles")
+
+        # Test 8: a malformed date is refused before anything changes
+        before = json.dumps(archive.index, sort_keys=True)
+        try:
+            archive.add([{"slug": "ok", "date": "2026-05-01"}, {"slug": "evil", "date": "../../x"}])
+            failures.append("FAIL: archive accepted a malformed date")
+        except ValueError:
+            pass
+        if json.dumps(archive.index, sort_keys=True) != before or archive.dirty_paths:
+            failures.append("FAIL: a refused batch changed the archive")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,42 @@
 """
-test_arena.py — Offline, dependency-free tests for arena.py resolution logic.
+test_arena.py — Offline tests for arena.py: resolution, caching, parsing, and the
+full fetch pipeline against the local stand-in from arena_fixtures.py.
 
 Run with: python scripts/test_arena.py
 """
+import hashlib
+import json
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from arena import _resolve_model_id, _ArenaEntry
+import arena
+import http_client
+from arena import _resolve_model_id, _ArenaEntry, NameResolver
+from arena_fixtures import Fixture, serve_arena, synthetic_csv, synthetic_history
+
+
+def _cache_state(path: Path) -> tuple[int, bytes] | None:
+    """(mtime_ns, content) of a cache file, None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns, path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+class _FakeResponse:
+    """Just enough of requests.Response for the cache helpers."""
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
 
 
 def main() -> None:
     failures: list[str] = []
+    real_cache = arena._CACHE_PATH
+    real_cache_before = _cache_state(real_cache)
 
     # The first (highest-priority) name-map candidate for "claude"
     CLAUDE_ARENA_NAME = "claude-opus-4-7-thinking"
@@ -41,12 +66,337 @@ def main() -> None:
             f"returned '{result2.name}' — fuzzy match must be gone"
         )
 
+    # Test 3: batch resolver — one index, case-insensitive, reports the matched
+    # candidate, honours name-map priority and omits unmatched IDs
+    batch_entries = {
+        "Claude-Opus-4-6": _ArenaEntry(name="Claude-Opus-4-6", score=1500.0),
+        "claude-opus-4-5": _ArenaEntry(name="claude-opus-4-5", score=1480.0),
+        "gemini-3-pro": _ArenaEntry(name="gemini-3-pro", score=1490.0),
+    }
+    resolved = NameResolver(batch_entries).resolve_many(["claude", "gemini", "grok"])
+    if set(resolved) != {"claude", "gemini"}:
+        failures.append(f"FAIL: resolve_many matched {sorted(resolved)}")
+    elif resolved["claude"][0] != "claude-opus-4-6" or resolved["claude"][1].score != 1500.0:
+        failures.append(f"FAIL: resolve_many('claude') returned {resolved['claude']!r}")
+    custom = NameResolver(batch_entries, {"mine": ["GEMINI-3-PRO"]}).resolve("mine")
+    if not custom or custom[1].name != "gemini-3-pro":
+        failures.append(f"FAIL: NameResolver with a custom name map returned {custom!r}")
+
+    # Test 4: cache round-trip — stored validators become conditional headers,
+    # and cache_only mode returns the stored parse without touching the network
+    with tempfile.TemporaryDirectory() as tmp:
+        original_path = arena._CACHE_PATH
+        arena._CACHE_PATH = Path(tmp) / "cache" / "arena.json"
+        try:
+            entries = {CLAUDE_ARENA_NAME: _ArenaEntry(name=CLAUDE_ARENA_NAME, score=1520.0)}
+            resp = _FakeResponse({"ETag": '"abc"', "Last-Modified": "Mon, 01 Jun 2026 00:00:00 GMT"})
+            arena._store_in_cache(
+                "nakasyou", arena._NAKASYOU_JSON_URL, resp, {arena.OVERALL_BOARD: entries},
+                snapshot="20260601",
+            )
+
+            cached = arena._load_cache().get("nakasyou")
+            headers = arena._conditional_headers(cached)
+            if headers.get("If-None-Match") != '"abc"' or "If-Modified-Since" not in headers:
+                failures.append(f"FAIL: conditional headers from cache wrong: {headers}")
+
+            offline = arena._fetch_all_scores(cache_only=True)
+            if offline.get(CLAUDE_ARENA_NAME) != entries[CLAUDE_ARENA_NAME]:
+                failures.append(f"FAIL: cache_only fetch returned {offline!r}")
+
+            # A record fetched from another URL (e.g. the stand-in) is a miss
+            original_url = arena._NAKASYOU_JSON_URL
+            arena._NAKASYOU_JSON_URL = "http://127.0.0.1:8765/scores.json"
+            try:
+                if arena._cached("nakasyou", arena._NAKASYOU_JSON_URL) is not None:
+                    failures.append("FAIL: cache record served for a different URL")
+                if arena._fetch_all_scores(cache_only=True):
+                    failures.append("FAIL: cache_only fetch used another URL's record")
+            finally:
+                arena._NAKASYOU_JSON_URL = original_url
+        finally:
+            arena._CACHE_PATH = original_path
+
+    # Test 5: streaming parser keeps only the latest snapshot, whatever the key
+    # order and however the bytes are chunked (incl. splits inside UTF-8 sequences)
+    history = {
+        "20260510": {"text": {"overall": {"old-model": 1400.0}}},
+        "20260524": {"text": {"overall": {"café-model": 1490.5, CLAUDE_ARENA_NAME: 1520}}},
+        "20260517": {"text": {"overall": {"mid-model": 1450.0}}},
+    }
+    payload = json.dumps(history, indent=1, ensure_ascii=False).encode("utf-8")
+    for size in (1, 7, 64, len(payload)):
+        chunks = [payload[i:i + size] for i in range(0, len(payload), size)]
+        latest, snapshot = arena._parse_latest_snapshot(chunks)
+        if latest != "20260524" or snapshot != history["20260524"]:
+            failures.append(
+                f"FAIL: _parse_latest_snapshot(chunk={size}) returned {latest!r}, {snapshot!r}"
+            )
+    try:
+        arena._parse_latest_snapshot([payload[:-20]])
+        failures.append("FAIL: truncated scores.json did not raise ValueError")
+    except ValueError:
+        pass
+
+    # Test 6: concurrent race — sources overlap in time, priority order wins,
+    # and a failing primary falls through to the already-running fallback
+    def _slow(result, delay=0.3):
+        def fetch(cache_only=False, cancel=None, url=None, cache_path=None):
+            time.sleep(delay)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return fetch
+
+    primary = {arena.OVERALL_BOARD: {"p": _ArenaEntry(name="p", score=1.0)}}
+    fallback = {arena.OVERALL_BOARD: {"f": _ArenaEntry(name="f", score=2.0)}}
+    original_sources = arena._SOURCES
+    try:
+        arena._SOURCES = [
+            ("primary", "p", _slow(primary)),
+            ("fallback", "f", _slow(fallback, 0.05)),
+        ]
+        if arena._fetch_all_boards() != primary:
+            failures.append("FAIL: concurrent fetch did not prefer the primary source")
+
+        arena._SOURCES = [
+            ("primary", "p", _slow(OSError("boom"))),
+            ("fallback", "f", _slow(fallback)),
+        ]
+        start = time.perf_counter()
+        result = arena._fetch_all_boards()
+        elapsed = time.perf_counter() - start
+        if result != fallback:
+            failures.append("FAIL: concurrent fetch did not fall back after primary failure")
+        if elapsed >= 0.55:
+            failures.append(f"FAIL: sources did not run concurrently ({elapsed:.2f}s)")
+    finally:
+        arena._SOURCES = original_sources
+
+    # Test 7: one snapshot yields every board; non-board keys are ignored
+    snapshot = {
+        "text": {
+            "overall": {CLAUDE_ARENA_NAME: 1520, "gemini-3-pro": 1490.5},
+            "coding": {CLAUDE_ARENA_NAME: 1540.0},
+        },
+        "vision": {"overall": {"gemini-3-pro": 1300.0}},
+        "meta": "not a board",
+    }
+    boards = arena._boards_from_snapshot(snapshot)
+    if sorted(boards) != ["text/coding", "text/overall", "vision/overall"]:
+        failures.append(f"FAIL: _boards_from_snapshot boards {sorted(boards)}")
+    elif boards["text/coding"][CLAUDE_ARENA_NAME].score != 1540.0:
+        failures.append("FAIL: _boards_from_snapshot lost the coding score")
+
+    # Test 8: CSV layout resolved once from the header (BOM, alternate names),
+    # votes and CI captured, later score columns used when the first is blank
+    lines = [
+        "\ufeffrank,Model,Arena Score,rating,95% CI,Votes",
+        "1,claude-opus-4-7,1512.5,,+4/-5,20345",
+        "2,gpt-5.5,,1499,+6/-6,not-a-number",
+        "3,,1400,,,",
+        "4,no-score,,,,",
+    ]
+    parsed = arena._parse_csv_lines(lines)
+    expected = {
+        "claude-opus-4-7": _ArenaEntry("claude-opus-4-7", 1512.5, 20345, "+4/-5"),
+        "gpt-5.5": _ArenaEntry("gpt-5.5", 1499.0, 0, "+6/-6"),
+    }
+    if parsed != expected:
+        failures.append(f"FAIL: _parse_csv_lines returned {parsed!r}")
+
+    # Test 9: end-to-end against the local stand-in — fetch, parse, resolve,
+    # then a 304 on the second run, then primary 5xx and primary timeout both
+    # falling back to the CSV
+    http_client.BACKOFF_BASE, saved_backoff = 0.01, http_client.BACKOFF_BASE
+    http_client.MAX_RETRIES, saved_retries = 1, http_client.MAX_RETRIES
+    try:
+        history = Fixture(synthetic_history(8, 20, extra_names={CLAUDE_ARENA_NAME: 1530.0}))
+        fallback_csv = Fixture(synthetic_csv(20, extra_names={CLAUDE_ARENA_NAME: 1510.0}))
+        with serve_arena(history, fallback_csv):
+            first = arena.fetch_scores(["claude", "gemini"])
+            second = arena.fetch_scores(["claude"])
+            if first != {"claude": 1530.0} or second != {"claude": 1530.0}:
+                failures.append(f"FAIL: stand-in fetch returned {first!r}, then {second!r}")
+            if history.requests != 2:
+                failures.append(f"FAIL: expected 2 nakasyou requests, got {history.requests}")
+            fingerprint = arena.snapshot_fingerprint() or {}
+            if (fingerprint.get("source"), fingerprint.get("sha256")) != (
+                "nakasyou", hashlib.sha256(history.body).hexdigest()
+            ):
+                failures.append(f"FAIL: snapshot_fingerprint() returned {fingerprint!r}")
+
+        # Test 10: several catalogs, one fetch — each resolves with its own name map
+        history = Fixture(synthetic_history(
+            8, 20, extra_names={CLAUDE_ARENA_NAME: 1530.0, "gemma-4-31b-it": 1450.0}
+        ))
+        with serve_arena(history, fallback_csv):
+            catalogs = arena.fetch_catalogs(
+                {"models": ["claude", "gemma"], "open_weight_models": ["claude", "gemma"]}
+            )
+            overall = {name: boards.get(arena.OVERALL_BOARD) for name, boards in catalogs.items()}
+            if overall != {"models": {"claude": 1530.0}, "open_weight_models": {"gemma": 1450.0}}:
+                failures.append(f"FAIL: fetch_catalogs returned {overall!r}")
+            if history.requests != 1:
+                failures.append(f"FAIL: fetch_catalogs made {history.requests} requests, expected 1")
+
+        history = Fixture(synthetic_history(8, 20), fail_first=10)
+        with serve_arena(history, fallback_csv):
+            result = arena.fetch_scores(["claude"])
+            if result != {"claude": 1510.0} or history.requests != 2:
+                failures.append(
+                    f"FAIL: 5xx primary → {result!r} after {history.requests} request(s)"
+                )
+
+        history = Fixture(synthetic_history(8, 20), latency=1.0)
+        http_client.HOST_TIMEOUTS["127.0.0.1"] = (1.0, 0.2)
+        with serve_arena(history, fallback_csv):
+            result = arena.fetch_scores(["claude"])
+            if result != {"claude": 1510.0}:
+                failures.append(f"FAIL: timed-out primary → {result!r}")
+    finally:
+        http_client.BACKOFF_BASE, http_client.MAX_RETRIES = saved_backoff, saved_retries
+        http_client.HOST_TIMEOUTS.pop("127.0.0.1", None)
+
+    # Test 11: a hanging primary with the default retries and backoff costs
+    # RACE_DEADLINE, not every attempt — the finished fallback wins at the deadline
+    history = Fixture(synthetic_history(8, 20), latency=5.0)
+    http_client.HOST_TIMEOUTS["127.0.0.1"] = (1.0, 0.3)
+    arena.RACE_DEADLINE, saved_deadline = 0.8, arena.RACE_DEADLINE
+    try:
+        with serve_arena(history, fallback_csv):
+            start = time.perf_counter()
+            result = arena.fetch_scores(["claude"])
+            elapsed = time.perf_counter() - start
+            if result != {"claude": 1510.0} or arena._last_source != "csv":
+                failures.append(f"FAIL: hanging primary with retries → {result!r}")
+            if not 0.7 <= elapsed < 1.1:
+                failures.append(f"FAIL: hanging primary held the race for {elapsed:.2f}s")
+    finally:
+        arena.RACE_DEADLINE = saved_deadline
+        http_client.HOST_TIMEOUTS.pop("127.0.0.1", None)
+
+    # Test 12: sources storing from their own threads never drop each other's record
+    with tempfile.TemporaryDirectory() as tmp:
+        original_path = arena._CACHE_PATH
+        arena._CACHE_PATH = Path(tmp) / "arena.json"
+        try:
+            boards = {arena.OVERALL_BOARD: {"m": _ArenaEntry(name="m", score=1.0)}}
+
+            def _store(source: str) -> None:
+                for _ in range(50):
+                    arena._store_in_cache(source, f"http://{source}/", _FakeResponse({}), boards)
+
+            threads = [threading.Thread(target=_store, args=(s,)) for s in ("nakasyou", "csv")]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            if sorted(arena._load_cache()) != ["csv", "nakasyou"]:
+                failures.append(f"FAIL: concurrent cache writes kept {sorted(arena._load_cache())}")
+            if list(Path(tmp).glob("*.tmp")):
+                failures.append("FAIL: concurrent cache writes left temp files behind")
+        finally:
+            arena._CACHE_PATH = original_path
+
+    # Test 13: a 200 whose payload matches the cache is hashed, never parsed;
+    # a 200 repeating the cached ETag is not even downloaded
+    parses = []
+    original_parse = arena._parse_latest_snapshot
+
+    def counting_parse(chunks):
+        parses.append(1)
+        return original_parse(chunks)
+
+    arena._parse_latest_snapshot = counting_parse
+    try:
+        history = Fixture(synthetic_history(8, 20, extra_names={CLAUDE_ARENA_NAME: 1530.0}))
+        with serve_arena(history, fallback_csv):
+            arena.fetch_scores(["claude"])
+            history.headers["ETag"] = '"same-bytes-new-etag"'
+            again = arena.fetch_scores(["claude"])
+            fingerprint = arena.snapshot_fingerprint() or {}
+            if again != {"claude": 1530.0} or len(parses) != 1:
+                failures.append(f"FAIL: unchanged payload with a new ETag parsed {len(parses)} time(s)")
+            if fingerprint.get("etag") != '"same-bytes-new-etag"':
+                failures.append(f"FAIL: new validators not cached: {fingerprint!r}")
+            history.body = synthetic_history(8, 20, extra_names={CLAUDE_ARENA_NAME: 1540.0})
+            history.headers["ETag"] = '"new-bytes"'
+            if arena.fetch_scores(["claude"]) != {"claude": 1540.0} or len(parses) != 2:
+                failures.append(f"FAIL: changed payload → {len(parses)} parse(s)")
+    finally:
+        arena._parse_latest_snapshot = original_parse
+    ok = _FakeResponse({"ETag": '"abc"'})
+    if not arena._same_validators(ok, {"etag": '"abc"', "boards": {"x": {}}}):
+        failures.append("FAIL: a 200 with the cached ETag not treated as unmodified")
+    if arena._same_validators(ok, {"etag": '"old"', "last_modified": None, "boards": {"x": {}}}):
+        failures.append("FAIL: a 200 with a new ETag treated as unmodified")
+
+    # Test 14: a source that finishes after losing the race writes nothing, and it
+    # keeps the cache path and URL it started with even if they change mid-run
+    with tempfile.TemporaryDirectory() as tmp:
+        original_path, original_sources = arena._CACHE_PATH, arena._SOURCES
+        run_path = arena._CACHE_PATH = Path(tmp) / "run" / "arena.json"
+        seen: list[tuple[str, Path]] = []
+        loser_done = threading.Event()
+
+        def _storing(result, delay):
+            def fetch(cache_only=False, cancel=None, url=None, cache_path=None):
+                time.sleep(delay)
+                seen.append((url, cache_path))
+                arena._store_in_cache("csv", url, _FakeResponse({}), result, path=cache_path, cancel=cancel)
+                loser_done.set()
+                return result
+            return fetch
+
+        try:
+            arena._SOURCES = [
+                ("primary", "nakasyou", _slow(primary, 0.05)),
+                ("fallback", "csv", _storing(fallback, 0.4)),
+            ]
+            if arena._fetch_all_boards() != primary:
+                failures.append("FAIL: race with a slow storing loser did not prefer the primary")
+            arena._CACHE_PATH = Path(tmp) / "later" / "arena.json"
+            if not loser_done.wait(5):
+                failures.append("FAIL: losing source never finished")
+            if seen != [(arena._FALLBACK_CSV_URL, run_path)]:
+                failures.append(f"FAIL: losing source ran against {seen}")
+            if list(Path(tmp).rglob("arena.json")):
+                failures.append("FAIL: a cancelled source wrote the cache")
+        finally:
+            arena._CACHE_PATH, arena._SOURCES = original_path, original_sources
+
+    # Test 15: a streamed body that breaks off mid-way (which http_client does not
+    # retry) is downloaded again once; a second break fails over to the CSV
+    http_client.BACKOFF_BASE, saved_backoff = 0.01, http_client.BACKOFF_BASE
+    try:
+        for cuts, source in ((1, "nakasyou"), (2, "csv")):
+            history = Fixture(synthetic_history(8, 20, extra_names={CLAUDE_ARENA_NAME: 1530.0}), cut_first=cuts)
+            with serve_arena(history, fallback_csv):
+                result = arena.fetch_scores(["claude"])
+                expected = {"claude": 1530.0 if source == "nakasyou" else 1510.0}
+                if result != expected or arena._last_source != source or history.requests != 2:
+                    failures.append(
+                        f"FAIL: {cuts} cut body(ies) → {result!r} from {arena._last_source} "
+                        f"after {history.requests} request(s)"
+                    )
+    finally:
+        http_client.BACKOFF_BASE = saved_backoff
+
+    # Test 16: nothing above touched the real data/cache/arena.json, including
+    # losing sources that outlived their stand-in block
+    for t in threading.enumerate():
+        if t.name.startswith("arena-"):
+            t.join(timeout=10)
+    if _cache_state(real_cache) != real_cache_before:
+        failures.append(f"FAIL: the stand-in tests modified {real_cache}")
+
     if failures:
         for f in failures:
             print(f)
         sys.exit(1)
 
-    print("✅ arena resolution tests passed")
+    print("✅ arena tests passed")
     sys.exit(0)
 
 
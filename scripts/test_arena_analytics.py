@@ -0,0 +1,88 @@
+"""
+test_arena_analytics.py — Offline tests for arena_analytics.py: dense rank,
+percentile, leader gap and win-probability invariants, and the export payload.
+
+Run with: python scripts/test_arena_analytics.py
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from arena_analytics import analyze_board, payload_if_changed
+from utils import write_json
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    # Test 1: a small board with a tie, checked by hand
+    a = analyze_board({"x": 1500.0, "y": 1400.0, "z": 1500.0, "w": 1100.0})
+    if a.names != ["x", "z", "y", "w"]:
+        failures.append(f"FAIL: order {a.names} (best first, ties by name)")
+    if a.rank.tolist() != [1, 1, 2, 3]:
+        failures.append(f"FAIL: dense rank {a.rank.tolist()}")
+    if np.round(a.percentile, 3).tolist() != [66.667, 66.667, 33.333, 0.0]:
+        failures.append(f"FAIL: percentile {a.percentile.tolist()}")
+    if a.gap_to_leader.tolist() != [0.0, 0.0, 100.0, 400.0]:
+        failures.append(f"FAIL: gap {a.gap_to_leader.tolist()}")
+    if not np.isclose(a.win_probability[0, 3], 10 / 11) or a.win_probability[0, 1] != 0.5:
+        failures.append(f"FAIL: win probability row {a.win_probability[0].tolist()}")
+
+    # Test 2: invariants on random boards (ties likely with integer scores)
+    rng = random.Random(10)
+    for trial in range(50):
+        n = rng.randint(1, 60)
+        scores = {f"m{i}": float(rng.randint(1300, 1340)) for i in range(n)}
+        a = analyze_board(scores)
+        elo, p = a.elo, a.win_probability
+        distinct = sorted(set(scores.values()), reverse=True)
+        problems = []
+        if sorted(a.names) != sorted(scores) or any(elo[i] != scores[name] for i, name in enumerate(a.names)):
+            problems.append("names/elo")
+        if np.any(np.diff(elo) > 0):
+            problems.append("not best first")
+        if a.rank.tolist() != [distinct.index(e) + 1 for e in elo]:
+            problems.append("dense rank")
+        expected_pct = [100.0 * sum(o < e for o in elo) / (n - 1) if n > 1 else 100.0 for e in elo]
+        if not np.allclose(a.percentile, expected_pct):
+            problems.append("percentile")
+        if np.any(a.gap_to_leader < 0) or a.gap_to_leader[0] != 0 or not np.allclose(a.gap_to_leader, elo[0] - elo):
+            problems.append("gap")
+        if p.shape != (n, n) or not np.allclose(np.diag(p), 0.5) or not np.allclose(p + p.T, 1.0):
+            problems.append("win matrix shape/diagonal/complement")
+        if np.any(np.diff(p[:, 0]) > 1e-12):
+            problems.append("win probability not monotone in Elo")
+        if problems:
+            failures.append(f"FAIL: random board {trial} (n={n}): {', '.join(problems)}")
+            break
+
+    # Test 3: export payload — rounded rows, permille matrix, unchanged when only the date differs
+    a = analyze_board({"x": 1500.0, "y": 1100.0})
+    payload = a.to_json()
+    if payload["winProbabilityPermille"] != [[500, 909], [91, 500]]:
+        failures.append(f"FAIL: permille matrix {payload['winProbabilityPermille']}")
+    if payload["models"][1] != {"name": "y", "elo": 1100.0, "rank": 2, "percentile": 0.0, "gapToLeader": 400.0}:
+        failures.append(f"FAIL: exported row {payload['models'][1]}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "arena_analytics.json"
+        if payload_if_changed(a, path) is None:
+            failures.append("FAIL: a missing file counted as unchanged")
+        write_json(path, {**payload, "generated": "2020-01-01"}, indent=None)
+        if payload_if_changed(a, path) is not None:
+            failures.append("FAIL: a new generated date alone counted as a change")
+        if payload_if_changed(analyze_board({"x": 1500.0, "y": 1101.0}), path) is None:
+            failures.append("FAIL: a changed score counted as unchanged")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
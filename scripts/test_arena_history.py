@@ -0,0 +1,143 @@
+"""
+test_arena_history.py — Offline tests for arena_history.py: the float32 segment
+store round-trips across several ingests, reloads and byte orders, and a long
+ingest is written a segment at a time.
+
+Run with: python scripts/test_arena_history.py
+"""
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import arena_history
+from arena_history import EloHistory
+from utils import read_json, write_json
+
+# Values are exact in float32, so round trips compare with ==
+FIRST = [
+    ("20260112", {"alpha": 1500.5, "beta": 1450.0}),
+    ("20260105", {"alpha": 1490.25, "beta": 1460.0}),
+]
+SECOND = [
+    ("20260112", {"alpha": 9999.0}),                            # already stored: ignored
+    ("20260119", {"ALPHA": 1510.0, "gamma": 1470.75}),          # same column, any case
+    ("20260101", {"beta": 1455.5}),                             # older than segment 1
+]
+
+
+def _check(history: EloHistory, failures: list[str], label: str) -> None:
+    if history.dates != ["20260101", "20260105", "20260112", "20260119"]:
+        failures.append(f"FAIL: {label}: dates {history.dates}")
+    if history.models != ["alpha", "beta", "gamma"]:
+        failures.append(f"FAIL: {label}: models {history.models}")
+    expected = {
+        "alpha": [("20260105", 1490.25), ("20260112", 1500.5), ("20260119", 1510.0)],
+        "beta": [("20260101", 1455.5), ("20260105", 1460.0), ("20260112", 1450.0)],
+        "gamma": [("20260119", 1470.75)],
+    }
+    for model, points in expected.items():
+        if history.trajectory(model.upper()) != points:
+            failures.append(f"FAIL: {label}: trajectory({model}) {history.trajectory(model)}")
+    if history.trajectory("missing") != []:
+        failures.append(f"FAIL: {label}: unknown model has a trajectory")
+    if history.top("20260115") != ("20260112", [("alpha", 1500.5), ("beta", 1450.0)]):
+        failures.append(f"FAIL: {label}: top on 2026-01-15 {history.top('20260115')}")
+    if history.top(n=1) != ("20260119", [("alpha", 1510.0)]):
+        failures.append(f"FAIL: {label}: latest top {history.top(n=1)}")
+    moves = history.deltas("20260105", "20260112")
+    if moves != ("20260105", "20260112", [("alpha", 1490.25, 1500.5, 10.25), ("beta", 1460.0, 1450.0, -10.0)]):
+        failures.append(f"FAIL: {label}: deltas {moves}")
+    try:
+        history.top("20251231")
+        failures.append(f"FAIL: {label}: top before the first snapshot did not raise")
+    except LookupError:
+        pass
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        history = EloHistory(root)
+
+        # Test 1: two ingests → two segments, appended without rewriting the first
+        if history.append(FIRST) != 2:
+            failures.append("FAIL: first ingest did not add 2 dates")
+        first_bytes = history.scores_path.read_bytes()
+        if history.append(SECOND) != 2:
+            failures.append("FAIL: second ingest did not add 2 new dates")
+        if history.append(FIRST + SECOND) != 0:
+            failures.append("FAIL: re-ingesting stored dates added rows")
+        index = read_json(history.index_path)
+        if [s["offset"] for s in index["segments"]] != [0, 4]:
+            failures.append(f"FAIL: segment offsets {[s['offset'] for s in index['segments']]}")
+        scores = history.scores_path.read_bytes()
+        if not scores.startswith(first_bytes) or len(scores) != (2 * 2 + 2 * 3) * 4:
+            failures.append(f"FAIL: scores.f32 is {len(scores)} bytes, first segment rewritten?")
+
+        # Test 2: queries on the live object and after reloading from disk
+        _check(history, failures, "after ingest")
+        _check(EloHistory(root), failures, "reloaded")
+
+        # Test 3: a store written on the other byte order reads the same
+        swapped = array("f")
+        swapped.frombytes(scores)
+        swapped.byteswap()
+        history.scores_path.write_bytes(swapped.tobytes())
+        index["byteorder"] = "big" if sys.byteorder == "little" else "little"
+        write_json(history.index_path, index)
+        _check(EloHistory(root), failures, "other byte order")
+
+        # Test 4: a store is bound to its board
+        try:
+            EloHistory(root, "text/coding").index_path.parent.mkdir(parents=True)
+            write_json(root / "text-coding" / "index.json", index)
+            EloHistory(root, "text/coding")
+            failures.append("FAIL: an index for another board was loaded")
+        except ValueError:
+            pass
+
+    # Test 5: a long first ingest is written a segment at a time while the stream
+    # is consumed, not buffered whole; the result matches a single-segment ingest
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        snapshots = [(f"202601{d:02d}", {"alpha": 1500.0 + d, f"m{d % 3}": 1400.0 + d}) for d in range(1, 8)]
+        on_disk: list[int] = []
+        history = EloHistory(root / "batched")
+
+        def stream():
+            for snapshot in snapshots:
+                index = read_json(history.index_path) if history.index_path.exists() else {"segments": []}
+                on_disk.append(len(index["segments"]))
+                yield snapshot
+
+        saved = arena_history.SEGMENT_DATES
+        arena_history.SEGMENT_DATES = 3
+        try:
+            added = history.append(stream())
+        finally:
+            arena_history.SEGMENT_DATES = saved
+        if added != 7 or on_disk != [0, 0, 0, 1, 1, 1, 2]:
+            failures.append(f"FAIL: batched ingest added {added}, segments on disk while streaming {on_disk}")
+        if [len(seg["dates"]) for seg in read_json(history.index_path)["segments"]] != [3, 3, 1]:
+            failures.append("FAIL: batched ingest segment sizes")
+        whole = EloHistory(root / "whole")
+        whole.append(snapshots)
+        reloaded = EloHistory(root / "batched")
+        if reloaded.dates != whole.dates or any(
+            reloaded.trajectory(m) != whole.trajectory(m) for m in whole.models
+        ) or sorted(reloaded.models) != sorted(whole.models):
+            failures.append("FAIL: batched ingest differs from a single-segment ingest")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
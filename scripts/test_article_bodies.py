@@ -0,0 +1,65 @@
+"""
+test_article_bodies.py — Offline tests for article_bodies.py: hashing,
+write-once storage, manifest entries and hydration.
+
+Run with: python scripts/test_article_bodies.py
+"""
+import hashlib
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from article_bodies import ArticleBodies, body_hash, manifest_entry
+from utils import JsonTransaction
+
+
+def main() -> None:
+    failures: list[str] = []
+    content = ["Première paragraphe — with “quotes”.", "Second paragraph."]
+
+    # Test 1: the hash is over compact, non-ASCII-escaped JSON (as JSON.stringify writes it)
+    expected = hashlib.sha256(
+        '["Première paragraphe — with “quotes”.","Second paragraph."]'.encode("utf-8")
+    ).hexdigest()[:16]
+    if body_hash(content) != expected:
+        failures.append(f"FAIL: body_hash {body_hash(content)}, expected {expected}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bodies = ArticleBodies(Path(tmp) / "content")
+
+        # Test 2: manifest entries drop content, keep field order, share identical bodies
+        article = {"slug": "a", "title": "A", "date": "2026-05-01", "content": content}
+        entry = manifest_entry(article, bodies)
+        twin = manifest_entry({**article, "slug": "b"}, bodies)
+        if list(entry) != ["slug", "title", "date", "body"] or entry["body"] != expected:
+            failures.append(f"FAIL: manifest entry {entry}")
+        if twin["body"] != entry["body"] or len(bodies.dirty_paths) != 1:
+            failures.append(f"FAIL: identical bodies stored {len(bodies.dirty_paths)} times")
+        if manifest_entry(entry, bodies) is not entry:
+            failures.append("FAIL: manifest_entry changed an entry without content")
+
+        # Test 3: written once; hydrate reads it back; nothing is rewritten later
+        txn = JsonTransaction()
+        bodies.write(txn)
+        txn.commit()
+        path = bodies.path(expected)
+        if json.loads(path.read_text(encoding="utf-8")) != content:
+            failures.append("FAIL: stored body does not read back")
+        reopened = ArticleBodies(Path(tmp) / "content")
+        if reopened.hydrate(entry)["content"] != content or reopened.hydrate(article) is not article:
+            failures.append("FAIL: hydrate")
+        reopened.put(content)
+        if reopened.dirty_paths:
+            failures.append("FAIL: an existing body was staged again")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
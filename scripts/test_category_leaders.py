@@ -0,0 +1,87 @@
+"""
+test_category_leaders.py — Offline, table-driven tests for category_leaders.py:
+leader selection, tie-breaks, board vs tagged pools and reason strings.
+
+Run with: python scripts/test_category_leaders.py
+"""
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from category_leaders import pick_leaders
+
+CODING = "Coding & Engineering"
+REASONING = "Hard Reasoning & Science"
+
+MODELS = [
+    {"id": "a", "name": "A", "elo": 1500, "strengths": [CODING, "Writing"]},
+    {"id": "b", "name": "B", "elo": 1510, "strengths": ["Writing"]},
+    {"id": "c", "name": "C", "elo": 1490, "strengths": []},
+    {"id": "d", "name": "D", "elo": 1510, "strengths": ["Writing"]},
+]
+
+# (case, category, models, boards, expected leader, expected reason)
+CASES = [
+    ("tagged pool, Elo tie broken by id", "Writing", MODELS, {},
+     "b", "Elo 1510 (among 3 model(s) tagged 'Writing', next: d 1510, tie broken by tag/Elo/id)"),
+    ("tagged_only=False ranks every model", "Overall Preference", MODELS, {},
+     "b", "Elo 1510 (tag: no, next: d 1510, tie broken by tag/Elo/id)"),
+    ("on the board every model is ranked; the tag breaks a score tie", CODING, MODELS,
+     {"text/coding": {"c": 1520.0, "a": 1520.0, "b": 1400.0}},
+     "a", "1520 on text/coding (tag: yes, next: c 1520, tie broken by tag/Elo/id)"),
+    ("board score beats the tag", CODING, MODELS,
+     {"text/coding": {"c": 1530.0, "a": 1520.0}},
+     "c", "1530 on text/coding (tag: no, next: a 1520)"),
+    ("no board data → tagged pool on overall Elo", CODING, MODELS, {},
+     "a", "Elo 1500 (among 1 model(s) tagged 'Coding & Engineering')"),
+    ("board without any of our models → tagged pool", CODING, MODELS,
+     {"text/coding": {"someone-else": 1600.0}},
+     "a", "Elo 1500 (among 1 model(s) tagged 'Coding & Engineering')"),
+    ("models off the board rank last, shown unrated", REASONING, MODELS,
+     {"text/hard_prompts": {"c": 1300.0}},
+     "c", "1300 on text/hard_prompts (tag: no, next: b unrated, no model tagged — ranked all)"),
+    ("nothing tagged → every model", "Math", MODELS, {},
+     "b", "Elo 1510 (tag: no, next: d 1510, tie broken by tag/Elo/id, no model tagged — ranked all)"),
+    ("a single model", "Writing", [MODELS[2]], {},
+     "c", "Elo 1490 (tag: no, no model tagged — ranked all)"),
+]
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    # Test 1: the table
+    for case, category, models, boards, leader, reason in CASES:
+        pick = pick_leaders([{"name": category}], models, boards)[category]
+        if (pick.model_id, pick.reason) != (leader, reason):
+            failures.append(f"FAIL: {case}: got {pick.model_id} '{pick.reason}', expected {leader} '{reason}'")
+        elif pick.name != next(m["name"] for m in models if m["id"] == leader):
+            failures.append(f"FAIL: {case}: name {pick.name}")
+
+    # Test 2: picks don't depend on catalog order
+    categories = [{"name": c} for c in ("Writing", "Overall Preference", CODING, REASONING, "Math")]
+    boards = {"text/coding": {"c": 1520.0, "a": 1520.0}}
+    expected = pick_leaders(categories, MODELS, boards)
+    rng = random.Random(14)
+    for _ in range(20):
+        shuffled = rng.sample(MODELS, len(MODELS))
+        if pick_leaders(categories, shuffled, boards) != expected:
+            failures.append(f"FAIL: picks changed with catalog order {[m['id'] for m in shuffled]}")
+            break
+
+    # Test 3: every category gets a pick; no models → no picks
+    if list(expected) != [c["name"] for c in categories]:
+        failures.append(f"FAIL: picked {list(expected)}")
+    if pick_leaders(categories, []) != {}:
+        failures.append("FAIL: picks without models")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
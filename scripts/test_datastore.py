@@ -0,0 +1,139 @@
+"""
+test_datastore.py — Offline tests for datastore.py: lazy loading, snapshot-based
+dirty tracking, index invalidation and commits that write only dirty files.
+
+Run with: python scripts/test_datastore.py
+"""
+import sys
+import tempfile
+from dataclasses import fields
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from datastore import Collection, DataStore
+from elo_log import EloChange, read_log
+from utils import read_json, write_json
+
+
+MODELS = [
+    {"id": "claude", "name": "Claude", "provider": "Anthropic", "elo": 1503},
+    {"id": "gemini", "name": "Gemini", "provider": "Google", "elo": 1486},
+    {"id": "gemma", "name": "Gemma", "provider": "Google", "elo": 1450},
+]
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        path = root / "models.json"
+        write_json(path, MODELS)
+
+        # Test 1: the file is read on first access only, and only once
+        reads: list[Path] = []
+
+        def counting_read(p: Path):
+            reads.append(p)
+            return read_json(p)
+
+        models = Collection(path, counting_read, ("id", "name"), ("provider",))
+        if reads or models.loaded or models.dirty:
+            failures.append("FAIL: Collection read its file before first access")
+        models.get("claude")
+        len(models)
+        if reads != [path]:
+            failures.append(f"FAIL: expected one read, got {len(reads)}")
+
+        # Test 2: dirty means "differs from what was loaded" — in-place edits count,
+        # reverting them makes the collection clean again
+        models.get("claude")["elo"] = 1510
+        if not models.dirty:
+            failures.append("FAIL: in-place edit not seen as dirty")
+        if models.changes().lines != ["  ~ claude.elo: 1503 → 1510"]:
+            failures.append(f"FAIL: changes() lines {models.changes().lines}")
+        models.get("claude")["elo"] = 1503
+        if models.dirty or models.changes():
+            failures.append("FAIL: reverted edit still dirty")
+        models.sort(key=lambda m: m["elo"])
+        if not models.dirty:
+            failures.append("FAIL: reordering not seen as dirty")
+        models.mark_clean()
+        if models.dirty:
+            failures.append("FAIL: mark_clean() left the collection dirty")
+
+        # Test 3: indexes are built lazily and dropped by every mutating method
+        models.add({"id": "grok", "name": "Grok", "provider": "xAI", "elo": 1473})
+        if models.get("grok") is None or models.get("Grok", "name") is None:
+            failures.append("FAIL: index not rebuilt after add()")
+        models.insert(0, {"id": "gpt", "name": "GPT", "provider": "OpenAI", "elo": 1479})
+        if models.items[0]["id"] != "gpt" or "gpt" not in models:
+            failures.append("FAIL: index not rebuilt after insert()")
+        models.remove("gemini")
+        if "gemini" in models or [m["id"] for m in models.find("provider", "Google")] != ["gemma"]:
+            failures.append("FAIL: indexes not rebuilt after remove()")
+        models.replace([m for m in models if m["id"] != "gemma"])
+        if models.find("provider", "Google") or models.get("gemma") is not None:
+            failures.append("FAIL: indexes not rebuilt after replace()")
+        try:
+            models.add({"id": "claude", "name": "Claude 2"})
+            failures.append("FAIL: duplicate primary key accepted")
+        except ValueError:
+            pass
+        try:
+            models.find("elo", 1503)
+            failures.append("FAIL: lookup on an unindexed field did not raise")
+        except KeyError:
+            pass
+
+        # Test 4: editing an indexed field in place needs reindex()
+        models.get("grok")["id"] = "grok-4"
+        stale = models.get("grok")
+        models.reindex()
+        if stale is None or models.get("grok") is not None or models.get("grok-4") is None:
+            failures.append("FAIL: reindex() after an in-place key edit")
+
+        # Test 5: DataStore.commit writes only the dirty files, in one transaction
+        saved = {f.name: getattr(config, f.name) for f in fields(config) if f.name.endswith(("_path", "_dir"))}
+        try:
+            for name, value in saved.items():
+                setattr(config, name, root / "data" / value.name)
+            write_json(config.models_path, MODELS)
+            write_json(config.open_weight_models_path, [MODELS[2]])
+            write_json(config.categories_path, [{"name": "Coding", "leader": "claude"}])
+            write_json(config.articles_path, [])
+            write_json(config.site_path, {"lastUpdated": "2026-10-01"})
+            inodes = {p: p.stat().st_ino for p in (root / "data").iterdir()}
+
+            store = DataStore()
+            store.models.get("claude")["elo"] = 1512
+            store.categories.items  # loaded, not edited
+            store.site  # loaded, not edited
+            if store.dirty_paths() != [config.models_path]:
+                failures.append(f"FAIL: dirty_paths {store.dirty_paths()}")
+            written = store.commit(
+                elo_changes=[EloChange("2026-10-18", "models", "claude", "arena", 1503, 1512)]
+            )
+            if written != [config.models_path, config.elo_log_path]:
+                failures.append(f"FAIL: commit wrote {written}")
+            rewritten = sorted(p.name for p, ino in inodes.items() if p.stat().st_ino != ino)
+            if rewritten != ["models.json"]:
+                failures.append(f"FAIL: commit replaced {rewritten}")
+            if read_json(config.models_path)[0]["elo"] != 1512 or len(read_log(config.elo_log_path)) != 1:
+                failures.append("FAIL: committed content")
+            if store.dirty_paths() or store.commit() != []:
+                failures.append("FAIL: store still dirty after commit")
+        finally:
+            for name, value in saved.items():
+                setattr(config, name, value)
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
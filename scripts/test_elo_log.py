@@ -0,0 +1,93 @@
+"""
+test_elo_log.py — Offline tests for elo_log.py: transactional appends,
+compaction (including a crash before the log is emptied) and sparklines.
+
+Run with: python scripts/test_elo_log.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from elo_log import EloChange, EloLog, append_changes, read_log
+from utils import JsonTransaction
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path, series_path = Path(tmp) / "elo_log.jsonl", Path(tmp) / "elo_series.json"
+        # Same-day flip-flop: re-folding it would not be caught by EloSeries.append
+        changes = [
+            EloChange("2026-10-01", "models", "claude", "arena", 1500, 1510),
+            EloChange("2026-10-01", "models", "claude", "override", 1510, 1500),
+            EloChange("2026-10-05", "models", "claude", "arena", 1500, 1520),
+        ]
+        expected = [("2026-09-30", 1500), ("2026-10-01", 1510), ("2026-10-01", 1500), ("2026-10-05", 1520)]
+
+        # Test 1: appends are staged — nothing on disk until commit, nothing after rollback
+        txn = JsonTransaction()
+        if append_changes(changes, txn, log_path) != 3 or log_path.exists():
+            failures.append("FAIL: append_changes wrote before commit")
+        txn.rollback()
+        txn.commit()
+        if log_path.exists():
+            failures.append("FAIL: rolled-back appends reached the log")
+        append_changes(changes[:2], txn, log_path)
+        txn.commit()
+        append_changes(changes[2:], txn, log_path)
+        txn.commit()
+        if read_log(log_path) != changes:
+            failures.append(f"FAIL: log after two commits {read_log(log_path)}")
+        raw_log = log_path.read_bytes()
+
+        # Test 2: compact folds the log and empties it; compacting again changes nothing
+        history = EloLog(log_path, series_path)
+        if history.get("claude").points() != expected:
+            failures.append(f"FAIL: uncompacted series {history.get('claude').points()}")
+        if history.compact() != 3 or log_path.read_bytes():
+            failures.append("FAIL: first compact did not fold 3 lines and empty the log")
+        if EloLog(log_path, series_path).compact() != 0:
+            failures.append("FAIL: second compact folded lines again")
+        if EloLog(log_path, series_path).get("claude").points() != expected:
+            failures.append("FAIL: series changed after compacting twice")
+
+        # Test 3: a crash after writing the series but before emptying the log
+        # leaves the folded lines in place; they are skipped, not folded twice
+        series_path.unlink()
+        log_path.write_bytes(raw_log)
+        EloLog(log_path, series_path).compact()  # the series now covers raw_log
+        log_path.write_bytes(raw_log)  # ...but the log was never emptied
+        points = EloLog(log_path, series_path).get("claude").points()
+        if points != expected:
+            failures.append(f"FAIL: surviving log folded twice: {points}")
+        if EloLog(log_path, series_path).compact() != 0:
+            failures.append("FAIL: compact after a crash re-folded the surviving log")
+        if EloLog(log_path, series_path).get("claude").points() != expected:
+            failures.append("FAIL: series changed by compacting after a crash")
+
+        # Test 4: lines appended after a compaction are folded as usual
+        txn = JsonTransaction()
+        append_changes([EloChange("2026-10-09", "models", "claude", "arena", 1520, 1531)], txn, log_path)
+        txn.commit()
+        history = EloLog(log_path, series_path)
+        if history.get("claude").points()[-1] != ("2026-10-09", 1531):
+            failures.append(f"FAIL: new line after compaction not folded: {history.get('claude').points()}")
+        if history.compact() != 1:
+            failures.append("FAIL: compact did not fold the new line")
+
+        # Test 5: sparkline samples the value in effect each day
+        spark = EloLog(log_path, series_path).sparkline("claude", days=10, points=3, end="2026-10-10")
+        if spark != [1500, 1520, 1531]:
+            failures.append(f"FAIL: sparkline {spark}")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
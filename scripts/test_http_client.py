@@ -0,0 +1,150 @@
+"""
+test_http_client.py — Offline tests for http_client.py against the local
+stand-in server: retries on 503 and connection errors, Retry-After, the
+retries=0 path deploy.verify_health relies on, and bodies cut off mid-way.
+
+Run with: python scripts/test_http_client.py
+"""
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent))
+import http_client
+from arena_fixtures import Fixture, StandInServer
+
+HOST = "127.0.0.1"
+
+
+def _closed_port() -> int:
+    """A local port with nothing listening on it (connections are refused)."""
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+def _delta(before: http_client.HostStats) -> tuple[int, int, int]:
+    after = http_client.metrics().get(HOST, http_client.HostStats())
+    return after.requests - before.requests, after.retries - before.retries, after.failures - before.failures
+
+
+def _stats() -> http_client.HostStats:
+    return http_client.metrics().get(HOST, http_client.HostStats())
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    fixtures = {
+        "/flaky": Fixture(b"ok", fail_first=2),
+        "/down": Fixture(b"never", fail_first=1_000),
+        "/once": Fixture(b"ok", fail_first=1),
+        "/missing": Fixture(b"gone", fail_first=1_000, error_status=404),
+        "/retry-after": Fixture(b"ok", fail_first=1, retry_after="1"),
+        "/retry-after-long": Fixture(b"ok", fail_first=1, retry_after="30"),
+        "/retry-after-date": Fixture(b"ok", fail_first=1, retry_after="Wed, 21 Oct 2026 07:28:00 GMT"),
+        "/slow": Fixture(b"ok", latency=1.0),
+        "/cut": Fixture(b"x" * 4096, cut_first=1),
+    }
+    server = StandInServer(fixtures)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    saved = http_client.BACKOFF_BASE, http_client.BACKOFF_CAP
+    http_client.BACKOFF_BASE = 0.01
+    try:
+        # Test 1: 503 twice, then 200 — retried transparently and counted in metrics
+        before = _stats()
+        resp = http_client.get(server.url("/flaky"))
+        if resp.status_code != 200 or resp.content != b"ok" or fixtures["/flaky"].requests != 3:
+            failures.append(f"FAIL: flaky → {resp.status_code} after {fixtures['/flaky'].requests} request(s)")
+        if _delta(before) != (3, 2, 2):
+            failures.append(f"FAIL: flaky metrics (requests, retries, failures) {_delta(before)}")
+
+        # Test 2: a status that never recovers is returned after the last retry, not raised
+        resp = http_client.get(server.url("/down"), retries=2)
+        if resp.status_code != 503 or fixtures["/down"].requests != 3:
+            failures.append(f"FAIL: down → {resp.status_code} after {fixtures['/down'].requests} request(s)")
+
+        # Test 3: non-transient statuses are not retried
+        resp = http_client.get(server.url("/missing"))
+        if resp.status_code != 404 or fixtures["/missing"].requests != 1:
+            failures.append(f"FAIL: 404 retried ({fixtures['/missing'].requests} request(s))")
+
+        # Test 4: connection errors are retried, then raised
+        refused = f"http://{HOST}:{_closed_port()}/"
+        before = _stats()
+        try:
+            http_client.get(refused, retries=2)
+            failures.append("FAIL: refused connection did not raise")
+        except requests.ConnectionError:
+            pass
+        if _delta(before) != (3, 2, 3):
+            failures.append(f"FAIL: refused metrics (requests, retries, failures) {_delta(before)}")
+
+        # Test 5: retries=0 (deploy.verify_health) — one attempt, whatever happens
+        resp = http_client.get(server.url("/once"), retries=0)
+        if resp.status_code != 503 or fixtures["/once"].requests != 1:
+            failures.append(f"FAIL: retries=0 → {resp.status_code} after {fixtures['/once'].requests} request(s)")
+        before = _stats()
+        try:
+            http_client.get(refused, retries=0)
+            failures.append("FAIL: retries=0 refused connection did not raise")
+        except requests.RequestException:
+            pass
+        start = time.perf_counter()
+        try:
+            http_client.get(server.url("/slow"), retries=0, timeout=0.2)
+            failures.append("FAIL: retries=0 read timeout did not raise")
+        except requests.Timeout:
+            pass
+        if time.perf_counter() - start > 0.9 or fixtures["/slow"].requests != 1:
+            failures.append(f"FAIL: retries=0 timeout took {time.perf_counter() - start:.1f}s")
+        if _delta(before) != (2, 0, 2):
+            failures.append(f"FAIL: retries=0 metrics (requests, retries, failures) {_delta(before)}")
+
+        # Test 6: a numeric Retry-After sets the minimum delay, capped at BACKOFF_CAP
+        start = time.perf_counter()
+        resp = http_client.get(server.url("/retry-after"))
+        if resp.status_code != 200 or time.perf_counter() - start < 1.0:
+            failures.append(f"FAIL: Retry-After: 1 waited {time.perf_counter() - start:.2f}s")
+        http_client.BACKOFF_CAP = 0.2
+        start = time.perf_counter()
+        resp = http_client.get(server.url("/retry-after-long"))
+        if resp.status_code != 200 or time.perf_counter() - start > 1.0:
+            failures.append(f"FAIL: Retry-After: 30 not capped ({time.perf_counter() - start:.2f}s)")
+        start = time.perf_counter()
+        resp = http_client.get(server.url("/retry-after-date"))
+        if resp.status_code != 200 or time.perf_counter() - start > 1.0:
+            failures.append(f"FAIL: HTTP-date Retry-After not ignored ({time.perf_counter() - start:.2f}s)")
+
+        # Test 7: only the response is retried — a streamed body that breaks off
+        # reaches the caller after one request; unstreamed, the body read is retried
+        with http_client.get(server.url("/cut"), stream=True) as resp:
+            try:
+                resp.content
+                failures.append("FAIL: a cut streamed body read without error")
+            except requests.RequestException:
+                pass
+        if fixtures["/cut"].requests != 1:
+            failures.append(f"FAIL: cut streamed body took {fixtures['/cut'].requests} request(s)")
+        fixtures["/cut"].requests, fixtures["/cut"].cut_first = 0, 1
+        resp = http_client.get(server.url("/cut"))
+        if resp.content != b"x" * 4096 or fixtures["/cut"].requests != 2:
+            failures.append(f"FAIL: cut unstreamed body took {fixtures['/cut'].requests} request(s)")
+    finally:
+        http_client.BACKOFF_BASE, http_client.BACKOFF_CAP = saved
+        server.shutdown()
+        server.server_close()
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
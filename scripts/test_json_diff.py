@@ -0,0 +1,105 @@
+"""
+test_json_diff.py — Offline tests for json_diff.py: every diff's patch must
+turn the old document into the new one (apply_patch(old, diff(old, new).patch) == new).
+
+Run with: python scripts/test_json_diff.py
+"""
+import copy
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from json_diff import apply_patch, diff
+
+
+def _models(*ids: str, elo: int = 1500) -> list[dict]:
+    return [{"id": i, "name": i.title(), "elo": elo} for i in ids]
+
+
+# (name, old, new)
+CASES = [
+    ("keyed: reorder only", _models("a", "b", "c", "d"), _models("d", "b", "a", "c")),
+    ("keyed: add at front and end", _models("b", "c"), _models("a", "b", "c", "d")),
+    ("keyed: remove from both ends", _models("a", "b", "c", "d"), _models("b", "c")),
+    ("keyed: move + add + remove + edit",
+     _models("a", "b", "c", "d"),
+     [{"id": "d", "name": "D", "elo": 1500}, {"id": "e", "name": "E", "elo": 1400},
+      {"id": "b", "name": "B", "elo": 1512}, {"id": "a", "name": "A", "elo": 1500}]),
+    ("keyed: by slug, to empty", [{"slug": "x", "content": ["p"]}], []),
+    ("keyed: from empty", [], [{"slug": "x", "content": ["p"]}]),
+    ("positional: insert paragraph", ["p1", "p2", "p3"], ["p1", "new", "p2", "p3"]),
+    ("positional: drop and change", ["p1", "p2", "p3", "p4"], ["p1", "P3", "p4"]),
+    ("positional: duplicate ids are not keyed", _models("a", "a"), _models("a", "b", "a")),
+    ("positional: nested lists", [[1, 2], [3]], [[1], [3, 4], []]),
+    ("keys with ~ and /", {"a/b": 1, "~c": {"d~1": 2}, "e~0/": [1]},
+     {"a/b": 2, "~c": {"d~1": 3, "/": 4}, "e~0/": [1, 2]}),
+    ("key removed with ~ and /", {"x~/y": 1, "z": 2}, {"z": 2}),
+    ("root: object to list", {"a": 1}, [1, 2]),
+    ("root: list to scalar", [1, 2], "text"),
+    ("root: scalar to object", 3, {"a": None}),
+    ("scalar types: 1 vs 1.0 vs true vs \"1\"", {"a": 1, "b": 1, "c": True}, {"a": 1.0, "b": "1", "c": 1}),
+    ("unchanged", {"models": _models("a")}, {"models": _models("a")}),
+    ("nested: catalog inside site",
+     {"site": {"lastUpdated": "2026-10-01"}, "models": _models("a", "b")},
+     {"site": {"lastUpdated": "2026-10-18"}, "models": _models("b", "a", elo=1510)}),
+]
+
+
+def _exact(value) -> str:
+    """JSON text, so 1 / 1.0 / True compare unequal as they do in the files."""
+    return json.dumps(value, sort_keys=True)
+
+
+def _random_catalog(rng: random.Random) -> list[dict]:
+    ids = rng.sample("abcdefghijklmnop", rng.randint(0, 10))
+    return [{"id": i, "elo": rng.randint(1400, 1410), "tags": rng.sample("xyz", rng.randint(0, 3))} for i in ids]
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    # Test 1: round trip for every case, and the old document is left untouched
+    for name, old, new in CASES:
+        before = copy.deepcopy(old)
+        d = diff(old, new)
+        result = apply_patch(old, d.patch)
+        if _exact(result) != _exact(new):
+            failures.append(f"FAIL: {name}: patch {d.patch} gave {result!r}, expected {new!r}")
+        if _exact(old) != _exact(before):
+            failures.append(f"FAIL: {name}: diff or apply_patch mutated the old document")
+        if bool(d) != (_exact(old) != _exact(new)):
+            failures.append(f"FAIL: {name}: bool(diff) is {bool(d)}")
+
+    # Test 2: patch shape — keyed reorders are moves, an inserted paragraph is one add,
+    # and pointers escape "~" before "/"
+    ops = [e["op"] for e in diff(_models("a", "b", "c"), _models("c", "a", "b")).patch]
+    if ops != ["move"]:
+        failures.append(f"FAIL: keyed rotation produced {ops}, expected one move")
+    patch = diff(["p1", "p2"], ["p1", "new", "p2"]).patch
+    if patch != [{"op": "add", "path": "/1", "value": "new"}]:
+        failures.append(f"FAIL: inserted paragraph produced {patch}")
+    paths = [e["path"] for e in diff({"a/b": {"~c": 1}}, {"a/b": {"~c": 2}}).patch]
+    if paths != ["/a~1b/~0c"]:
+        failures.append(f"FAIL: escaped pointer {paths}")
+
+    # Test 3: randomized keyed catalogs (moves, adds, removes and edits at once)
+    rng = random.Random(6902)
+    for trial in range(300):
+        old, new = _random_catalog(rng), _random_catalog(rng)
+        doc_old, doc_new = {"models": old, "n": trial}, {"models": new, "n": trial}
+        result = apply_patch(doc_old, diff(doc_old, doc_new).patch)
+        if _exact(result) != _exact(doc_new):
+            failures.append(f"FAIL: random trial {trial}: {old} → {new} gave {result['models']}")
+            break
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
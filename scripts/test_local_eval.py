@@ -0,0 +1,113 @@
+"""
+test_local_eval.py — Offline tests for local_eval.py: grading, percentiles, and
+full runs against the stand-in from local_eval_fixtures.py (bounded
+concurrency, leaderboard merge, resume).
+
+Run with: python scripts/test_local_eval.py
+"""
+import asyncio
+import json
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from local_eval import EvalCase, EvalRun, grade, load_suite, percentile, read_results
+from local_eval_fixtures import FakeModel, serve_ollama
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    # Test 1: grading — share of checks met, case-insensitive contains,
+    # <think> blocks ignored
+    case = EvalCase("t", "Capital of Australia?", (
+        {"type": "contains", "value": "Canberra"},
+        {"type": "not_contains", "value": "Sydney"},
+        {"type": "max_words", "value": 3},
+    ))
+    for answer, expected in (
+        ("canberra", 100.0),
+        ("<think>Sydney? No, it is Canberra, a long way off</think>Canberra.", 100.0),
+        ("Sydney, not Canberra", 66.66666666666667),
+        ("Sydney", 33.333333333333336),
+    ):
+        if grade(case, answer) != expected:
+            failures.append(f"FAIL: grade({answer!r}) = {grade(case, answer)}, expected {expected}")
+
+    # Test 2: percentiles interpolate like numpy.percentile
+    values = [4.0, 1.0, 3.0, 2.0]
+    got = [percentile(values, q) for q in (0, 50, 90, 100)]
+    if [round(v, 9) for v in got] != [1.0, 2.5, 3.7, 4.0]:
+        failures.append(f"FAIL: percentile returned {got}")
+
+    # Test 3: end-to-end against the stand-in — concurrency stays bounded,
+    # rows merge into the existing leaderboard, a missing model gets no row
+    suite = load_suite()
+    models = {"good:1b": FakeModel(1.0, 0.05), "poor:1b": FakeModel(0.3, 0.05)}
+    with tempfile.TemporaryDirectory() as tmp, serve_ollama(models, suite, parallel=16) as server:
+        results_path = Path(tmp) / "results.jsonl"
+        board_path = Path(tmp) / "leaderboard.json"
+        board_path.write_text(json.dumps([{"model": "hosted", "avg_score": 70.0}]))
+
+        def run(**kwargs) -> EvalRun:
+            r = EvalRun(
+                suite=kwargs.pop("suite", suite),
+                models={m: server.url for m in (*models, "missing:1b")},
+                concurrency=3,
+                results_path=results_path,
+                leaderboard_path=board_path,
+                **kwargs,
+            )
+            asyncio.run(r.run())
+            return r
+
+        first = run()
+        total = len(suite.cases)
+        if server.max_in_flight != 3:
+            failures.append(f"FAIL: {server.max_in_flight} requests in flight, expected 3")
+        if set(first.rows) != set(models):
+            failures.append(f"FAIL: rows for {sorted(first.rows)}")
+        board = json.loads(board_path.read_text())
+        if [r["model"] for r in board] != ["good:1b", "hosted", "poor:1b"]:
+            failures.append(f"FAIL: leaderboard order {[r['model'] for r in board]}")
+        good = first.rows.get("good:1b", {})
+        if (good.get("avg_score"), good.get("passed"), good.get("total")) != (100.0, total, total):
+            failures.append(f"FAIL: good:1b row {good}")
+        if not 0.05 <= good.get("latency", {}).get("p50", 0) <= good.get("latency", {}).get("p99", 0):
+            failures.append(f"FAIL: good:1b latency {good.get('latency')}")
+
+        # Test 4: resume — only unrecorded answers are asked again
+        lines = results_path.read_text().splitlines()
+        answered = [line for line in lines if json.loads(line)["error"] is None]
+        results_path.write_text("\n".join(answered[:5]) + "\n")
+        before = server.requests
+        second = run()
+        asked = server.requests - before
+        if asked != 2 * total - 5:
+            failures.append(f"FAIL: resume asked {asked} prompts, expected {2 * total - 5}")
+
+        def scores(r: EvalRun) -> dict:
+            return {m: (row["avg_score"], row["passed"]) for m, row in r.rows.items()}
+        if scores(second) != scores(first):
+            failures.append(f"FAIL: resumed run scored {scores(second)}, first run {scores(first)}")
+        if len(read_results(results_path)) != 2 * total:
+            failures.append(f"FAIL: results log holds {len(read_results(results_path))} answers")
+
+        # A changed suite option re-asks everything; --fresh ignores the log
+        before = server.requests
+        run(suite=replace(suite, options={"temperature": 0.5}))
+        run(fresh=True, dry_run=True)
+        if server.requests - before != 4 * total:
+            failures.append(f"FAIL: re-ask after a suite change made {server.requests - before} requests")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+test_near_duplicates.py — Offline tests for near_duplicates.py: similarity
+estimates, LSH candidates, incremental add/remove and persistence.
+
+Run with: python scripts/test_near_duplicates.py
+"""
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from near_duplicates import MinHashIndex, shingles, signature, similarity
+from utils import JsonTransaction
+
+
+def main() -> None:
+    failures: list[str] = []
+    rng = random.Random(7)
+    vocab = [f"w{i}" for i in range(3000)]
+
+    def article(slug: str) -> dict:
+        return {"slug": slug, "title": slug, "excerpt": "",
+                "content": [" ".join(rng.choices(vocab, k=80)) for _ in range(6)]}
+
+    def rewrite(a: dict, slug: str, rate: float) -> dict:
+        return {**a, "slug": slug, "content": [
+            " ".join(rng.choice(vocab) if rng.random() < rate else w for w in p.split()) for p in a["content"]
+        ]}
+
+    corpus = [article(f"a{i}") for i in range(200)]
+    original = corpus[0]
+    light, heavy = rewrite(original, "light", 0.03), rewrite(original, "heavy", 0.4)
+
+    # Test 1: the estimate tracks the true shingle Jaccard
+    for other in (light, heavy, corpus[1]):
+        a, b = shingles(original), shingles(other)
+        exact = len(a & b) / len(a | b)
+        estimate = similarity(signature(original), signature(other))
+        if abs(exact - estimate) > 0.12:
+            failures.append(f"FAIL: {other['slug']} estimate {estimate:.3f} vs Jaccard {exact:.3f}")
+
+    # Test 2: LSH finds the light rewrite only; unrelated articles are not candidates
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "minhash_index.json"
+        index = MinHashIndex(path)
+        index.add_articles(corpus)
+        found = [m.slug for m in index.matches(signature(light))]
+        if found != ["a0"]:
+            failures.append(f"FAIL: light rewrite matched {found}")
+        if index.matches(signature(heavy)):
+            failures.append(f"FAIL: heavy rewrite matched {index.matches(signature(heavy))}")
+        if len(index.candidates(signature(corpus[5]))) != 1:
+            failures.append(f"FAIL: unrelated candidates {index.candidates(signature(corpus[5]))}")
+        if index.pairs():
+            failures.append(f"FAIL: distinct corpus has near-duplicate pairs {index.pairs()[:3]}")
+
+        # Test 3: remove undoes add; re-adding a slug replaces it
+        index.add("light", signature(light))
+        if index.pairs() != [("a0", "light", similarity(signature(original), signature(light)))]:
+            failures.append(f"FAIL: pairs after add {index.pairs()}")
+        index.remove("light")
+        index.add("a1", signature(corpus[2]))
+        if index.pairs() != [("a1", "a2", 1.0)] or len(index) != len(corpus):
+            failures.append(f"FAIL: pairs after remove/replace {index.pairs()}")
+
+        # Test 4: persistence — buckets rebuilt from stored signatures
+        txn = JsonTransaction()
+        index.write(txn)
+        txn.commit()
+        loaded = MinHashIndex(path)
+        if loaded.buckets != index.buckets:
+            failures.append("FAIL: reloaded buckets differ")
+        stored = json.loads(path.read_text())
+        stored["params"]["bands"] = 8
+        path.write_text(json.dumps(stored))
+        try:
+            MinHashIndex(path).data
+            failures.append("FAIL: index with other params loaded")
+        except ValueError:
+            pass
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+test_recommend.py — Offline tests for the scoreAndRank ports: recommend_index.py
+(scalar, with reasons) and recommend_batch.py (NumPy) against the fixture jest
+checks data/recommend.ts with.
+
+Run with: python scripts/test_recommend.py
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from recommend_batch import (
+    Catalog, QueryBatch, score_batch, check_fixture, agreement, simplex, js_round2,
+)
+from recommend_index import score_and_rank, _js_round2
+from utils import read_json
+
+
+def main() -> None:
+    failures: list[str] = []
+    fixture = read_json(config.recommend_fixture_path)
+
+    # Test 1: the scalar port reproduces every case, reasons included
+    for suite in fixture["suites"]:
+        for i, case in enumerate(suite["cases"]):
+            opts = case["opts"]
+            recs, excluded, matched = score_and_rank(
+                suite["models"], suite["categories"],
+                opts["task"], opts["maxCost"], opts["minContext"], opts["provider"],
+            )
+            got = (matched["name"] if matched else None, excluded,
+                   [[r.model["id"], r.score, r.reasons] for r in recs])
+            if got != (case["matchedCategory"], case["excluded"], case["ranking"]):
+                failures.append(f"FAIL: score_and_rank {suite['name']} case {i}: {got!r}")
+    for x, expected in fixture["rounding"]:
+        if _js_round2(x) != expected:
+            failures.append(f"FAIL: _js_round2({x!r}) = {_js_round2(x)!r}, expected {expected!r}")
+
+    # Test 2: the batch scorer reproduces every case (scores and order)
+    failures += [f"FAIL: batch {f}" for f in check_fixture()]
+
+    # Test 3: batch == scalar over the full query grid of the live data
+    models, categories = read_json(config.models_path), read_json(config.categories_path)
+    catalog = Catalog.from_data(models, categories)
+    batch = QueryBatch.grid(catalog)
+    result = score_batch(catalog, batch)
+    for q in range(len(batch)):
+        task = batch.task[q]
+        recs, excluded, _ = score_and_rank(
+            models, categories,
+            max_cost=None if np.isnan(batch.max_cost[q]) else float(batch.max_cost[q]),
+            min_context=None if np.isnan(batch.min_context[q]) else float(batch.min_context[q]),
+            provider=batch.filters[batch.provider[q]] if batch.provider[q] >= 0 else None,
+            matched=categories[task] if task >= 0 else None,
+        )
+        if [[r.model["id"], r.score] for r in recs] != result.ranking(q, catalog):
+            failures.append(f"FAIL: grid query {q} differs from score_and_rank")
+            break
+        if excluded != result.excluded[q]:
+            failures.append(f"FAIL: grid query {q} excluded {result.excluded[q]}, expected {excluded}")
+            break
+
+    # Test 4: metrics — identical runs agree fully, and the simplex grid is complete
+    if agreement(result, result) != {"top1": 1.0, "top3": 1.0}:
+        failures.append(f"FAIL: agreement with itself is {agreement(result, result)}")
+    grid = simplex(0.25, 3)
+    if len(grid) != 15 or any(abs(sum(w) - 1) > 1e-12 for w in grid):
+        failures.append(f"FAIL: simplex(0.25, 3) returned {len(grid)} vectors")
+    if js_round2(np.array([0.004999999999999999])).item() != 0.0:
+        failures.append("FAIL: js_round2 rounded up below the .5 boundary")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
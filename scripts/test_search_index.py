@@ -0,0 +1,96 @@
+"""
+test_search_index.py — Offline tests for search_index.py: incremental updates
+match a rebuild, removal, prefix lookup, and search semantics.
+
+Run with: python scripts/test_search_index.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from search_index import SearchIndex, tokenize
+from utils import JsonTransaction
+
+
+def article(slug: str, title: str, body: str, date: str = "2026-05-01") -> dict:
+    return {"slug": slug, "title": title, "excerpt": "", "date": date,
+            "category": "Analysis", "content": [body]}
+
+
+def main() -> None:
+    failures: list[str] = []
+    corpus = [
+        article("claude", "Claude Opus review", "Anthropic's Claude handles long agentic tasks.", "2026-05-03"),
+        article("gemini", "Gemini pricing", "Google cut Gemini prices for long context.", "2026-05-02"),
+        article("open", "Open weight models", "Qwen and DeepSeek close the gap on Claude.", "2026-05-01"),
+        article("cafe", "Café AI", "Naïve benchmarks mislead buyers.", "2026-04-20"),
+    ]
+
+    # Test 1: tokenizer — case, accents, stopwords, single letters
+    if tokenize("The Café-Naïve GPT-4 a b") != ["cafe", "naive", "gpt", "4"]:
+        failures.append(f"FAIL: tokenize gave {tokenize('The Café-Naïve GPT-4 a b')}")
+
+    # Test 2: adding one at a time equals a rebuild; removal undoes an add
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "search_index.json"
+        built = SearchIndex(path)
+        built.rebuild(corpus)
+        inc = SearchIndex(path)
+        for a in corpus:
+            inc.add([a])
+        if inc.postings() != built.postings():
+            failures.append("FAIL: incremental index differs from rebuild")
+
+        extra = article("extra", "Mistral notes", "Mistral ships a new Claude rival.")
+        inc.add([extra])
+        inc.remove(extra)
+        if inc.postings() != built.postings() or "extra" in inc:
+            failures.append("FAIL: remove did not undo add")
+        inc.add([article("reuse", "Reused slot", "Slot reuse after removal.")])
+        if inc.data["docs"].count(None) != 0 or len(inc.data["docs"]) != len(corpus) + 1:
+            failures.append(f"FAIL: freed doc slot not reused: {inc.data['docs']}")
+
+        # Re-adding an indexed slug replaces its postings
+        inc.add([article("reuse", "Replaced", "Entirely different words.")])
+        if "slot" in inc.data["terms"] or "entirely" not in inc.data["terms"]:
+            failures.append("FAIL: re-adding a slug kept stale postings")
+
+        # Round trip through a transaction
+        txn = JsonTransaction()
+        built.write(txn)
+        txn.commit()
+        if SearchIndex(path).postings() != built.postings() or built.dirty_paths:
+            failures.append("FAIL: written index does not read back")
+
+    # Test 3: search — every token must match, last token as a prefix
+    index = SearchIndex(Path("/nonexistent"))
+    index.rebuild(corpus)
+    checks = {
+        "claude": ["claude", "open"],       # title weight ranks the review first
+        "clau": ["claude", "open"],
+        "long clau": ["claude"],
+        "gemini long": ["gemini"],
+        "cafe": ["cafe"],
+        "CAFÉ": ["cafe"],
+        "the of": [],
+        "claude zzz": [],
+    }
+    for query, expected in checks.items():
+        got = [h.slug for h in index.search(query)]
+        if got != expected:
+            failures.append(f"FAIL: search({query!r}) = {got}, expected {expected}")
+    if [h.slug for h in index.search("clau", prefix=False)]:
+        failures.append("FAIL: exact search matched a prefix")
+    if index.terms_with_prefix("ge") != ["gemini"]:
+        failures.append(f"FAIL: terms_with_prefix('ge') = {index.terms_with_prefix('ge')}")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
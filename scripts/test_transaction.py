@@ -0,0 +1,120 @@
+"""
+test_transaction.py — Offline tests for the atomic write helpers in utils.py:
+JsonTransaction, json_transaction and file_lock.
+
+Run with: python scripts/test_transaction.py
+"""
+import json
+import multiprocessing
+import os
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import utils
+from utils import JsonTransaction, file_lock, json_transaction, read_json, write_json
+
+
+def _hold_lock(lock_path: str, trace_path: str, name: str) -> None:
+    """Child process: record entering and leaving the locked section."""
+    with file_lock(Path(lock_path)):
+        with open(trace_path, "a", encoding="utf-8") as f:
+            f.write(f"enter {name}\n")
+        time.sleep(0.3)
+        with open(trace_path, "a", encoding="utf-8") as f:
+            f.write(f"exit {name}\n")
+
+
+def _leftovers(directory: Path) -> list[str]:
+    return sorted(p.name for p in directory.rglob("*.tmp"))
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        lock = root / "data.lock"
+        a, b = root / "a.json", root / "b.json"
+        write_json(a, {"v": 1})
+        write_json(b, {"v": 1})
+
+        # Test 1: the body raises → every write is discarded, the lock is released
+        try:
+            with json_transaction(lock) as txn:
+                txn.write(a, {"v": 2})
+                if txn.read(a) != {"v": 2}:
+                    failures.append("FAIL: read() did not see the pending write")
+                txn.write(b, {"v": 2})
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        if read_json(a) != {"v": 1} or read_json(b) != {"v": 1}:
+            failures.append("FAIL: a raising body still wrote its files")
+        with json_transaction(lock) as txn:  # would block forever if the lock leaked
+            txn.write(a, {"v": 3})
+        if read_json(a) != {"v": 3}:
+            failures.append("FAIL: json_transaction did not commit on success")
+
+        # Test 2: staging a later file fails → no target is touched, no temp file left
+        for bad_path, bad_data in (
+            (b, {"not json": {1, 2}}),          # fails while serializing
+            (a / "nested.json", {"v": 4}),      # fails creating the temp file (parent is a file)
+        ):
+            txn = JsonTransaction()
+            txn.write(a, {"v": 4})
+            txn.write(bad_path, bad_data)
+            try:
+                txn.commit()
+                failures.append(f"FAIL: commit with an unwritable {bad_path.name} succeeded")
+            except (TypeError, OSError):
+                pass
+            if read_json(a) != {"v": 3} or read_json(b) != {"v": 1}:
+                failures.append(f"FAIL: failed staging of {bad_path.name} touched a target")
+            if _leftovers(root):
+                failures.append(f"FAIL: failed commit left temp files {_leftovers(root)}")
+
+        # Test 3: file_lock serializes two processes
+        trace = root / "trace.txt"
+        procs = [
+            multiprocessing.Process(target=_hold_lock, args=(str(lock), str(trace), name))
+            for name in ("p1", "p2")
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(10)
+        events = trace.read_text(encoding="utf-8").split()
+        pairs = [" ".join(events[i:i + 2]) for i in range(0, len(events), 2)]
+        if len(pairs) != 4 or not all(
+            pairs[i].startswith("enter") and pairs[i + 1] == pairs[i].replace("enter", "exit")
+            for i in (0, 2)
+        ):
+            failures.append(f"FAIL: locked sections interleaved: {pairs}")
+
+        # Test 4: commit keeps the target's mode; a new file gets 0666 minus the umask
+        os.chmod(a, 0o640)
+        with json_transaction(lock) as txn:
+            txn.write(a, {"v": 5})
+            txn.write(root / "new.json", {"v": 5})
+            txn.append_lines(root / "log.jsonl", [json.dumps([1]) + "\n"])
+        mode = stat.S_IMODE(a.stat().st_mode)
+        if mode != 0o640:
+            failures.append(f"FAIL: commit changed the mode to {oct(mode)}")
+        for new in ("new.json", "log.jsonl"):
+            mode = stat.S_IMODE((root / new).stat().st_mode)
+            if mode != 0o666 & ~utils._UMASK:
+                failures.append(f"FAIL: new file {new} created {oct(mode)}")
+
+    if failures:
+        for f in failures:
+            print(f)
+        sys.exit(1)
+    print("All tests passed.")
+
+
+if __name__ == "__main__":
+    main()
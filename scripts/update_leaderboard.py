@@ -2,11 +2,20 @@
 """
 update_leaderboard.py — Fetch latest Elo ratings and update models/categories.
 
+Every model catalog (models.json and open_weight_models.json) is refreshed
+from the same fetched arena snapshot, each with its own arena name map.
+
 Usage:
   python scripts/update_leaderboard.py                    # Auto-fetch from Arena
   python scripts/update_leaderboard.py --dry-run          # Preview without writing
+  python scripts/update_leaderboard.py --dry-run --cache-only  # Offline preview from cached arena data
   python scripts/update_leaderboard.py --set gemini=1510  # Manual Elo override
   python scripts/update_leaderboard.py --add-model        # Interactive: add new model
+  python scripts/update_leaderboard.py --force            # Run even if nothing changed
+
+Each run records a fingerprint (upstream snapshot + payload hash, input file
+hashes, overrides). If the next run's fingerprint matches, it exits with
+EXIT_UNCHANGED before touching any file.
 """
 
 import argparse
@@ -15,8 +24,21 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 from config import config
-from utils import setup_logger, read_json, write_json, today_iso, report_changes
+from utils import (
+    setup_logger,
+    read_json,
+    write_json,
+    today_iso,
+    file_sha256,
+    EXIT_UNCHANGED,
+)
+from datastore import open_store, Collection, DataStore
+from category_leaders import pick_leaders
+from elo_log import EloChange
+import recommend_index
 import arena
+import arena_analytics
+import http_client
 
 log = setup_logger("leaderboard")
 
@@ -27,9 +49,11 @@ def update_models(
     models: list[dict],
     scores: dict[str, float],
     manual_overrides: dict[str, float],
+    changes: list[tuple[str, str, int, int]] | None = None,
 ) -> tuple[list[dict], bool]:
     """
     Update model Elo scores. Manual overrides take priority over fetched scores.
+    Each change is appended to `changes` as (model ID, source, old, new).
     Returns (updated_models, has_changes).
     """
     has_changes = False
@@ -39,9 +63,9 @@ def update_models(
         old_elo = model["elo"]
 
         if mid in manual_overrides:
-            new_elo = int(manual_overrides[mid])
+            new_elo, source = int(manual_overrides[mid]), "override"
         elif mid in scores:
-            new_elo = int(scores[mid])
+            new_elo, source = int(scores[mid]), "arena"
         else:
             log.info(f"  No score for '{mid}', keeping Elo={old_elo}")
             continue
@@ -50,61 +74,89 @@ def update_models(
             log.info(f"  {mid}: {old_elo} → {new_elo}")
             model["elo"] = new_elo
             has_changes = True
+            if changes is not None:
+                changes.append((mid, source, old_elo, new_elo))
 
     models.sort(key=lambda m: m["elo"], reverse=True)
     return models, has_changes
 
 
 def update_category_leaders(
-    categories: list[dict], models: list[dict]
+    categories: list[dict],
+    models: list[dict],
+    boards: dict[str, dict[str, float]] | None = None,
 ) -> tuple[list[dict], bool]:
-    """Update category leaders based on current model rankings."""
+    """
+    Update category leaders from model strengths and arena board scores
+    (see category_leaders.py for the ranking rules).
+    """
     has_changes = False
-    if not models:
-        return categories, has_changes
-
-    leader_map = {
-        "Overall": models[0]["name"],
-        "Coding": next(
-            (m["name"] for m in models if "claude" in m["id"].lower()),
-            models[0]["name"],
-        ),
-        "Reasoning": next(
-            (m["name"] for m in models if "gemini" in m["id"].lower()),
-            models[0]["name"],
-        ),
-        "Honest": next(
-            (m["name"] for m in models if "grok" in m["id"].lower()),
-            models[0]["name"],
-        ),
-    }
+    picks = pick_leaders(categories, models, boards)
 
     for cat in categories:
-        for keyword, leader in leader_map.items():
-            if keyword.lower() in cat["name"].lower():
-                if cat["leader"] != leader:
-                    log.info(f"  Category '{cat['name']}': {cat['leader']} → {leader}")
-                    cat["leader"] = leader
-                    has_changes = True
-                break
+        pick = picks.get(cat["name"])
+        if pick is None:
+            continue
+        if cat["leader"] != pick.name:
+            log.info(f"  Category '{cat['name']}': {cat['leader']} → {pick.name} — {pick.reason}")
+            cat["leader"] = pick.name
+            has_changes = True
+        else:
+            log.info(f"  Category '{cat['name']}': {pick.name} (unchanged) — {pick.reason}")
 
     return categories, has_changes
 
 
-def update_site_timestamp(dry_run: bool = False) -> None:
-    """Update the lastUpdated field in site.json."""
-    site = read_json(config.site_path)
+def update_site_timestamp(store: DataStore) -> None:
+    """Update the lastUpdated field in site.json (written on the next commit)."""
     today = today_iso()
-    if site.get("lastUpdated") != today:
-        site["lastUpdated"] = today
-        if not dry_run:
-            write_json(config.site_path, site)
+    if store.site.get("lastUpdated") != today:
+        store.site["lastUpdated"] = today
         log.info(f"  site.json lastUpdated → {today}")
 
 
+def analytics_files() -> dict[Path, dict]:
+    """data/arena_analytics.json rebuilt from the arena parse the fetch just cached, if it changed."""
+    overall = arena.fetch_raw_boards(cache_only=True).get(arena.OVERALL_BOARD)
+    if not overall:
+        return {}
+    payload = arena_analytics.payload_if_changed(arena_analytics.analyze_board(overall))
+    return {config.arena_analytics_path: payload} if payload else {}
+
+
+# ─── RUN FINGERPRINT ────────────────────────────────────────────────────────
+
+def run_fingerprint(upstream: dict | None, manual_overrides: dict[str, float]) -> dict:
+    """Everything a run's output depends on: upstream payload, input files, overrides."""
+    inputs = (
+        config.models_path,
+        config.open_weight_models_path,
+        config.categories_path,
+        config.site_path,
+    )
+    return {
+        # The payload, not its validators: a new ETag on the same bytes is no change
+        "upstream": upstream and {k: upstream.get(k) for k in ("source", "snapshot", "sha256")},
+        "inputs": {p.name: file_sha256(p) for p in inputs},
+        "overrides": manual_overrides,
+    }
+
+
+def is_unchanged(fingerprint: dict) -> bool:
+    """True if fingerprint matches the one recorded by the last completed run."""
+    if not config.leaderboard_fingerprint_path.exists():
+        return False
+    return read_json(config.leaderboard_fingerprint_path) == fingerprint
+
+
+def record_fingerprint(upstream: dict | None, manual_overrides: dict[str, float]) -> None:
+    """Store the post-run fingerprint (input hashes taken after our own writes)."""
+    write_json(config.leaderboard_fingerprint_path, run_fingerprint(upstream, manual_overrides))
+
+
 # ─── ADD MODEL ──────────────────────────────────────────────────────────────
 
-def add_model_interactive(models: list[dict]) -> list[dict]:
+def add_model_interactive(models: Collection) -> None:
     """Interactively add a new model."""
     print("\n── Add New Model ──")
     model = {
@@ -118,20 +170,133 @@ def add_model_interactive(models: list[dict]) -> list[dict]:
         "elo": int(input("  Elo rating: ").strip()),
     }
 
-    existing_ids = {m["id"] for m in models}
-    if model["id"] in existing_ids:
+    if model["id"] in models:
         log.error(f"Model ID '{model['id']}' already exists!")
-        return models
+        return
 
     # Register arena names so future fetches can match this model
     arena_name = input("  Arena name (e.g. 'llama-4-scout', or blank): ").strip()
     if arena_name:
         arena.add_model_names(model["id"], [arena_name])
 
-    models.append(model)
+    models.add(model)
     models.sort(key=lambda m: m["elo"], reverse=True)
     log.info(f"  Added '{model['name']}' with Elo={model['elo']}")
-    return models
+
+
+# ─── RUN ────────────────────────────────────────────────────────────────────
+
+def derived_files(store: DataStore) -> dict[Path, dict]:
+    """Files built from the data files that changed and must be rewritten with them."""
+    index = recommend_index.index_if_changed(store.models.items, store.categories.items)
+    return {config.recommend_index_path: index} if index else {}
+
+
+def run_update(args: argparse.Namespace, store: DataStore) -> None:
+    """Load, refresh and (unless dry-run) commit the leaderboard files in store."""
+    # Load current data
+    catalogs = store.catalogs
+    models = store.models.items
+    categories = store.categories.items
+
+    # Parse manual overrides
+    manual_overrides: dict[str, float] = {}
+    if args.set:
+        for item in args.set:
+            if "=" not in item:
+                log.error(f"Invalid format: '{item}' (expected ID=ELO)")
+                sys.exit(1)
+            mid, elo = item.split("=", 1)
+            manual_overrides[mid.strip()] = float(elo.strip())
+        log.info(f"Manual overrides: {manual_overrides}")
+
+    # Add model interactively
+    models_before = {m["id"] for m in models}
+    if args.add_model:
+        add_model_interactive(store.models)
+
+    # Fetch scores — the arena module handles all scraping complexity.
+    # One fetch yields every board for every catalog: overall drives Elo,
+    # the rest category leaders. A payload matching the cached one (304,
+    # same validators or same SHA-256) is not parsed again, so an unchanged
+    # upstream costs a download at most before the short-circuit below.
+    catalog_boards: dict[str, dict[str, dict[str, float]]] = {}
+    upstream: dict | None = None
+    if not args.skip_fetch:
+        catalog_boards = arena.fetch_catalogs(
+            {name: [m["id"] for m in c] for name, c in catalogs.items()},
+            cache_only=args.cache_only,
+        )
+        http_client.log_metrics(log)
+        upstream = arena.snapshot_fingerprint()
+
+    # Short-circuit: same snapshot, same data files, same overrides as last run
+    if (
+        not args.force
+        and not args.add_model
+        and (upstream is not None or args.skip_fetch)
+        and is_unchanged(run_fingerprint(upstream, manual_overrides))
+    ):
+        snapshot = (upstream or {}).get("snapshot") or "n/a"
+        log.info(f"Unchanged since last run (snapshot {snapshot}) — nothing to do.")
+        sys.exit(EXIT_UNCHANGED)
+
+    analytics = analytics_files() if upstream is not None else {}
+
+    # Update every catalog's Elos (overrides apply wherever the ID exists)
+    today = today_iso()
+    elo_changes: list[EloChange] = []
+    if args.add_model and len(store.models) > len(models_before):
+        added = next(m for m in store.models if m["id"] not in models_before)
+        elo_changes.append(EloChange(today, "models", added["id"], "manual", None, added["elo"]))
+    models_changed = False
+    for name, collection in catalogs.items():
+        scores = catalog_boards.get(name, {}).get(arena.OVERALL_BOARD, {})
+        changed_ids: list[tuple[str, str, int, int]] = []
+        _, changed = update_models(collection.items, scores, manual_overrides, changed_ids)
+        elo_changes += [EloChange(today, name, *c) for c in changed_ids]
+        models_changed |= changed
+
+    # Update categories (hosted catalog only)
+    boards = catalog_boards.get("models", {})
+    categories, cats_changed = update_category_leaders(categories, models, boards)
+
+    # Report, per catalog and for the category leaders
+    for name, collection in {**catalogs, "categories": store.categories}.items():
+        changes = collection.changes()
+        if changes:
+            log.info(f"Changes in {name}.json:")
+            for line in changes.lines:
+                log.info(line)
+        else:
+            log.info(f"{name}.json unchanged")
+
+    if not models_changed and not cats_changed and not args.add_model:
+        log.info("No changes detected.")
+        if args.dry_run:
+            for path in analytics:
+                log.info(f"[DRY RUN] Would write {path}")
+        else:
+            for path in store.commit(analytics):
+                log.info(f"✅ Wrote {path}")
+            record_fingerprint(upstream, manual_overrides)
+        return
+
+    # Write
+    if args.dry_run:
+        log.info("[DRY RUN] Would write changes to:")
+        update_site_timestamp(store)
+        for path in [*store.dirty_paths(), *analytics]:
+            log.info(f"  - {path}")
+    else:
+        update_site_timestamp(store)
+        for path in store.commit({**derived_files(store), **analytics}, elo_changes):
+            log.info(f"✅ Wrote {path}")
+        if elo_changes:
+            log.info(f"✅ Logged {len(elo_changes)} Elo change(s) to {config.elo_log_path}")
+
+        record_fingerprint(upstream, manual_overrides)
+        log.info("✅ Done! Run `npx jest` to validate.")
 
 
 # ─── CLI ────────────────────────────────────────────────────────────────────
@@ -156,73 +321,30 @@ def parse_args() -> argparse.Namespace:
         "--skip-fetch", action="store_true",
         help="Skip fetching from LMArena",
     )
+    parser.add_argument(
+        "--cache-only", action="store_true",
+        help="Use the cached LMArena parse (data/cache/arena.json), no network",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Run even if the snapshot and data files match the last run",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
     setup_logger("arena")
+    setup_logger("http")
 
     log.info("=" * 50)
     log.info("HelloAi Leaderboard Updater")
     log.info("=" * 50)
 
-    # Load current data
-    models = read_json(config.models_path)
-    categories = read_json(config.categories_path)
-    old_models = [m.copy() for m in models]
-
-    # Parse manual overrides
-    manual_overrides: dict[str, float] = {}
-    if args.set:
-        for item in args.set:
-            if "=" not in item:
-                log.error(f"Invalid format: '{item}' (expected ID=ELO)")
-                sys.exit(1)
-            mid, elo = item.split("=", 1)
-            manual_overrides[mid.strip()] = float(elo.strip())
-        log.info(f"Manual overrides: {manual_overrides}")
-
-    # Add model interactively
-    if args.add_model:
-        models = add_model_interactive(models)
-
-    # Fetch scores — the arena module handles all scraping complexity
-    scores: dict[str, float] = {}
-    if not args.skip_fetch:
-        model_ids = [m["id"] for m in models]
-        scores = arena.fetch_scores(our_model_ids=model_ids)
-
-    # Update models
-    models, models_changed = update_models(models, scores, manual_overrides)
-
-    # Update categories
-    categories, cats_changed = update_category_leaders(categories, models)
-
-    # Report
-    changes = report_changes(old_models, models, "models.json")
-    for line in changes:
-        log.info(line)
-
-    if not models_changed and not cats_changed and not args.add_model:
-        log.info("No changes detected.")
-        return
-
-    # Write
-    if args.dry_run:
-        log.info("[DRY RUN] Would write changes to:")
-        log.info(f"  - {config.models_path}")
-        log.info(f"  - {config.categories_path}")
-        log.info(f"  - {config.site_path}")
-    else:
-        write_json(config.models_path, models)
-        log.info(f"✅ Wrote {config.models_path}")
-
-        write_json(config.categories_path, categories)
-        log.info(f"✅ Wrote {config.categories_path}")
-
-        update_site_timestamp()
-        log.info("✅ Done! Run `npx jest` to validate.")
+    # Everything from load to write runs under the data/ lock, so an
+    # overlapping run waits and then starts from this run's output.
+    with open_store() as store:
+        run_update(args, store)
 
 
 if __name__ == "__main__":
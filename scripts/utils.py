@@ -2,12 +2,22 @@
 Shared utilities for HelloAi automation scripts.
 """
 
+import hashlib
 import json
 import logging
+import os
 import sys
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # ─── LOGGING ────────────────────────────────────────────────────────────────
 
@@ -35,11 +45,204 @@ def read_json(path: Path) -> Any:
         return json.load(f)
 
 
-def write_json(path: Path, data: Any, indent: int = 2) -> None:
-    """Write data to a JSON file with consistent formatting."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
-        f.write("\n")  # trailing newline for git
+def _dump_json(data: Any, indent: int | None = 2) -> bytes:
+    text = json.dumps(data, indent=indent, ensure_ascii=False)
+    return (text + "\n").encode("utf-8")  # trailing newline for git
+
+
+def _read_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# os.umask() can only be read by setting it, which is process-wide: doing
+# that per write would let another thread create a file with umask 0 in the
+# gap. Read it once, at import.
+_UMASK = _read_umask()
+
+
+def _file_mode(path: Path) -> int:
+    """Mode for a replacement of path: keep the existing one, else 0666 minus umask."""
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _stage(path: Path, payload: bytes) -> Path:
+    """Write payload to a fsynced temp file beside path (same filesystem → atomic rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.chmod(tmp, _file_mode(path))  # mkstemp creates 0600
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return Path(tmp)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist renames in directory (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_json(path: Path, data: Any, indent: int | None = 2) -> None:
+    """
+    Write data to a JSON file with consistent formatting.
+    Atomic: readers see the old file or the new one, never a truncated one.
+    """
+    tmp = _stage(path, _dump_json(data, indent))
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
+
+
+# ─── WRITE TRANSACTIONS ─────────────────────────────────────────────────────
+
+DATA_LOCK_PATH = Path(__file__).parent.parent / "data" / "cache" / "data.lock"
+
+
+@contextmanager
+def file_lock(path: Path = DATA_LOCK_PATH) -> Iterator[None]:
+    """
+    Exclusive advisory lock on path, blocking until it is free, so
+    overlapping runs (cron + manual) queue instead of interleaving.
+    Not re-entrant: don't nest two locks on the same path in one process.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class JsonTransaction:
+    """
+    A set of JSON file writes applied together by commit().
+
+    write() only records the new content; read() sees it. append_lines()
+    records lines to add to a JSON Lines file. commit() stages every file as
+    a fsynced temp file first and renames them into place only once all of
+    them are on disk, so a failure while staging leaves data/ as it was.
+
+    Each file is replaced atomically (no reader sees a torn file), but the
+    set is published file by file: between two renames a reader can see some
+    new files next to old ones. Anything that reads several files as one set
+    (the Next build, docker build, jest, git add) holds file_lock() — the lock
+    json_transaction writers hold — while it reads.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Path, tuple[Any, int | None]] = {}
+        self._appends: dict[Path, list[str]] = {}
+
+    def read(self, path: Path) -> Any:
+        """Read path, or the content already written to it in this transaction."""
+        if path in self._pending:
+            return self._pending[path][0]
+        return read_json(path)
+
+    def write(self, path: Path, data: Any, indent: int | None = 2) -> None:
+        """Schedule path to be replaced with data on commit."""
+        self._pending[path] = (data, indent)
+
+    def append_lines(self, path: Path, lines: list[str]) -> None:
+        """Schedule lines (each ending in a newline) to be appended to path on commit."""
+        self._appends.setdefault(path, []).extend(lines)
+
+    @property
+    def paths(self) -> list[Path]:
+        """Files written so far and not yet committed."""
+        return list(self._pending) + [p for p in self._appends if p not in self._pending]
+
+    def commit(self) -> None:
+        """Replace every written file, each atomically, one after another. Safe to call more than once."""
+        staged: list[tuple[Path, Path]] = []
+        try:
+            for path, (data, indent) in self._pending.items():
+                staged.append((_stage(path, _dump_json(data, indent)), path))
+            for path, lines in self._appends.items():
+                # Appends replace the file too, so they land with everything else or not at all
+                old = path.read_bytes() if path.exists() else b""
+                staged.append((_stage(path, old + "".join(lines).encode("utf-8")), path))
+        except BaseException:
+            for tmp, _ in staged:
+                tmp.unlink(missing_ok=True)
+            raise
+        for tmp, path in staged:
+            os.replace(tmp, path)
+        for directory in {path.parent for _, path in staged}:
+            _fsync_dir(directory)
+        self._pending.clear()
+        self._appends.clear()
+
+    def rollback(self) -> None:
+        """Drop every uncommitted write."""
+        self._pending.clear()
+        self._appends.clear()
+
+
+@contextmanager
+def json_transaction(lock_path: Path = DATA_LOCK_PATH) -> Iterator[JsonTransaction]:
+    """
+    Hold the data/ write lock for the block and commit its writes on success:
+
+        with json_transaction() as txn:
+            models = txn.read(config.models_path)
+            ...
+            txn.write(config.models_path, models)
+            txn.write(config.site_path, site)
+
+    Do the reads inside the block too, so a queued run sees the previous
+    run's output. Raising (including sys.exit) discards the writes. Readers
+    that need a consistent set of files take file_lock() (see JsonTransaction).
+    """
+    with file_lock(lock_path):
+        txn = JsonTransaction()
+        try:
+            yield txn
+        except BaseException:
+            txn.rollback()
+            raise
+        txn.commit()
+
+
+def file_sha256(path: Path) -> str | None:
+    """Hex SHA-256 of a file's bytes, or None if it doesn't exist."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+# ─── EXIT CODES ─────────────────────────────────────────────────────────────
+
+# A script found nothing to do since its last run (not an error).
+# weekly_update.py uses it to skip the test/commit/deploy steps.
+EXIT_UNCHANGED = 3
 
 
 # ─── DATE HELPERS ───────────────────────────────────────────────────────────
@@ -70,37 +273,14 @@ def slugify(text: str) -> str:
 # ─── DIFF REPORTER ──────────────────────────────────────────────────────────
 
 def report_changes(old_data: Any, new_data: Any, context: str = "") -> list[str]:
-    """Compare two data structures and return human-readable change descriptions."""
-    changes = []
-
-    if isinstance(old_data, list) and isinstance(new_data, list):
-        # Compare lists of dicts by 'id' or 'slug' key
-        key_field = None
-        for k in ("id", "slug"):
-            if old_data and isinstance(old_data[0], dict) and k in old_data[0]:
-                key_field = k
-                break
-
-        if key_field:
-            old_map = {item[key_field]: item for item in old_data}
-            new_map = {item[key_field]: item for item in new_data}
-
-            for k in new_map:
-                if k not in old_map:
-                    changes.append(f"  + Added: {k}")
-                elif old_map[k] != new_map[k]:
-                    # Find what changed
-                    for field in new_map[k]:
-                        if old_map[k].get(field) != new_map[k].get(field):
-                            changes.append(
-                                f"  ~ {k}.{field}: "
-                                f"{old_map[k].get(field)} → {new_map[k].get(field)}"
-                            )
-
-            for k in old_map:
-                if k not in new_map:
-                    changes.append(f"  - Removed: {k}")
+    """
+    Compare two data structures and return human-readable change descriptions.
+    Nested dicts and lists are compared structurally (see json_diff.diff for
+    the JSON Patch behind these lines).
+    """
+    from json_diff import diff
 
+    changes = diff(old_data, new_data).lines
     if changes:
         changes.insert(0, f"Changes in {context}:")
 
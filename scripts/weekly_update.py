@@ -4,6 +4,8 @@ weekly_update.py — Deterministic HelloAi maintenance pipeline.
 
 This script covers the deterministic part of the weekly update:
 leaderboard refresh → data integrity tests → optional git commit → optional deploy.
+If the leaderboard update reports the upstream snapshot and data files are
+unchanged since its last run, the remaining steps are skipped.
 
 Article generation is handled separately by the Claude Code /weekly-update skill
 (article-idea-generator → article-writer → add_article.py). This script does NOT
@@ -21,7 +23,7 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from utils import setup_logger, today_iso
+from utils import setup_logger, today_iso, file_lock, EXIT_UNCHANGED
 
 log = setup_logger("weekly")
 
@@ -30,11 +32,24 @@ SCRIPTS_DIR = Path(__file__).parent
 
 def run_command(cmd: list[str], description: str, dry_run: bool = False) -> bool:
     """Run a command and return success status."""
+    return run_command_code(cmd, description, dry_run=dry_run) == 0
+
+
+def run_command_code(
+    cmd: list[str],
+    description: str,
+    dry_run: bool = False,
+    ok_codes: tuple[int, ...] = (0,),
+) -> int:
+    """
+    Run a command and return its exit code (0 for dry runs, 127 if not found).
+    Exit codes in ok_codes are not logged as failures.
+    """
     log.info(f"{'[DRY RUN] ' if dry_run else ''}Running: {description}")
     log.info(f"  $ {' '.join(cmd)}")
 
     if dry_run:
-        return True
+        return 0
 
     try:
         result = subprocess.run(
@@ -46,16 +61,15 @@ def run_command(cmd: list[str], description: str, dry_run: bool = False) -> bool
         if result.stdout.strip():
             for line in result.stdout.strip().split("\n"):
                 log.info(f"  {line}")
-        if result.returncode != 0:
+        if result.returncode not in ok_codes:
             log.error(f"  Command failed (exit {result.returncode})")
             if result.stderr.strip():
                 for line in result.stderr.strip().split("\n"):
                     log.error(f"  {line}")
-            return False
-        return True
+        return result.returncode
     except FileNotFoundError:
         log.error(f"  Command not found: {cmd[0]}")
-        return False
+        return 127
 
 
 def main() -> None:
@@ -84,17 +98,29 @@ def main() -> None:
     cmd = [sys.executable, str(SCRIPTS_DIR / "update_leaderboard.py")]
     if args.dry_run:
         cmd.append("--dry-run")
-    if not run_command(cmd, "Leaderboard update", dry_run=False):
+    code = run_command_code(
+        cmd, "Leaderboard update", dry_run=False, ok_codes=(0, EXIT_UNCHANGED)
+    )
+    if code == EXIT_UNCHANGED:
+        log.info("Leaderboard unchanged since last run — skipping tests, commit and deploy.")
+        log.info("\n" + "=" * 50)
+        log.info("Weekly update complete (no-op)")
+        log.info("=" * 50)
+        return
+    if code != 0:
         log.warning("Leaderboard update had issues, continuing...")
 
     # ── Step 2: Run tests ───────────────────────────────
     if not args.skip_tests:
         log.info("\nStep 2: Running data integrity tests...")
-        if not run_command(
-            ["npx", "jest", "--passWithNoTests"],
-            "Data tests",
-            dry_run=args.dry_run,
-        ):
+        # Under the data/ lock, so the tests see one update's files, not part of two
+        with file_lock():
+            passed = run_command(
+                ["npx", "jest", "--passWithNoTests"],
+                "Data tests",
+                dry_run=args.dry_run,
+            )
+        if not passed:
             log.error("Tests failed! Aborting commit.")
             success = False
     else:
@@ -111,10 +137,11 @@ def main() -> None:
             (["git", "commit", "-m", msg], "Commit"),
             (["git", "push"], "Push to remote"),
         ]
-        for cmd, desc in commands:
-            if not run_command(cmd, desc):
-                log.error(f"Git operation failed at: {desc}")
-                break
+        with file_lock():  # stage and commit one consistent set of data files
+            for cmd, desc in commands:
+                if not run_command(cmd, desc):
+                    log.error(f"Git operation failed at: {desc}")
+                    break
     elif args.auto_commit and args.dry_run:
         log.info("\nStep 3: [DRY RUN] Would commit and push")
     elif args.auto_commit and not success: